@@ -1,28 +1,73 @@
 # ruff: noqa
 import asyncio
-from typing import List
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from launchflow.config import config as lf_config
-from launchflow.node import Depends, Outputs
-from launchflow.resource import Resource
 from launchflow.version import __version__
 
-from . import aws, docker, fastapi, gcp, kubernetes, testing
-from .flows.create_flows import create
-from .flows.resource_flows import destroy
+if TYPE_CHECKING:
+    from launchflow.config import config as lf_config
+    from launchflow.node import Depends, Outputs
+    from launchflow.resource import Resource
+
+    from . import aws, docker, fastapi, gcp, kubernetes, testing
+    from .flows.create_flows import create
+    from .flows.resource_flows import destroy
+
+    project: str
+    environment: str
 
 # TODO: Add generic resource imports, like Postgres, StorageBucket, etc.
 # This should probably live directly under launchflow, i.e. launchflow/postgres.py
 
+# NOTE: Submodules and attributes are imported on first access (PEP 562) so
+# application code that only needs a single resource doesn't pay for importing
+# every provider, the CLI flows, and their dependencies on startup.
+_LAZY_SUBMODULES = {"aws", "docker", "fastapi", "gcp", "kubernetes", "testing"}
+_LAZY_ATTRIBUTES = {
+    "lf_config": ("launchflow.config", "config"),
+    "Depends": ("launchflow.node", "Depends"),
+    "Outputs": ("launchflow.node", "Outputs"),
+    "Resource": ("launchflow.resource", "Resource"),
+    "create": ("launchflow.flows.create_flows", "create"),
+    "destroy": ("launchflow.flows.resource_flows", "destroy"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attr_name = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name), attr_name)
+        globals()[name] = value
+        return value
+    if name in ("project", "environment"):
+        from launchflow.config import config
+
+        value = getattr(config, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-async def connect_all(*resources: Resource) -> List[Outputs]:
+
+def __dir__() -> List[str]:
+    return sorted(
+        set(globals())
+        | _LAZY_SUBMODULES
+        | set(_LAZY_ATTRIBUTES)
+        | {"project", "environment"}
+    )
+
+
+async def connect_all(*resources: "Resource") -> List["Outputs"]:
+    # NOTE: Concurrent lookups of the same resource (and of the environment) are
+    # coalesced by Resource.outputs_async, so duplicates here are cheap
     connect_tasks = [resource.outputs_async() for resource in resources]
     return await asyncio.gather(*connect_tasks)
 
 
 def is_deployment():
-    return lf_config.env.deployment_id is not None
-
+    from launchflow.config import config
 
-project: str = lf_config.project  # type: ignore
-environment: str = lf_config.environment  # type: ignore
+    return config.env.deployment_id is not None
@@ -1,24 +1,72 @@
 # ruff: noqa
-from . import shared
-from .acm import ACMCertificate
-from .alb import ApplicationLoadBalancer
-from .api_gateway import APIGateway, APIGatewayLambdaIntegration, APIGatewayRoute
-from .codebuild_project import CodeBuildProject
-from .ec2 import EC2MySQL, EC2Postgres, EC2Redis
-from .ecr_repository import ECRRepository
-from .ecs_cluster import ECSCluster
-from .ecs_fargate import ECSFargateService
-from .ecs_fargate_container import ECSFargateServiceContainer
-from .elastic_ip import ElasticIP
-from .elasticache import ElasticacheRedis
-from .lambda_function import LambdaFunction
-from .lambda_service import LambdaService
-from .nat_gateway import NATGateway
-from .rds import RDS
-from .rds_postgres import RDSPostgres
-from .s3 import S3Bucket
-from .secrets_manager import SecretsManagerSecret
-from .sqs import SQSQueue
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from . import shared
+    from .acm import ACMCertificate
+    from .alb import ApplicationLoadBalancer
+    from .api_gateway import APIGateway, APIGatewayLambdaIntegration, APIGatewayRoute
+    from .codebuild_project import CodeBuildProject
+    from .ec2 import EC2MySQL, EC2Postgres, EC2Redis
+    from .ecr_repository import ECRRepository
+    from .ecs_cluster import ECSCluster
+    from .ecs_fargate import ECSFargateService
+    from .ecs_fargate_container import ECSFargateServiceContainer
+    from .elastic_ip import ElasticIP
+    from .elasticache import ElasticacheRedis
+    from .lambda_function import LambdaFunction
+    from .lambda_service import LambdaService
+    from .nat_gateway import NATGateway
+    from .rds import RDS
+    from .rds_postgres import RDSPostgres
+    from .s3 import S3Bucket
+    from .secrets_manager import SecretsManagerSecret
+    from .sqs import SQSQueue
+
+# Maps each exported name to the submodule that defines it. Submodules are only
+# imported when one of their names is first accessed.
+_LAZY_ATTRIBUTES = {
+    "ACMCertificate": "acm",
+    "ApplicationLoadBalancer": "alb",
+    "APIGateway": "api_gateway",
+    "APIGatewayLambdaIntegration": "api_gateway",
+    "APIGatewayRoute": "api_gateway",
+    "CodeBuildProject": "codebuild_project",
+    "EC2MySQL": "ec2",
+    "EC2Postgres": "ec2",
+    "EC2Redis": "ec2",
+    "ECRRepository": "ecr_repository",
+    "ECSCluster": "ecs_cluster",
+    "ECSFargateService": "ecs_fargate",
+    "ECSFargateServiceContainer": "ecs_fargate_container",
+    "ElasticIP": "elastic_ip",
+    "ElasticacheRedis": "elasticache",
+    "LambdaFunction": "lambda_function",
+    "LambdaService": "lambda_service",
+    "NATGateway": "nat_gateway",
+    "RDS": "rds",
+    "RDSPostgres": "rds_postgres",
+    "S3Bucket": "s3",
+    "SecretsManagerSecret": "secrets_manager",
+    "SQSQueue": "sqs",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "shared":
+        return importlib.import_module(f"{__name__}.shared")
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_LAZY_ATTRIBUTES[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"shared"})
+
 
 __all__ = [
     "ACMCertificate",
@@ -1,10 +1,16 @@
+import asyncio
+import contextlib
+import functools
+import hashlib
 import inspect
+import io
 import os
+import re
 import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass
-from typing import IO, Any, Dict, List, Optional, Union
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Union
 
 import requests
 from typing_extensions import Callable
@@ -23,6 +29,8 @@ from launchflow.aws.lambda_function import (
     LambdaRuntime,
 )
 from launchflow.aws.service import AWSService
+from launchflow.cache.launchflow_tmp import build_cache_file_path
+from launchflow.cache.runtime_manifest import runtime_manifest_files
 from launchflow.config import config
 from launchflow.models.enums import ServiceProduct
 from launchflow.models.flow_state import AWSEnvironmentConfig
@@ -30,7 +38,7 @@ from launchflow.models.launchflow_uri import LaunchFlowURI
 from launchflow.node import Inputs
 from launchflow.resource import Resource
 from launchflow.service import ServiceOutputs
-from launchflow.workflows.utils import zip_source
+from launchflow.workflows.utils import DEFAULT_COMPRESSION_LEVEL, zip_source
 
 
 def _get_relative_handler_import_path(func: Callable) -> str:
@@ -51,50 +59,222 @@ def _get_relative_handler_import_path(func: Callable) -> str:
     return full_import_path
 
 
+# The platform dependencies are installed for, Lambda runs on x86_64 by default
+_LAMBDA_PLATFORM = "manylinux2014_x86_64"
+# The number of installed dependency trees kept in the dependency cache
+_MAX_CACHED_DEPENDENCIES = 5
+_REQUIREMENTS_INCLUDE_RE = re.compile(
+    r"^(?:-r|--requirement|-c|--constraint)[\s=]+(\S+)"
+)
+_EDITABLE_REQUIREMENT_RE = re.compile(r"^(?:-e|--editable)\b")
+# A requirement pinned to an exact version, e.g. `requests[socks]==2.32.3`
+_PINNED_REQUIREMENT_RE = re.compile(
+    r"^[A-Za-z0-9][A-Za-z0-9._-]*(?:\[[A-Za-z0-9._,\s-]*\])?\s*===?\s*"
+    r"[A-Za-z0-9._+!-]+\s*(?:;.*)?$"
+)
+
+
+def _build_dependency_cache_dir() -> str:
+    return os.path.join(os.path.dirname(build_cache_file_path()), "lambda_dependencies")
+
+
+def _requirement_lines(requirements: str) -> List[str]:
+    lines = []
+    # NOTE: A trailing backslash continues a requirement on the next line
+    for line in requirements.replace("\\\n", " ").splitlines():
+        # Comments start with a # at the start of the line or after whitespace
+        line = re.sub(r"(^|\s)#.*$", "", line).strip()
+        if line:
+            lines.append(line)
+    return lines
+
+
+def _is_pinned_requirement(line: str) -> bool:
+    if _EDITABLE_REQUIREMENT_RE.match(line):
+        return False
+    if line.startswith("-"):
+        # Global options, like --index-url, don't change what is installed
+        return True
+    # NOTE: Per requirement options, like --hash, follow the requirement
+    requirement = line.split(" --", 1)[0].strip()
+    return _PINNED_REQUIREMENT_RE.match(requirement) is not None
+
+
+def _hash_requirements(
+    sha256, requirements_txt_path: str, seen: Set[str], check_pinned: bool = True
+) -> bool:
+    """Hashes a requirements file and the files it includes.
+
+    Returns False if any requirement isn't pinned to an exact version, in which
+    case the same files can install different packages over time.
+    """
+    requirements_txt_path = os.path.abspath(requirements_txt_path)
+    if requirements_txt_path in seen:
+        return True
+    seen.add(requirements_txt_path)
+    with open(requirements_txt_path, "rb") as f:
+        requirements = f.read()
+    sha256.update(requirements)
+    pinned = True
+    for line in _requirement_lines(requirements.decode("utf-8", errors="replace")):
+        # Requirements files can include other requirements and constraints files,
+        # which are relative to the file that includes them
+        match = _REQUIREMENTS_INCLUDE_RE.match(line)
+        if match is not None:
+            # NOTE: Constraints don't add packages, so they don't need to be pinned
+            pinned &= _hash_requirements(
+                sha256,
+                os.path.join(os.path.dirname(requirements_txt_path), match.group(1)),
+                seen,
+                check_pinned=check_pinned
+                and not line.startswith(("-c", "--constraint")),
+            )
+        elif check_pinned and not _is_pinned_requirement(line):
+            pinned = False
+    return pinned
+
+
+def _dependency_cache_key(
+    requirements_txt_path: str, python_version: str
+) -> Optional[str]:
+    """Returns the key installed dependencies are cached by.
+
+    None is returned if the dependencies can't be cached because a requirement
+    isn't pinned to an exact version (e.g. `requests`, `pkg @ git+...@main` or
+    `-e ./lib`).
+    """
+    sha256 = hashlib.sha256(f"{python_version}:{_LAMBDA_PLATFORM}:cp\n".encode())
+    if not _hash_requirements(sha256, requirements_txt_path, set()):
+        return None
+    return sha256.hexdigest()
+
+
+def _evict_cached_dependencies(cache_dir: str, keep: str):
+    cached = [
+        os.path.join(cache_dir, name)
+        for name in os.listdir(cache_dir)
+        if not name.startswith(".")
+    ]
+    cached.sort(key=os.path.getmtime, reverse=True)
+    for path in cached[_MAX_CACHED_DEPENDENCIES:]:
+        if path != keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+@contextlib.contextmanager
+def _install_dependencies(
+    requirements_txt_path: str, python_version: str, build_logs: IO[Any]
+) -> Iterator[str]:
+    """Yields a directory with the dependencies in requirements.txt installed.
+
+    Installs are cached by the contents of the requirements files, the python
+    version and the platform, so they are only redone when one of them changes.
+    Installs are only cached if every requirement is pinned to an exact version.
+    Otherwise the dependencies are installed on every build, so new releases of
+    unpinned packages are picked up, and removed once the build is done.
+    """
+    project_dir = config.launchflow_yaml.project_directory_abs_path
+    key = _dependency_cache_key(
+        os.path.join(project_dir, requirements_txt_path), python_version
+    )
+    cache_dir = _build_dependency_cache_dir()
+    dependencies_dir = None
+    if key is not None:
+        dependencies_dir = os.path.join(cache_dir, key)
+        if os.path.isdir(dependencies_dir):
+            build_logs.write(
+                f"Reusing dependencies installed from {requirements_txt_path}\n"
+            )
+            # NOTE: We bump the mtime so recently used installs aren't evicted
+            os.utime(dependencies_dir)
+            yield dependencies_dir
+            return
+    else:
+        build_logs.write(
+            f"Not caching dependencies since {requirements_txt_path} has "
+            "requirements that aren't pinned to an exact version\n"
+        )
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Packages are installed into a temporary directory first so a failed or
+    # concurrent install never leaves a partial tree at the cached path
+    install_dir = tempfile.mkdtemp(dir=cache_dir, prefix=".install-")
+    try:
+        # TODO: I removed uv doesn't support `--implementation cp`, I'm not sure if we need it or not
+        # TODO: UV --python-platform flag is a little different than the one used in the original code
+        # probably need to verify that is works as expected
+        # subprocess.check_call(
+        #     f"uv pip install --no-cache --python-platform linux --target={install_dir} --python-version {python_version} --only-binary=:all: -r {requirements_txt_path}".split(),
+        #     cwd=config.launchflow_yaml.project_directory_abs_path,
+        #     stdout=build_logs,
+        #     stderr=build_logs,
+        # )
+        # TODO: Update this to use uv for faster builds see above
+        # The main issue is uv expected to be run in a virtual environment or you have to specify --system
+        # I _think_ we should create a virtual environment and use that with uv
+        subprocess.check_call(
+            f"pip install --no-cache-dir --platform {_LAMBDA_PLATFORM} --target={install_dir} --implementation cp --python-version {python_version} --only-binary=:all: -r {requirements_txt_path}".split(),
+            cwd=project_dir,
+            stdout=build_logs,
+            stderr=build_logs,
+        )
+        if dependencies_dir is not None:
+            try:
+                os.rename(install_dir, dependencies_dir)
+            except OSError:
+                # Another deploy installed the same dependencies first
+                shutil.rmtree(install_dir, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(install_dir, ignore_errors=True)
+        raise
+
+    if dependencies_dir is None:
+        try:
+            yield install_dir
+        finally:
+            shutil.rmtree(install_dir, ignore_errors=True)
+        return
+
+    _evict_cached_dependencies(cache_dir, keep=dependencies_dir)
+    yield dependencies_dir
+
+
 def _zip_source(
     build_directory: str,
     build_ignore: List[str],
     python_version: Union[str, None],
     requirements_txt_path: Optional[str],
     build_logs: IO[Any],
-):
-    # 1. create a temp dir
-    with tempfile.TemporaryDirectory() as temp_dir:
-        shutil.copytree(build_directory, temp_dir, dirs_exist_ok=True, symlinks=True)
-
-        # 2. Install packages from requirements.txt (if specified)
+    compresslevel: int = DEFAULT_COMPRESSION_LEVEL,
+    extra_files: Optional[Dict[str, str]] = None,
+) -> bytes:
+    with contextlib.ExitStack() as stack:
+        # 1. Install packages from requirements.txt (if specified)
+        extra_directories = []
         if requirements_txt_path is not None and python_version is not None:
-            # TODO: update this to be async
-            # TODO: I removed uv doesn't support `--implementation cp`, I'm not sure if we need it or not
-            # TODO: UV --python-platform flag is a little different than the one used in the original code
-            # probably need to verify that is works as expected
-            # subprocess.check_call(
-            #     f"uv pip install --no-cache --python-platform linux --target={temp_dir} --python-version {python_version} --only-binary=:all: -r {requirements_txt_path}".split(),
-            #     cwd=config.launchflow_yaml.project_directory_abs_path,
-            #     stdout=build_logs,
-            #     stderr=build_logs,
-            # )
-            # TODO: Update this to use uv for faster builds see above
-            # The main issue is uv expected to be run in a virtual environment or you have to specify --system
-            # I _think_ we should create a virtual environment and use that with uv
-            subprocess.check_call(
-                f"pip install --no-cache-dir --platform manylinux2014_x86_64 --target={temp_dir} --implementation cp --python-version {python_version} --only-binary=:all: -r {requirements_txt_path}".split(),
-                cwd=config.launchflow_yaml.project_directory_abs_path,
-                stdout=build_logs,
-                stderr=build_logs,
+            extra_directories.append(
+                stack.enter_context(
+                    _install_dependencies(
+                        requirements_txt_path, python_version, build_logs
+                    )
+                )
             )
             # Include __pycache__ directories and .pyc files in the build ignore to filter out artifacts that were created by the pip install
-            build_ignore = list(set(build_ignore + ["__pycache__", "*.pyc"]))
-
-        # 3. Zip the contents of the temp directory
-        zip_file_path = os.path.join(temp_dir, "lambda.zip")
-        zip_source(temp_dir, ignore_patterns=build_ignore, file=zip_file_path)
-
-        # Read the zip file
-        with open(zip_file_path, "rb") as zip_file:
-            zip_file_content = zip_file.read()
-
-    return zip_file_content
+            build_ignore = build_ignore + ["__pycache__", "*.pyc"]
+
+        # 2. Zip the build directory and the installed packages
+        # NOTE: The files are zipped straight from where they are instead of being
+        # copied into one directory first
+        zip_file = io.BytesIO()
+        zip_source(
+            build_directory,
+            ignore_patterns=build_ignore,
+            file=zip_file,
+            compresslevel=compresslevel,
+            extra_directories=extra_directories,
+            extra_files=extra_files,
+        )
+    return zip_file.getvalue()
 
 
 @dataclass
@@ -423,12 +603,21 @@ class LambdaService(AWSService[LambdaServiceReleaseInputs]):
             zip_file_path = self.runtime_options.zip_file_path
 
         if zip_file_path is None:
-            zip_file_content = _zip_source(
-                build_directory=self.build_directory,
-                build_ignore=self.build_ignore,
-                python_version=python_version,
-                requirements_txt_path=requirements_txt_path,
-                build_logs=build_log_file,
+            loop = asyncio.get_event_loop()
+            zip_file_content = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    _zip_source,
+                    build_directory=self.build_directory,
+                    build_ignore=self.build_ignore,
+                    python_version=python_version,
+                    requirements_txt_path=requirements_txt_path,
+                    build_logs=build_log_file,
+                    compresslevel=config.env.build_compression_level,
+                    extra_files=runtime_manifest_files(
+                        self.build_directory, deployment_id
+                    ),
+                ),
             )
         else:
             with open(zip_file_path, "rb") as file:
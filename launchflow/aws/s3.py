@@ -1,22 +1,144 @@
+import concurrent.futures
 import dataclasses
 import io
-from typing import IO
+import os
+from typing import IO, Any, AsyncIterator, Dict, Iterator, List, Optional
 
+from launchflow import exceptions
+from launchflow.aws_clients import get_boto_client
 from launchflow.models.enums import ResourceProduct
 from launchflow.models.flow_state import EnvironmentState
 from launchflow.node import Outputs
 from launchflow.resource import ResourceInputs
+from launchflow.utils import is_relative_path, iterate_in_executor, list_files
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
 except ImportError:
     boto3 = None  # type: ignore
+    TransferConfig = None  # type: ignore
 
 
 from typing import Union
 
 from launchflow.aws.resource import AWSResource
 
+# The size of each part of parallel transfers and streaming reads and writes
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 8
+# S3 requires all parts of a multipart upload but the last to be at least 5 MiB
+MIN_MULTIPART_CHUNK_SIZE = 5 * 1024 * 1024
+
+
+class S3ObjectWriter(io.RawIOBase):
+    """A file-like object that streams writes to an S3 object.
+
+    Writes are buffered and uploaded as the parts of a multipart upload, so objects
+    larger than memory can be written. Objects smaller than a single part are
+    uploaded with one request. The object is only created once the writer is
+    explicitly closed. The upload is aborted if the writer is used as a context
+    manager that exits with an error, or if it is garbage collected before it
+    is closed.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket_name: str,
+        key: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if chunk_size < MIN_MULTIPART_CHUNK_SIZE:
+            raise ValueError(
+                f"chunk_size must be at least {MIN_MULTIPART_CHUNK_SIZE} bytes"
+            )
+        self._client = client
+        self._bucket_name = bucket_name
+        self._key = key
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: List[Dict[str, Any]] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore
+        if self.closed:
+            raise ValueError("write to closed file")
+        self._buffer += data
+        while len(self._buffer) >= self._chunk_size:
+            self._upload_part(bytes(self._buffer[: self._chunk_size]))
+            del self._buffer[: self._chunk_size]
+        return len(data)
+
+    def _upload_part(self, data: bytes):
+        if self._upload_id is None:
+            response = self._client.create_multipart_upload(
+                Bucket=self._bucket_name, Key=self._key
+            )
+            self._upload_id = response["UploadId"]
+        part_number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket_name,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._upload_id is None:
+                self._client.put_object(
+                    Bucket=self._bucket_name, Key=self._key, Body=bytes(self._buffer)
+                )
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                self._client.complete_multipart_upload(
+                    Bucket=self._bucket_name,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={"Parts": self._parts},
+                )
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            super().close()
+
+    def abort(self):
+        """Discards everything written so far without creating the object."""
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket_name, Key=self._key, UploadId=self._upload_id
+            )
+            self._upload_id = None
+        self._buffer = bytearray()
+        super().close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+    def __del__(self):
+        # NOTE: IOBase.__del__ calls close(), which would publish a truncated
+        # object if the writer was dropped part way through (e.g. on an error).
+        if self.closed:
+            return
+        try:
+            self.abort()
+        except Exception:
+            pass
+
 
 @dataclasses.dataclass
 class S3BucketOutputs(Outputs):
@@ -149,3 +271,259 @@ class S3Bucket(AWSResource[S3BucketOutputs]):
         bucket.download_fileobj(bucket_path, bytes_io)
         bytes_io.seek(0)
         return bytes_io.read()
+
+    def _transfer_config(self, chunk_size: int, max_workers: int) -> "TransferConfig":
+        if boto3 is None:
+            raise ImportError(
+                "boto3 not found. "
+                "You can install it with pip install launchflow[aws]"
+            )
+        return TransferConfig(
+            multipart_threshold=chunk_size,
+            multipart_chunksize=chunk_size,
+            max_concurrency=max_workers,
+            use_threads=max_workers > 1,
+        )
+
+    def open(
+        self, bucket_path: str, mode: str = "rb", chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> IO:
+        """Opens a file in the S3 bucket for streaming reads or writes.
+
+        **Args:**
+        - `bucket_path (str)`: The path to the file in the bucket.
+        - `mode (str)`: The mode to open the file with, either "rb" or "wb". Defaults to "rb".
+        - `chunk_size (int)`: The size of each part uploaded when writing, at least 5 MiB. Defaults to 32 MiB.
+
+        **Returns:**
+        - A file-like object that streams the file's contents from or to S3.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.aws.S3Bucket("my-bucket")
+        with bucket.open("large-file.bin", "wb") as f:
+            for chunk in generate_chunks():
+                f.write(chunk)
+        ```
+        """
+        if boto3 is None:
+            raise ImportError(
+                "boto3 not found. "
+                "You can install it with pip install launchflow[aws]"
+            )
+        client = get_boto_client("s3")
+        bucket_name = self.outputs().bucket_name
+        if mode == "rb":
+            try:
+                response = client.get_object(Bucket=bucket_name, Key=bucket_path)
+            except client.exceptions.NoSuchKey:
+                raise exceptions.S3ObjectNotFound(bucket=bucket_name, key=bucket_path)
+            return response["Body"]
+        if mode == "wb":
+            return S3ObjectWriter(client, bucket_name, bucket_path, chunk_size)  # type: ignore
+        raise ValueError(f"Unsupported mode `{mode}`, expected one of ('rb', 'wb')")
+
+    def iter_download(
+        self, bucket_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Downloads a file from the S3 bucket in chunks.
+
+        **Args:**
+        - `bucket_path (str)`: The path to the file in the bucket.
+        - `chunk_size (int)`: The max size of each chunk in bytes. Defaults to 32 MiB.
+
+        **Yields:**
+        - The contents of the file, one chunk at a time.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.aws.S3Bucket("my-bucket")
+        with open("large-file.bin", "wb") as f:
+            for chunk in bucket.iter_download("large-file.bin"):
+                f.write(chunk)
+        ```
+        """
+        body = self.open(bucket_path, "rb")
+        try:
+            yield from body.iter_chunks(chunk_size)  # type: ignore
+        finally:
+            body.close()
+
+    def iter_download_async(
+        self, bucket_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Asynchronously downloads a file from the S3 bucket in chunks.
+
+        **Args:**
+        - `bucket_path (str)`: The path to the file in the bucket.
+        - `chunk_size (int)`: The max size of each chunk in bytes. Defaults to 32 MiB.
+
+        **Yields:**
+        - The contents of the file, one chunk at a time.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.aws.S3Bucket("my-bucket")
+        async for chunk in bucket.iter_download_async("large-file.bin"):
+            ...
+        ```
+        """
+        return iterate_in_executor(self.iter_download(bucket_path, chunk_size))
+
+    def parallel_upload(
+        self,
+        file_path: str,
+        bucket_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Uploads a large file to the S3 bucket as a multipart upload of parallel parts.
+
+        **Args:**
+        - `file_path (str)`: The path of the local file to upload.
+        - `bucket_path (str)`: The path to upload the file to in the bucket.
+        - `chunk_size (int)`: The size of each part in bytes. Defaults to 32 MiB.
+        - `max_workers (int)`: The max number of parts to upload at once. Defaults to 8.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.aws.S3Bucket("my-bucket")
+        bucket.parallel_upload("model.bin", "models/model.bin")
+        ```
+        """
+        config = self._transfer_config(chunk_size, max_workers)
+        get_boto_client("s3").upload_file(
+            file_path, self.outputs().bucket_name, bucket_path, Config=config
+        )
+
+    def parallel_download(
+        self,
+        bucket_path: str,
+        file_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Downloads a large file from the S3 bucket with parallel ranged requests.
+
+        **Args:**
+        - `bucket_path (str)`: The path to the file in the bucket.
+        - `file_path (str)`: The path of the local file to download to.
+        - `chunk_size (int)`: The size of each range in bytes. Defaults to 32 MiB.
+        - `max_workers (int)`: The max number of ranges to download at once. Defaults to 8.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.aws.S3Bucket("my-bucket")
+        bucket.parallel_download("models/model.bin", "model.bin")
+        ```
+        """
+        config = self._transfer_config(chunk_size, max_workers)
+        get_boto_client("s3").download_file(
+            self.outputs().bucket_name, bucket_path, file_path, Config=config
+        )
+
+    def upload_directory(
+        self,
+        directory: str,
+        prefix: str = "",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[str]:
+        """Uploads all files in a local directory to the S3 bucket.
+
+        **Args:**
+        - `directory (str)`: The local directory to upload.
+        - `prefix (str)`: The prefix to upload the files under in the bucket, for example "static/". Defaults to the root of the bucket.
+        - `max_workers (int)`: The max number of files to upload at once. Defaults to 8.
+
+        **Returns:**
+        - The paths of the uploaded files in the bucket.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.aws.S3Bucket("my-bucket")
+        bucket.upload_directory("dist", prefix="static/")
+        ```
+        """
+        # Files are uploaded in parallel so each file is uploaded by a single thread
+        config = self._transfer_config(DEFAULT_CHUNK_SIZE, 1)
+        client = get_boto_client("s3")
+        bucket_name = self.outputs().bucket_name
+        file_names = list(list_files(directory))
+        keys = [prefix + file_name.replace(os.sep, "/") for file_name in file_names]
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(
+                    client.upload_file,
+                    os.path.join(directory, file_name),
+                    bucket_name,
+                    key,
+                    Config=config,
+                )
+                for file_name, key in zip(file_names, keys)
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        return keys
+
+    def download_prefix(
+        self,
+        prefix: str,
+        directory: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[str]:
+        """Downloads all files under a prefix of the S3 bucket to a local directory.
+
+        **Args:**
+        - `prefix (str)`: The prefix of the files to download, for example "static/".
+        - `directory (str)`: The local directory to download the files to. Files are written to their path relative to the prefix.
+        - `max_workers (int)`: The max number of files to download at once. Defaults to 8.
+
+        **Returns:**
+        - The local paths of the downloaded files.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.aws.S3Bucket("my-bucket")
+        bucket.download_prefix("static/", "dist")
+        ```
+        """
+        config = self._transfer_config(DEFAULT_CHUNK_SIZE, 1)
+        client = get_boto_client("s3")
+        bucket_name = self.outputs().bucket_name
+        keys = []
+        paginator = client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                relative_key = obj["Key"][len(prefix) :]
+                # Skip "directory" placeholder objects and keys that would be
+                # written outside of the directory
+                if (
+                    not relative_key
+                    or relative_key.endswith("/")
+                    or not is_relative_path(relative_key)
+                ):
+                    continue
+                keys.append(obj["Key"])
+
+        def download(key: str) -> str:
+            file_path = os.path.join(directory, key[len(prefix) :])
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            client.download_file(bucket_name, key, file_path, Config=config)
+            return file_path
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(download, keys))
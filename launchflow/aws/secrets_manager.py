@@ -13,6 +13,7 @@ except ImportError:
 
 import launchflow as lf
 from launchflow.aws.resource import AWSResource
+from launchflow.aws_clients import get_boto_client
 from launchflow.node import Outputs
 from launchflow.resource import ResourceInputs
 
@@ -97,7 +98,7 @@ class SecretsManagerSecret(AWSResource[SecretsManagerSecretOutputs]):
 
         connection_info = self.outputs()
         arn_info = parse_arn(connection_info.secret_id)
-        sm = boto3.client("secretsmanager", region_name=arn_info.region)
+        sm = get_boto_client("secretsmanager", region_name=arn_info.region)
 
         if version_id is None:
             value = sm.get_secret_value(SecretId=connection_info.secret_id)
@@ -136,6 +137,6 @@ class SecretsManagerSecret(AWSResource[SecretsManagerSecretOutputs]):
 
         connection_info = self.outputs()
         arn_info = parse_arn(connection_info.secret_id)
-        sm = boto3.client("secretsmanager", region_name=arn_info.region)
+        sm = get_boto_client("secretsmanager", region_name=arn_info.region)
 
         sm.put_secret_value(SecretId=connection_info.secret_id, SecretString=payload)
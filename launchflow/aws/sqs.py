@@ -1,19 +1,38 @@
 import dataclasses
+import logging
+import time
 from datetime import timedelta
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Union
 
+from launchflow import exceptions
+from launchflow.aws.resource import AWSResource
+from launchflow.aws_clients import get_boto_client
 from launchflow.models.enums import ResourceProduct
 from launchflow.models.flow_state import EnvironmentState
 from launchflow.node import Outputs
 from launchflow.resource import ResourceInputs
 
-try:
-    import boto3
-except ImportError:
-    boto3 = None  # type: ignore
+# The limits of a single SendMessageBatch / DeleteMessageBatch request
+# https://docs.aws.amazon.com/AWSSimpleQueueService/latest/APIReference/API_SendMessageBatch.html
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 262144
 
 
-from launchflow.aws.resource import AWSResource
+def _batch_entries(entries: List[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    batch_size = 0
+    for entry in entries:
+        entry_size = len(entry["MessageBody"].encode("utf-8"))
+        if batch and (
+            len(batch) == MAX_BATCH_ENTRIES or batch_size + entry_size > MAX_BATCH_BYTES
+        ):
+            yield batch
+            batch = []
+            batch_size = 0
+        batch.append(entry)
+        batch_size += entry_size
+    if batch:
+        yield batch
 
 
 @dataclasses.dataclass
@@ -54,6 +73,10 @@ class SQSQueue(AWSResource[SQSQueueOutputs]):
 
     # Quick utilities for sending and receiving messages
     queue.send_message("Hello, world!")
+    queue.send_messages(["Hello", "world!"])
+
+    for message in queue.consume():
+        print(message["Body"])
     ```
 
     #### FIFO Queue
@@ -182,7 +205,7 @@ class SQSQueue(AWSResource[SQSQueueOutputs]):
         """
         outputs = self.outputs()
 
-        client = boto3.client("sqs")
+        client = get_boto_client("sqs")
         kwargs = {
             "QueueUrl": outputs.url,
             "MessageBody": message_body,
@@ -198,3 +221,185 @@ class SQSQueue(AWSResource[SQSQueueOutputs]):
         if message_group_id is not None:
             kwargs["MessageGroupId"] = message_group_id
         return client.send_message(**kwargs)  # type: ignore
+
+    def send_messages(
+        self,
+        messages: Iterable[Union[str, Dict[str, Any]]],
+        max_retries: int = 3,
+    ) -> List[Dict[str, Any]]:
+        """Send messages to the queue in batches using the boto3 client library.
+
+        Messages are sent with `SendMessageBatch` requests of up to 10 messages.
+        Messages that fail for reasons other than a problem with the message itself,
+        such as throttling, are retried with an exponential backoff.
+
+        For additional details on the message fields see the [client library documentation](https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sqs/client/send_message_batch.html).
+
+        **Args:**
+        - `messages (Iterable[Union[str, Dict[str, Any]]])`: The messages to send. Each message is either the message body or a `SendMessageBatch` entry without the `Id`, for example `{"MessageBody": "hello", "MessageGroupId": "group"}`.
+        - `max_retries (int)`: The max number of times to retry failed messages. Defaults to 3.
+
+        **Returns:**
+        - `List[Dict[str, Any]]`: The successful `SendMessageBatch` result of each message, in the order the messages were given.
+
+        **Raises:**
+        - `SQSSendMessagesFailed`: If any of the messages could not be sent.
+
+        **Example usage:**
+
+        ```python
+        import launchflow as lf
+
+        queue = lf.aws.SQSQueue("my-queue")
+
+        queue.send_messages(["Hello", "world!"])
+        ```
+        """
+        outputs = self.outputs()
+
+        client = get_boto_client("sqs")
+        entries = []
+        for i, message in enumerate(messages):
+            if isinstance(message, str):
+                message = {"MessageBody": message}
+            entries.append({**message, "Id": str(i)})
+        results: Dict[str, Dict[str, Any]] = {}
+        failed: List[Dict[str, Any]] = []
+        retries = 0
+        while entries:
+            retryable = []
+            for batch in _batch_entries(entries):
+                response = client.send_message_batch(
+                    QueueUrl=outputs.url, Entries=batch
+                )
+                for result in response.get("Successful", []):
+                    results[result["Id"]] = result
+                batch_by_id = {entry["Id"]: entry for entry in batch}
+                for failure in response.get("Failed", []):
+                    if failure.get("SenderFault") or retries >= max_retries:
+                        failed.append(failure)
+                    else:
+                        retryable.append(batch_by_id[failure["Id"]])
+            entries = retryable
+            if entries:
+                time.sleep(min(0.1 * 2**retries, 5))
+                retries += 1
+
+        if failed:
+            raise exceptions.SQSSendMessagesFailed(outputs.url, failed)
+        return [results[message_id] for message_id in sorted(results, key=int)]
+
+    def receive(
+        self,
+        max_messages: int = 10,
+        wait_time_seconds: int = 20,
+        visibility_timeout: Optional[int] = None,
+        message_attribute_names: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Receive messages from the queue using long polling.
+
+        Received messages are not deleted from the queue, use `consume` to have
+        messages deleted once they are processed.
+
+        For additional details on the returned messages see the [client library documentation](https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sqs/client/receive_message.html).
+
+        **Args:**
+        - `max_messages (int)`: The max number of messages to receive, between 1 and 10. Defaults to 10.
+        - `wait_time_seconds (int)`: How long to wait for messages to arrive, between 0 and 20 seconds. Defaults to 20.
+        - `visibility_timeout (Optional[int])`: How long the messages are hidden from other consumers. Defaults to the visibility timeout of the queue.
+        - `message_attribute_names (Optional[List[str]])`: The message attributes to receive. Defaults to None.
+
+        **Returns:**
+        - `List[Dict[str, Any]]`: The received messages.
+        """
+        outputs = self.outputs()
+
+        client = get_boto_client("sqs")
+        kwargs: Dict[str, Any] = {
+            "QueueUrl": outputs.url,
+            "MaxNumberOfMessages": max_messages,
+            "WaitTimeSeconds": wait_time_seconds,
+        }
+        if visibility_timeout is not None:
+            kwargs["VisibilityTimeout"] = visibility_timeout
+        if message_attribute_names is not None:
+            kwargs["MessageAttributeNames"] = message_attribute_names
+        return client.receive_message(**kwargs).get("Messages", [])
+
+    def consume(
+        self,
+        wait_time_seconds: int = 20,
+        visibility_timeout: Optional[int] = None,
+        message_attribute_names: Optional[List[str]] = None,
+        stop_when_empty: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Receive messages from the queue and delete them once they are processed.
+
+        A message is only deleted once the next message is requested from the
+        generator, so a message whose processing raised an error is redelivered
+        after its visibility timeout. The messages of each poll are deleted with a
+        single `DeleteMessageBatch` request before the queue is polled again.
+
+        **Args:**
+        - `wait_time_seconds (int)`: How long each poll waits for messages to arrive, between 0 and 20 seconds. Defaults to 20.
+        - `visibility_timeout (Optional[int])`: How long received messages are hidden from other consumers. Defaults to the visibility timeout of the queue.
+        - `message_attribute_names (Optional[List[str]])`: The message attributes to receive. Defaults to None.
+        - `stop_when_empty (bool)`: If true, stop once a poll returns no messages. Defaults to False.
+
+        **Yields:**
+        - `Dict[str, Any]`: The received messages.
+
+        **Example usage:**
+
+        ```python
+        import launchflow as lf
+
+        queue = lf.aws.SQSQueue("my-queue")
+
+        for message in queue.consume():
+            print(message["Body"])
+        ```
+        """
+        outputs = self.outputs()
+
+        client = get_boto_client("sqs")
+        processed: List[str] = []
+        try:
+            while True:
+                messages = self.receive(
+                    wait_time_seconds=wait_time_seconds,
+                    visibility_timeout=visibility_timeout,
+                    message_attribute_names=message_attribute_names,
+                )
+                if not messages and stop_when_empty:
+                    return
+                for message in messages:
+                    yield message
+                    processed.append(message["ReceiptHandle"])
+                # NOTE: Processed messages are deleted before the next poll, which
+                # can wait for a while, so they aren't redelivered once their
+                # visibility timeout expires. A poll returns at most 10 messages,
+                # so this is always a single batch.
+                if processed:
+                    _delete_messages(client, outputs.url, processed)
+                    processed = []
+        finally:
+            if processed:
+                _delete_messages(client, outputs.url, processed)
+
+
+def _delete_messages(client: Any, queue_url: str, receipt_handles: List[str]):
+    response = client.delete_message_batch(
+        QueueUrl=queue_url,
+        Entries=[
+            {"Id": str(i), "ReceiptHandle": receipt_handle}
+            for i, receipt_handle in enumerate(receipt_handles)
+        ],
+    )
+    for failure in response.get("Failed", []):
+        # The message will be redelivered once its visibility timeout expires
+        logging.warning(
+            "Failed to delete message from SQS queue %s: %s",
+            queue_url,
+            failure.get("Message"),
+        )
@@ -0,0 +1,21 @@
+from typing import Any, Optional
+
+from launchflow import exceptions
+from launchflow.client_registry import client_registry
+
+
+def get_boto_client(service_name: str, region_name: Optional[str] = None) -> Any:
+    """Returns a shared boto3 client for a service and region.
+
+    boto3 clients are thread safe, so a single client is used by all threads of the
+    process.
+    """
+    try:
+        import boto3
+    except ImportError:
+        raise exceptions.MissingAWSDependency()
+    return client_registry.get(
+        ("aws", service_name, region_name),
+        # NOTE: boto3-stubs only has overloads for literal service names
+        lambda: boto3.client(service_name, region_name=region_name),  # type: ignore[call-overload]
+    )
@@ -1,14 +1,24 @@
 import asyncio
 import base64
-from typing import IO, List, Literal, Optional
+import os
+from typing import IO, Dict, List, Literal, Optional
 
 from docker.client import from_env
 from docker.errors import BuildError  # type: ignore
 
 from docker import errors
 from launchflow import exceptions
+from launchflow.cache.runtime_manifest import runtime_manifest_files
+from launchflow.config import config
 from launchflow.models.flow_state import AWSEnvironmentConfig
-from launchflow.workflows.utils import tar_source_in_memory
+from launchflow.workflows.utils import (
+    SOURCE_UPLOAD_CHUNK_SIZE,
+    list_source_files,
+    source_digest,
+    source_image_tag,
+    source_tarball_path,
+    tar_source,
+)
 
 
 def _write_build_logs(f: IO, log_stream):
@@ -159,25 +169,57 @@ class ECRDockerBuilder:
             registry=self.ecr_repository.replace("https://", ""),
         )
 
-    async def _upload_source_tarball_to_s3(self):
+    async def _upload_source_tarball_to_s3(
+        self,
+        source_tarball_s3_path: str,
+        relative_paths: List[str],
+        extra_files: Optional[Dict[str, str]] = None,
+    ):
         try:
             import boto3
+            from botocore.exceptions import ClientError
         except ImportError:
             raise exceptions.MissingAWSDependency()
-        source_tarball_s3_path = f"builds/{self.launchflow_project_name}/{self.launchflow_environment_name}/services/{self.launchflow_service_name}/source.tar.gz"
+
+        def tarball_exists(s3_client) -> bool:
+            try:
+                s3_client.head_object(
+                    Bucket=self.aws_environment_config.artifact_bucket,
+                    Key=source_tarball_s3_path,
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                    return False
+                raise
+            return True
 
         def upload_async():
-            source_tarball = tar_source_in_memory(
-                self.build_directory, self.build_ignore
-            )
+            from launchflow.aws.s3 import S3ObjectWriter
 
             try:
-                bucket = boto3.resource(
-                    "s3",
-                ).Bucket(
-                    self.aws_environment_config.artifact_bucket
-                )  # type: ignore
-                bucket.upload_fileobj(source_tarball, source_tarball_s3_path)
+                s3_client = boto3.client(
+                    "s3", region_name=self.aws_environment_config.region
+                )
+                # Tarballs are stored by the digest of their contents, so an existing
+                # object already holds this exact source tree
+                if config.env.source_cache and tarball_exists(s3_client):
+                    return
+                # The tarball is streamed into a multipart upload as it is built, and
+                # the upload is aborted if building the tarball fails
+                with S3ObjectWriter(
+                    s3_client,
+                    self.aws_environment_config.artifact_bucket,  # type: ignore
+                    source_tarball_s3_path,
+                    chunk_size=SOURCE_UPLOAD_CHUNK_SIZE,
+                ) as f:
+                    tar_source(
+                        self.build_directory,
+                        self.build_ignore,
+                        f,
+                        compresslevel=config.env.build_compression_level,
+                        relative_paths=relative_paths,
+                        extra_files=extra_files,
+                    )
 
             except Exception as e:
                 raise exceptions.UploadSrcTarballFailed() from e
@@ -185,6 +227,21 @@ class ECRDockerBuilder:
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, upload_async)
 
+    def _ecr_image_exists(self, image_tag: str) -> bool:
+        import boto3
+
+        ecr_client = boto3.client("ecr", region_name=self.aws_environment_config.region)
+        repository_name = self.ecr_repository.split("/", 1)[-1]
+        try:
+            response = ecr_client.describe_images(
+                repositoryName=repository_name, imageIds=[{"imageTag": image_tag}]
+            )
+        except Exception:
+            # NOTE: ECR raises ImageNotFoundException for missing tags, and we fall
+            # back to building the image if the repository can't be checked
+            return False
+        return bool(response.get("imageDetails"))
+
     def _tag_and_push(self):
         self.docker_client.images.get(self.tagged_image_name).tag(
             self.latest_image_name
@@ -201,12 +258,40 @@ class ECRDockerBuilder:
         dockerfile_path: Optional[str] = None,
     ):
         aws_region = self.aws_environment_config.region
-        await self._upload_source_tarball_to_s3()
         try:
             import boto3
         except ImportError:
             raise exceptions.MissingAWSDependency()
 
+        loop = asyncio.get_event_loop()
+        relative_paths = await loop.run_in_executor(
+            None, list_source_files, self.build_directory, self.build_ignore
+        )
+        manifest_files = runtime_manifest_files(
+            self.build_directory, self.launchflow_deployment_id
+        )
+        digest = await loop.run_in_executor(
+            None, source_digest, self.build_directory, relative_paths, manifest_files
+        )
+        image_tag = source_image_tag(digest, build_type, dockerfile_path)
+        if config.env.source_cache:
+            cached_image = f"{self.ecr_repository}:{image_tag}"
+            if await loop.run_in_executor(None, self._ecr_image_exists, image_tag):
+                self.build_log_file.write(
+                    f"Source is unchanged, reusing image {cached_image}\n"
+                )
+                return cached_image
+
+        source_tarball_s3_path = source_tarball_path(
+            self.launchflow_project_name,
+            self.launchflow_environment_name,
+            self.launchflow_service_name,
+            digest,
+        )
+        await self._upload_source_tarball_to_s3(
+            source_tarball_s3_path, relative_paths, manifest_files
+        )
+
         client = boto3.client("codebuild", region_name=aws_region)
 
         env_vars = [
@@ -217,6 +302,9 @@ class ECRDockerBuilder:
             },
             {"name": "BUILD_TYPE", "value": build_type, "type": "PLAINTEXT"},
             {"name": "BUILD_MODE", "value": "build", "type": "PLAINTEXT"},
+            # NOTE: The source tag lets later deploys of the same source reuse the
+            # image
+            {"name": "SOURCE_IMAGE_TAG", "value": image_tag, "type": "PLAINTEXT"},
         ]
         if build_type == "docker":
             if dockerfile_path is None:
@@ -233,7 +321,7 @@ class ECRDockerBuilder:
         response = client.start_build(
             projectName=code_build_project_name,
             sourceTypeOverride="S3",
-            sourceLocationOverride=f"{self.aws_environment_config.artifact_bucket}/builds/{self.launchflow_project_name}/{self.launchflow_environment_name}/services/{self.launchflow_service_name}/",
+            sourceLocationOverride=f"{self.aws_environment_config.artifact_bucket}/{os.path.dirname(source_tarball_s3_path)}/",
             environmentVariablesOverride=env_vars,  # type: ignore
         )
 
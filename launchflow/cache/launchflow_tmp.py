@@ -1,55 +1,85 @@
+import atexit
 import base64
+import contextlib
 import json
 import logging
 import os
+import tempfile
+import threading
+import zlib
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import toml
 import yaml
 
+from launchflow.cache.outputs_cache import (
+    CachedOutputs,
+    OutputsCacheStats,
+    ResourceOutputsCache,
+)
+from launchflow.cache.runtime_manifest import load_runtime_manifest
 from launchflow.config import config
 
+try:
+    import fcntl
+except ImportError:
+    # NOTE: fcntl is not available on Windows, in which case writes are still atomic
+    # but concurrent processes aren't serialized.
+    fcntl = None  # type: ignore
 
-def encode_resource_outputs_cache(resource_outputs: Dict[str, Dict[str, str]]):
-    """
-    Encodes a dictionary into a Base64 string.
+# How long changes to the permanent cache are batched before they are written
+_FLUSH_DELAY_SECONDS = 1.0
 
-    Args:
-        resource_outputs: A dict that maps resource name to a dict of outputs
 
-    Returns:
-        str: The Base64 encoded string of the dictionary.
-    """
+# Run caches are prefixed with a version so the encoding can change in the future.
+# Run caches written by older versions of LaunchFlow don't have a prefix.
+_RUN_CACHE_HEADER = "lf1:"
+# Run caches that are too large for an environment variable are written to a file,
+# in which case the environment variable holds this prefix followed by the path
+RUN_CACHE_FILE_PREFIX = "file:"
+# NOTE: Linux limits a single environment variable to 128KiB, we stay well below
+# that since the rest of the environment counts against the overall limit
+MAX_RUN_CACHE_ENV_VAR_SIZE = 32 * 1024
 
-    def encode_yaml_content(yaml_content):
-        return base64.b64encode(yaml.dump(yaml_content).encode("utf-8")).decode("utf-8")
 
-    # Encode the YAML contents in the inner dictionaries
-    encoded_dict = {
-        key: encode_yaml_content(value) for key, value in resource_outputs.items()
-    }
+def encode_resource_outputs_cache(resource_outputs: Dict[str, Dict[str, str]]) -> str:
+    """
+    Encodes a dictionary of resource outputs into a compact string.
 
-    # Serialize the dictionary to a JSON formatted string
-    json_serialized = json.dumps(encoded_dict)
+    The outputs are serialized as JSON, compressed with zlib, and Base64 encoded
+    after a version header.
 
-    # Encode the JSON string in Base64
-    encoded_json = base64.b64encode(json_serialized.encode("utf-8")).decode("utf-8")
+    Args:
+        resource_outputs: A dict that maps resource name to a dict of outputs
 
-    return encoded_json
+    Returns:
+        str: The encoded string of the dictionary.
+    """
+    json_serialized = json.dumps(resource_outputs, separators=(",", ":"))
+    compressed = zlib.compress(json_serialized.encode("utf-8"))
+    return _RUN_CACHE_HEADER + base64.b64encode(compressed).decode("utf-8")
 
 
-def decode_resource_outputs_cache(encoded_dict: str) -> Dict[str, Dict[str, str]]:
+def write_resource_outputs_cache_file(encoded_cache: str) -> str:
     """
-    Decodes a Base64 string back into a dictionary.
+    Writes an encoded run cache to a temporary file that only the user can read.
 
     Args:
-        encoded_dict (str): The Base64 encoded string to decode.
+        encoded_cache (str): The output of `encode_resource_outputs_cache`.
 
     Returns:
-        dict: The decoded dictionary.
+        str: The path of the file, the caller is responsible for deleting it.
     """
+    fd, path = tempfile.mkstemp(prefix="lf-run-cache-")
+    with os.fdopen(fd, "w") as file:
+        file.write(encoded_cache)
+    return path
 
+
+def _decode_legacy_resource_outputs_cache(
+    encoded_dict: str,
+) -> Dict[str, Dict[str, str]]:
     def decode_yaml_content(encoded_content):
         return yaml.safe_load(
             base64.b64decode(encoded_content.encode("utf-8")).decode("utf-8")
@@ -69,10 +99,61 @@ def decode_resource_outputs_cache(encoded_dict: str) -> Dict[str, Dict[str, str]
     return decoded_dict
 
 
+def decode_resource_outputs_cache(encoded_dict: str) -> Dict[str, Dict[str, str]]:
+    """
+    Decodes a string from `encode_resource_outputs_cache` back into a dictionary.
+
+    Run caches written to a file and run caches in the format used by older
+    versions of LaunchFlow are also supported.
+
+    Args:
+        encoded_dict (str): The encoded string to decode.
+
+    Returns:
+        dict: The decoded dictionary.
+    """
+    if encoded_dict.startswith(RUN_CACHE_FILE_PREFIX):
+        with open(encoded_dict[len(RUN_CACHE_FILE_PREFIX) :], "r") as file:
+            encoded_dict = file.read()
+
+    if not encoded_dict.startswith(_RUN_CACHE_HEADER):
+        return _decode_legacy_resource_outputs_cache(encoded_dict)
+
+    compressed = base64.b64decode(encoded_dict[len(_RUN_CACHE_HEADER) :])
+    return json.loads(zlib.decompress(compressed).decode("utf-8"))
+
+
 def build_cache_key(project: str, environment: str, product: str, resource: str) -> str:
     return f"{project}:{environment}:{product}:{resource}"
 
 
+@contextlib.contextmanager
+def _permanent_cache_lock(permanent_cache_file_path: str):
+    if fcntl is None:
+        yield
+        return
+    with open(f"{permanent_cache_file_path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_permanent_cache(permanent_cache_file_path: str) -> Dict[str, Any]:
+    if not os.path.exists(permanent_cache_file_path):
+        return {}
+    try:
+        with open(permanent_cache_file_path, "r") as file:
+            return toml.load(file)
+    except (OSError, toml.TomlDecodeError) as e:
+        # The cache only holds values we can look up again, so we start over
+        logging.warning(
+            f"Ignoring unreadable cache file {permanent_cache_file_path}: {e}"
+        )
+        return {}
+
+
 @dataclass
 class LaunchFlowCache:
     permanent_cache_file_path: str
@@ -80,9 +161,44 @@ class LaunchFlowCache:
     # Permanent cache values below
     resource_connection_bucket_paths: Dict[str, str] = field(default_factory=dict)
     gcp_service_account_emails: Dict[str, str] = field(default_factory=dict)
+    plan_durations: Dict[str, float] = field(default_factory=dict)
 
     # In-memory cache values below
-    resource_connection_info: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    resource_connection_info: ResourceOutputsCache = field(
+        default_factory=lambda: ResourceOutputsCache(
+            max_entries=config.env.outputs_cache_max_entries,
+            ttl_seconds=config.env.outputs_cache_ttl,
+        )
+    )
+
+    # Changes to the permanent cache that haven't been written to disk yet, keyed
+    # by section then key. A value of None means the key was deleted.
+    _pending_changes: Dict[str, Dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _flush_timer: Optional[threading.Timer] = field(
+        default=None, init=False, repr=False
+    )
+    _flush_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def _record_change(self, section: str, key: str, value: Any):
+        with self._flush_lock:
+            self._pending_changes.setdefault(section, {})[key] = value
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    _FLUSH_DELAY_SECONDS, self.save_permanent_cache_to_disk
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _after_fork_in_child(self):
+        # NOTE: Only the forking thread survives a fork, so the flush timer and lock
+        # state are reset. Changes made before the fork are flushed by the parent.
+        self._flush_lock = threading.Lock()
+        self._flush_timer = None
+        self._pending_changes = {}
 
     def get_resource_outputs_bucket_path(
         self, project: str, environment: str, product: str, resource: str
@@ -100,14 +216,16 @@ class LaunchFlowCache:
     ):
         key = build_cache_key(project, environment, product, resource)
         self.resource_connection_bucket_paths[key] = connection_bucket_path
-        self.save_permanent_cache_to_disk()
+        self._record_change(
+            "resource_connection_bucket_paths", key, connection_bucket_path
+        )
 
     def delete_resource_connection_bucket_path(
         self, project: str, environment: str, product: str, resource: str
     ):
         key = build_cache_key(project, environment, product, resource)
         self.resource_connection_bucket_paths.pop(key, None)
-        self.save_permanent_cache_to_disk()
+        self._record_change("resource_connection_bucket_paths", key, None)
 
     def get_resource_outputs(
         self,
@@ -116,6 +234,21 @@ class LaunchFlowCache:
         product: str,
         resource_name: str,
     ) -> Optional[Dict[str, str]]:
+        cached = self.get_cached_resource_outputs(
+            project, environment, product, resource_name
+        )
+        if cached is None:
+            return None
+        return cached.outputs
+
+    def get_cached_resource_outputs(
+        self,
+        project: str,
+        environment: str,
+        product: str,
+        resource_name: str,
+    ) -> Optional[CachedOutputs]:
+        """Returns the cached outputs of a resource, even if they are stale."""
         key = build_cache_key(project, environment, product, resource_name)
         return self.resource_connection_info.get(key)
 
@@ -128,14 +261,34 @@ class LaunchFlowCache:
         connection_info: Dict[str, str],
     ):
         key = build_cache_key(project, environment, product, resource_name)
-        self.resource_connection_info[key] = connection_info
+        self.resource_connection_info.set(key, connection_info)
 
     def delete_resource_outputs(
         self, project: str, environment: str, product: str, resource: str
     ):
         key = build_cache_key(project, environment, product, resource)
-        self.resource_connection_info.pop(key, None)
-        self.save_permanent_cache_to_disk()
+        self.resource_connection_info.delete(key)
+
+    def start_resource_outputs_refresh(
+        self, project: str, environment: str, product: str, resource: str
+    ) -> bool:
+        key = build_cache_key(project, environment, product, resource)
+        return self.resource_connection_info.start_refresh(key)
+
+    def finish_resource_outputs_refresh(
+        self,
+        project: str,
+        environment: str,
+        product: str,
+        resource: str,
+        success: bool,
+    ):
+        key = build_cache_key(project, environment, product, resource)
+        self.resource_connection_info.finish_refresh(key, success)
+
+    def get_resource_outputs_stats(self) -> OutputsCacheStats:
+        """Returns hit / miss counters of the resource outputs cache for metrics."""
+        return self.resource_connection_info.stats()
 
     def get_gcp_service_account_email(
         self, project: str, environment: str
@@ -146,62 +299,121 @@ class LaunchFlowCache:
     def set_gcp_service_account_email(self, project: str, environment: str, email: str):
         key = f"{project}:{environment}"
         self.gcp_service_account_emails[key] = email
-        self.save_permanent_cache_to_disk()
+        self._record_change("gcp_service_account_emails", key, email)
 
     def delete_gcp_service_account_email(self, project: str, environment: str):
         key = f"{project}:{environment}"
         self.gcp_service_account_emails.pop(key, None)
-        self.save_permanent_cache_to_disk()
+        self._record_change("gcp_service_account_emails", key, None)
+
+    def get_plan_duration(self, operation_type: str, product: str) -> Optional[float]:
+        key = f"{operation_type}:{product}"
+        return self.plan_durations.get(key)
+
+    def record_plan_durations(self, durations: Dict[Tuple[str, str], float]):
+        """Records how long plans took to execute, keyed by (operation, product)."""
+        if not durations:
+            return
+        for (operation_type, product), seconds in durations.items():
+            key = f"{operation_type}:{product}"
+            previous = self.plan_durations.get(key)
+            # NOTE: We use an exponential moving average so a single slow run
+            # doesn't skew future estimates too much
+            if previous is None:
+                self.plan_durations[key] = seconds
+            else:
+                self.plan_durations[key] = (previous + seconds) / 2
+            self._record_change("plan_durations", key, self.plan_durations[key])
 
     @classmethod
     def load_from_file(cls, permanent_cache_file_path: str):
-        if not os.path.exists(permanent_cache_file_path):
-            logging.debug(
-                f"The file '{permanent_cache_file_path}' does not exist. Creating with default values."
-            )
-            return cls(
-                permanent_cache_file_path=permanent_cache_file_path,
-            )
-
         # Load the permanent cache
-        with open(permanent_cache_file_path, "r") as file:
-            logging.debug(f"Loading permanent cache from {permanent_cache_file_path}")
-            data = toml.load(file)
-            resource_connection_bucket_paths = data.get(
-                "resource_connection_bucket_paths", {}
-            )
-            gcp_service_account_emails = data.get("gcp_service_account_emails", {})
-
-        resource_connection_info = {}
+        logging.debug(f"Loading permanent cache from {permanent_cache_file_path}")
+        data = _read_permanent_cache(permanent_cache_file_path)
+        resource_connection_bucket_paths = data.get(
+            "resource_connection_bucket_paths", {}
+        )
+        gcp_service_account_emails = data.get("gcp_service_account_emails", {})
+        plan_durations = data.get("plan_durations", {})
+
+        resource_connection_info = ResourceOutputsCache(
+            max_entries=config.env.outputs_cache_max_entries,
+            ttl_seconds=config.env.outputs_cache_ttl,
+        )
+        runtime_manifest = load_runtime_manifest()
+        if runtime_manifest is not None:
+            logging.debug("Seeding resource outputs from the runtime manifest")
+            # NOTE: Manifest entries get the normal TTL, so outputs that changed since
+            # the service was built are refreshed like any other cached outputs
+            for key, outputs in runtime_manifest.items():
+                resource_connection_info.set(key, outputs)
         if config.env.run_cache is not None:
             logging.debug("Loading run cache from enviroment")
             # TODO: Add support for caching service outputs as well
-            resource_connection_info = decode_resource_outputs_cache(
-                config.env.run_cache
-            )
+            try:
+                run_cache = decode_resource_outputs_cache(config.env.run_cache)
+            except (OSError, ValueError, zlib.error, yaml.YAMLError) as e:
+                # Outputs will be fetched from the remote bucket instead
+                logging.warning(f"Ignoring invalid run cache: {e}")
+                run_cache = {}
+            for key, outputs in run_cache.items():
+                resource_connection_info.set(key, outputs)
 
         return cls(
             permanent_cache_file_path=permanent_cache_file_path,
             resource_connection_bucket_paths=resource_connection_bucket_paths,
             resource_connection_info=resource_connection_info,
             gcp_service_account_emails=gcp_service_account_emails,
+            plan_durations=plan_durations,
         )
 
     def save_permanent_cache_to_disk(self):
-        data = {
-            "resource_connection_bucket_paths": self.resource_connection_bucket_paths,
-            "gcp_service_account_emails": self.gcp_service_account_emails,
-        }
-        os.makedirs(os.path.dirname(self.permanent_cache_file_path), exist_ok=True)
-        with open(self.permanent_cache_file_path, "w") as file:
-            toml.dump(data, file)
+        """Writes pending changes to the permanent cache file.
+
+        Changes are batched and written shortly after they are made, or when the
+        process exits. The file is locked while it is updated and the changes are
+        merged into its latest contents, so concurrent processes don't drop each
+        other's changes. The file is replaced atomically so readers never see a
+        partially written file.
+        """
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending_changes = self._pending_changes
+            self._pending_changes = {}
+        if not pending_changes:
+            return
+
+        cache_dir = os.path.dirname(self.permanent_cache_file_path)
+        tmp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with _permanent_cache_lock(self.permanent_cache_file_path):
+                data = _read_permanent_cache(self.permanent_cache_file_path)
+                for section, changes in pending_changes.items():
+                    values = data.setdefault(section, {})
+                    for key, value in changes.items():
+                        if value is None:
+                            values.pop(key, None)
+                        else:
+                            values[key] = value
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "w") as file:
+                    toml.dump(data, file)
+                os.replace(tmp_path, self.permanent_cache_file_path)
+        except OSError as e:
+            logging.warning(f"Failed to save {self.permanent_cache_file_path}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
         logging.debug(f"Saved to {self.permanent_cache_file_path}")
 
     def save_run_cache_to_disk(self):
         if self.run_cache_file_path is None:
             return
         data = {
-            "resource_connection_info": self.resource_connection_info,
+            "resource_connection_info": self.resource_connection_info.to_dict(),
         }
         os.makedirs(os.path.dirname(self.run_cache_file_path), exist_ok=True)
         with open(self.run_cache_file_path, "w") as file:
@@ -223,4 +435,8 @@ def load_launchflow_cache():
     if launchflow_cache is None:
         permanent_cache_file_path = build_cache_file_path()
         launchflow_cache = LaunchFlowCache.load_from_file(permanent_cache_file_path)
+        # Flush any batched changes before the process exits
+        atexit.register(launchflow_cache.save_permanent_cache_to_disk)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=launchflow_cache._after_fork_in_child)
     return launchflow_cache
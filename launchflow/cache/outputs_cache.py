@@ -0,0 +1,123 @@
+import collections
+import dataclasses
+import threading
+import time
+from typing import Any, Dict, Optional, Set
+
+_NOT_SET: Any = object()
+
+
+@dataclasses.dataclass
+class CachedOutputs:
+    outputs: Dict[str, Any]
+    # True if the entry is older than its TTL and should be refreshed
+    stale: bool
+
+
+@dataclasses.dataclass
+class OutputsCacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    size: int = 0
+
+
+@dataclasses.dataclass
+class _Entry:
+    outputs: Dict[str, Any]
+    expires_at: Optional[float]
+
+
+class ResourceOutputsCache:
+    """An in-memory LRU cache of resource outputs with a TTL per entry.
+
+    Entries past their TTL are still returned but marked as stale, so callers can
+    keep serving them while they are refreshed in the background. Only one refresh
+    per entry is in flight at a time.
+
+    Args:
+        max_entries: The max number of entries to keep, the least recently used
+            entries are evicted first.
+        ttl_seconds: How long entries are fresh for, None means entries never
+            go stale.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "collections.OrderedDict[str, _Entry]" = (
+            collections.OrderedDict()
+        )
+        self._refreshing: Set[str] = set()
+        self._stats = OutputsCacheStats()
+        # NOTE: Outputs can be fetched from multiple threads, for example by
+        # background refreshes of synchronous Resource.outputs() calls
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedOutputs]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            stale = (
+                entry.expires_at is not None and entry.expires_at <= time.monotonic()
+            )
+            if stale:
+                self._stats.stale_hits += 1
+            else:
+                self._stats.hits += 1
+            return CachedOutputs(entry.outputs, stale)
+
+    def set(
+        self, key: str, outputs: Dict[str, Any], ttl_seconds: Optional[float] = _NOT_SET
+    ):
+        if ttl_seconds is _NOT_SET:
+            ttl_seconds = self.ttl_seconds
+        expires_at = None
+        if ttl_seconds is not None:
+            expires_at = time.monotonic() + ttl_seconds
+        with self._lock:
+            self._entries[key] = _Entry(outputs, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def start_refresh(self, key: str) -> bool:
+        """Claims the refresh of an entry, returns False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def finish_refresh(self, key: str, success: bool):
+        with self._lock:
+            self._refreshing.discard(key)
+            if success:
+                self._stats.refreshes += 1
+            else:
+                self._stats.refresh_failures += 1
+
+    def stats(self) -> OutputsCacheStats:
+        with self._lock:
+            return dataclasses.replace(self._stats, size=len(self._entries))
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {key: entry.outputs for key, entry in self._entries.items()}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
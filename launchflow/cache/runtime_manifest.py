@@ -0,0 +1,146 @@
+"""A manifest of pre-resolved resource outputs that ships with deployed services.
+
+When a service is built the outputs of the resources it depends on are staged
+outside of its build directory, and the packagers that build the service's tarball
+or zip add the manifest to it. At runtime the manifest seeds the resource outputs
+cache, so `Resource.outputs()` is served without any network calls until the
+cached outputs go stale.
+
+Outputs that hold secrets, like database passwords, are never written to the
+manifest. Those resources are fetched at runtime instead.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Optional
+
+from launchflow.config import config
+from launchflow.state_codec import decode_state
+
+RUNTIME_MANIFEST_VERSION = 2
+# Where the manifest is placed in the packaged service, relative to its root
+RUNTIME_MANIFEST_PATH = os.path.join(".launchflow", "manifest.json")
+# Resources with any of these output fields are left out of the manifest
+SECRET_OUTPUT_FIELDS = frozenset({"password", "private_key"})
+
+
+def contains_secret_outputs(outputs: Any) -> bool:
+    """Returns True if the outputs, or any nested outputs, hold a secret field."""
+    if isinstance(outputs, dict):
+        return any(
+            key in SECRET_OUTPUT_FIELDS or contains_secret_outputs(value)
+            for key, value in outputs.items()
+        )
+    if isinstance(outputs, (list, tuple)):
+        return any(contains_secret_outputs(value) for value in outputs)
+    return False
+
+
+def build_runtime_manifest_staging_dir() -> str:
+    # NOTE: Imported here since launchflow_tmp seeds its cache from this module
+    from launchflow.cache.launchflow_tmp import build_cache_file_path
+
+    return os.path.join(os.path.dirname(build_cache_file_path()), "runtime_manifests")
+
+
+def staged_runtime_manifest_path(directory: str, deployment_id: str) -> str:
+    key = hashlib.sha256(os.path.abspath(directory).encode("utf-8")).hexdigest()
+    return os.path.join(
+        build_runtime_manifest_staging_dir(), key, deployment_id, "manifest.json"
+    )
+
+
+def stage_runtime_manifest(
+    directory: str, deployment_id: str, resource_outputs: Dict[str, Dict[str, Any]]
+) -> str:
+    """Stages the manifest for a deployment of the service in `directory`.
+
+    The manifest is written outside of the build directory, so it never ends up in
+    the user's checkout. Remove it with `remove_staged_runtime_manifest` once the
+    service is built.
+
+    Args:
+        directory: The build directory of the service.
+        deployment_id: The deployment the manifest is for.
+        resource_outputs: A dict that maps resource cache keys to their outputs.
+            Outputs that hold secrets must already be filtered out.
+
+    Returns:
+        The path the manifest was staged at.
+    """
+    manifest_path = staged_runtime_manifest_path(directory, deployment_id)
+    manifest_dir = os.path.dirname(manifest_path)
+    os.makedirs(manifest_dir, mode=0o700, exist_ok=True)
+    # NOTE: Keys are sorted so the same outputs always produce the same manifest,
+    # which keeps the source digest of unchanged services stable across deploys
+    data = json.dumps(
+        {"version": RUNTIME_MANIFEST_VERSION, "resources": resource_outputs},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(data)
+    os.replace(tmp_path, manifest_path)
+    return manifest_path
+
+
+def remove_staged_runtime_manifest(directory: str, deployment_id: str):
+    manifest_dir = os.path.dirname(
+        staged_runtime_manifest_path(directory, deployment_id)
+    )
+    shutil.rmtree(manifest_dir, ignore_errors=True)
+
+
+def runtime_manifest_files(directory: str, deployment_id: str) -> Dict[str, str]:
+    """Returns the files packagers add to a service's package for its manifest.
+
+    The dict maps the path in the package to the staged file, and is empty if no
+    manifest was staged for the deployment.
+    """
+    manifest_path = staged_runtime_manifest_path(directory, deployment_id)
+    if not os.path.isfile(manifest_path):
+        return {}
+    return {RUNTIME_MANIFEST_PATH: manifest_path}
+
+
+def _read_runtime_manifest(path: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    try:
+        with open(path, "rb") as f:
+            manifest = decode_state(f.read())
+    except FileNotFoundError:
+        logging.debug("No runtime manifest found at %s", path)
+        return None
+    except (OSError, ValueError) as e:
+        logging.warning("Failed to load runtime manifest %s: %s", path, e)
+        return None
+
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != RUNTIME_MANIFEST_VERSION
+    ):
+        logging.warning("Ignoring runtime manifest %s with unknown version", path)
+        return None
+    logging.debug("Loaded runtime manifest from %s", path)
+    return manifest.get("resources", {})
+
+
+def load_runtime_manifest() -> Optional[Dict[str, Dict[str, Any]]]:
+    """Returns the resource outputs in the manifest of the running service.
+
+    None is returned if this process isn't a deployed service or the manifest
+    isn't available.
+    """
+    if not config.env.runtime_manifest or config.env.deployment_id is None:
+        return None
+
+    path = config.env.runtime_manifest_path
+    if path is None:
+        # NOTE: Services run from the root of their package by default, so the
+        # manifest is looked up relative to the working directory
+        path = os.path.join(os.getcwd(), RUNTIME_MANIFEST_PATH)
+    return _read_runtime_manifest(path)
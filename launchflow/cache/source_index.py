@@ -0,0 +1,107 @@
+"""An on disk index of the hashes of files in build directories.
+
+Files are only rehashed when their size or modification time changes, so the
+digest of a build directory that hasn't changed is computed without reading it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+from typing import Dict, List, Sequence
+
+from launchflow.cache.launchflow_tmp import build_cache_file_path
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def build_source_index_dir() -> str:
+    return os.path.join(os.path.dirname(build_cache_file_path()), "source_index")
+
+
+def _index_path(directory: str) -> str:
+    key = hashlib.sha256(os.path.abspath(directory).encode("utf-8")).hexdigest()
+    return os.path.join(build_source_index_dir(), f"{key}.json")
+
+
+def _load_index(directory: str) -> Dict[str, List]:
+    try:
+        with open(_index_path(directory), "r") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    return index
+
+
+def _save_index(directory: str, index: Dict[str, List]):
+    index_dir = build_source_index_dir()
+    tmp_path = None
+    try:
+        os.makedirs(index_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=index_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f, separators=(",", ":"))
+        os.replace(tmp_path, _index_path(directory))
+    except OSError as e:
+        logging.debug("Failed to save the source index of %s: %s", directory, e)
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def hash_file(file_path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def compute_source_digest(directory: str, relative_paths: Sequence[str]) -> str:
+    """Returns a digest of the contents of the files in a build directory.
+
+    The digest covers each file's path, executable bit and contents, so two
+    directories with the same digest produce the same deterministic tarball.
+
+    Args:
+        directory: The build directory.
+        relative_paths: The paths of the included files relative to `directory`,
+            in the order they are added to the tarball.
+
+    Returns:
+        str: The hex encoded sha256 digest.
+    """
+    index = _load_index(directory)
+    updated_index: Dict[str, List] = {}
+    digest = hashlib.sha256()
+    for relative_path in relative_paths:
+        file_path = os.path.join(directory, relative_path)
+        file_stat = os.lstat(file_path)
+        if stat.S_ISLNK(file_stat.st_mode):
+            # NOTE: Symlinks are added to tarballs as links, so we hash the target
+            content_hash = "link:" + os.readlink(file_path)
+        else:
+            cached = index.get(relative_path)
+            if (
+                cached is not None
+                and cached[0] == file_stat.st_size
+                and cached[1] == file_stat.st_mtime_ns
+            ):
+                content_hash = cached[2]
+            else:
+                content_hash = hash_file(file_path)
+            updated_index[relative_path] = [
+                file_stat.st_size,
+                file_stat.st_mtime_ns,
+                content_hash,
+            ]
+        executable = "x" if file_stat.st_mode & 0o111 else "-"
+        digest.update(f"{relative_path}\0{executable}\0{content_hash}\n".encode())
+
+    # NOTE: Files that were removed are dropped from the index when it's rewritten
+    if updated_index != index:
+        _save_index(directory, updated_index)
+    return digest.hexdigest()
@@ -0,0 +1,65 @@
+"""An on disk mirror of remote flow.state files.
+
+Each mirrored file is stored with the GCS generation it was read at, so reads can
+be revalidated with a conditional request instead of downloading the file again.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from typing import Optional, Tuple
+
+from launchflow.cache.launchflow_tmp import build_cache_file_path
+from launchflow.config import config
+
+
+def build_state_mirror_dir() -> str:
+    return os.path.join(os.path.dirname(build_cache_file_path()), "state")
+
+
+def _mirror_path(bucket: str, path: str) -> str:
+    key = hashlib.sha256(f"{bucket}/{path}".encode("utf-8")).hexdigest()
+    return os.path.join(build_state_mirror_dir(), key)
+
+
+def get_mirrored_state(bucket: str, path: str) -> Optional[Tuple[int, bytes]]:
+    """Returns the (generation, contents) of a mirrored file if there is one."""
+    if not config.env.state_mirror:
+        return None
+    try:
+        with open(_mirror_path(bucket, path), "rb") as f:
+            header, _, data = f.read().partition(b"\n")
+        return int(header), data
+    except (OSError, ValueError):
+        return None
+
+
+def mirror_state(bucket: str, path: str, generation: Optional[int], data: bytes):
+    # NOTE: Generations are always ints, anything else means we didn't get a
+    # generation back from GCS so there is nothing to revalidate against.
+    if not config.env.state_mirror or not isinstance(generation, int):
+        return
+    mirror_dir = build_state_mirror_dir()
+    tmp_path = None
+    try:
+        # State files can contain sensitive inputs so only the user can read them
+        os.makedirs(mirror_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=mirror_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(f"{generation}\n".encode("utf-8"))
+            f.write(data)
+        # NOTE: The file is replaced atomically so concurrent commands never read
+        # a partially written file
+        os.replace(tmp_path, _mirror_path(bucket, path))
+    except OSError as e:
+        logging.debug("Failed to mirror gs://%s/%s: %s", bucket, path, e)
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def delete_mirrored_state(bucket: str, path: str):
+    try:
+        os.remove(_mirror_path(bucket, path))
+    except OSError:
+        pass
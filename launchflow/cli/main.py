@@ -14,8 +14,11 @@ from terminaltexteffects.effects.effect_wipe import Wipe
 import launchflow
 from launchflow import exceptions
 from launchflow.cache.launchflow_tmp import (
+    MAX_RUN_CACHE_ENV_VAR_SIZE,
+    RUN_CACHE_FILE_PREFIX,
     build_cache_key,
     encode_resource_outputs_cache,
+    write_resource_outputs_cache_file,
 )
 from launchflow.cli import project_gen
 from launchflow.cli.accounts import account_commands
@@ -640,6 +643,8 @@ async def run(
     current_env = os.environ.copy()
     current_env["LAUNCHFLOW_ENVIRONMENT"] = environment
 
+    run_cache_file = None
+
     if remote_resources and not disable_run_cache:
         rich.print("Building run cache...")
         # Connects to all remote resources, and encodes their outputs as an env variable
@@ -655,48 +660,64 @@ async def run(
             if outputs is not None
         }
         run_cache = encode_resource_outputs_cache(resource_outputs_dict)
+        if len(run_cache) > MAX_RUN_CACHE_ENV_VAR_SIZE:
+            # Large run caches are passed as a file so we don't hit the OS limits
+            # on the size of environment variables
+            run_cache_file = write_resource_outputs_cache_file(run_cache)
+            run_cache = f"{RUN_CACHE_FILE_PREFIX}{run_cache_file}"
         current_env["LAUNCHFLOW_RUN_CACHE"] = run_cache
         rich.print("Run cache built successfully.")
 
-    command = args[0]
-    command_args = []
-    for arg in args[1:]:
-        command_args.append(shlex.quote(arg))
+    # NOTE: The run cache file holds resource outputs, so it's always removed even
+    # if the command fails to start or we exit before local resources are stopped
+    try:
+        command = args[0]
+        command_args = []
+        for arg in args[1:]:
+            command_args.append(shlex.quote(arg))
 
-    proc = await asyncio.create_subprocess_exec(command, *command_args, env=current_env)
+        proc = await asyncio.create_subprocess_exec(
+            command, *command_args, env=current_env
+        )
 
-    async def handle_shutdown():
-        proc.terminate()
-        await proc.wait()
+        async def handle_shutdown():
+            proc.terminate()
+            await proc.wait()
 
-    loop = asyncio.get_event_loop()
+        loop = asyncio.get_event_loop()
 
-    for sig in [signal.SIGINT, signal.SIGTERM]:
-        loop.add_signal_handler(sig, lambda: asyncio.create_task(handle_shutdown()))
+        for sig in [signal.SIGINT, signal.SIGTERM]:
+            loop.add_signal_handler(sig, lambda: asyncio.create_task(handle_shutdown()))
 
-    rich.print("───── Program Output ─────")
-    rich.print()
-    try:
-        await proc.communicate()
-    except asyncio.CancelledError:
-        # TODO: I don't like this sleep but for some reason it starts before the above process has finished printing
-        await asyncio.sleep(1)
-    finally:
+        rich.print("───── Program Output ─────")
+        rich.print()
         try:
-            proc.terminate()
-            await proc.wait()
-        except ProcessLookupError:
-            # Swallow exception if process has already been stopped
-            pass
-        rich.print("\n──────────────────────────")
-        typer.echo("\nStopping running local resources...")
-        local_container_ids = [
-            resource.running_container_id
-            for resource in local_resources
-            if resource.running_container_id is not None
-        ]
-        await stop_local_containers(local_container_ids, prompt=False)
-        typer.echo("\nStopped local resources successfully.")
+            await proc.communicate()
+        except asyncio.CancelledError:
+            # TODO: I don't like this sleep but for some reason it starts before the above process has finished printing
+            await asyncio.sleep(1)
+        finally:
+            try:
+                proc.terminate()
+                await proc.wait()
+            except ProcessLookupError:
+                # Swallow exception if process has already been stopped
+                pass
+            rich.print("\n──────────────────────────")
+            typer.echo("\nStopping running local resources...")
+            local_container_ids = [
+                resource.running_container_id
+                for resource in local_resources
+                if resource.running_container_id is not None
+            ]
+            await stop_local_containers(local_container_ids, prompt=False)
+            typer.echo("\nStopped local resources successfully.")
+    finally:
+        if run_cache_file is not None:
+            try:
+                os.remove(run_cache_file)
+            except FileNotFoundError:
+                pass
 
 
 @app.command()
@@ -0,0 +1,64 @@
+"""A process-wide registry of long-lived cloud SDK clients.
+
+Creating a client sets up credentials, TLS connections and, for gRPC clients,
+channels, which is much slower than the requests made with it. Runtime resource
+methods share clients through this registry instead of creating one per call.
+
+Clients are dropped in forked child processes since gRPC channels and pooled
+connections can't be shared with the parent. Async clients are bound to the event
+loop they were created in, so they are kept per event loop.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class ClientRegistry:
+    def __init__(self):
+        self._clients: Dict[Hashable, Any] = {}
+        self._loop_clients: "weakref.WeakKeyDictionary[Any, Dict[Hashable, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # NOTE: Creating some clients isn't thread safe, for instance boto3 clients
+        # created from the default session, so creation is serialized
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Returns the client for `key`, creating it with `factory` on first use."""
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = factory()
+                    self._clients[key] = client
+        return client
+
+    def get_async(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Returns the async client for `key` bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._loop_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = factory()
+                clients[key] = client
+        return client
+
+    def clear(self):
+        """Drops all clients, new ones are created on next use."""
+        self._clients = {}
+        self._loop_clients = weakref.WeakKeyDictionary()
+        # The lock may have been held by another thread of the parent process
+        self._lock = threading.Lock()
+
+
+client_registry = ClientRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=client_registry.clear)
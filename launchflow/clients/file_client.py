@@ -2,6 +2,7 @@ import os
 from typing import Union
 
 from launchflow import exceptions
+from launchflow.aws_clients import get_boto_client
 from launchflow.gcp_clients import (
     delete_file_from_gcs_sync,
     read_from_gcs_sync,
@@ -10,11 +11,7 @@ from launchflow.gcp_clients import (
 
 
 def _get_boto_client():
-    try:
-        import boto3
-    except ImportError:
-        raise exceptions.MissingAWSDependency()
-    return boto3.client("s3")
+    return get_boto_client("s3")
 
 
 def read_file(file_path: str) -> str:
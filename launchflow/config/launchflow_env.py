@@ -1,9 +1,10 @@
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 BASE_BIN_DIR = os.path.join(os.path.expanduser("~"), ".launchflow", "bin")
 DEFAULT_TOFU_PATH = os.path.join(BASE_BIN_DIR, "tofu")
+DEFAULT_TOFU_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".launchflow", "tofu")
 
 
 def get_boolean_variable(name: str, default_value: Optional[bool] = None) -> bool:
@@ -23,6 +24,18 @@ def get_boolean_variable(name: str, default_value: Optional[bool] = None) -> boo
 @dataclass
 class LaunchFlowEnvVars:
     tofu_path: str
+    tofu_cache_dir: str = DEFAULT_TOFU_CACHE_DIR
+    reuse_tofu_workspaces: bool = True
+    max_parallel_plans: int = 10
+    state_mirror: bool = True
+    state_format: str = "json"
+    runtime_manifest: bool = True
+    runtime_manifest_path: Optional[str] = None
+    outputs_cache_ttl: Optional[float] = 300
+    outputs_cache_max_entries: int = 1024
+    build_compression_level: int = 6
+    source_cache: bool = True
+    build_ignore_files: List[str] = field(default_factory=list)
     project: Optional[str] = None
     cloud_provider: Optional[str] = None
     environment: Optional[str] = None
@@ -51,9 +64,61 @@ class LaunchFlowEnvVars:
         deployment_id = os.getenv("LAUNCHFLOW_DEPLOYMENT_ID", None)
         run_cache = os.getenv("LAUNCHFLOW_RUN_CACHE", None)
         tofu_path = os.getenv("LAUNCHFLOW_TOFU_PATH", DEFAULT_TOFU_PATH)
+        # Holds the shared provider plugin cache and the reusable tofu workspaces
+        tofu_cache_dir = os.getenv("LAUNCHFLOW_TOFU_CACHE_DIR", DEFAULT_TOFU_CACHE_DIR)
+        reuse_tofu_workspaces = get_boolean_variable(
+            "LAUNCHFLOW_REUSE_TOFU_WORKSPACES", True
+        )
+        # The max number of plans (tofu applies, builds, releases, etc.) to run at once
+        max_parallel_plans = int(os.getenv("LAUNCHFLOW_MAX_PARALLEL_PLANS", "10"))
+        # Whether remote flow.state files are mirrored to disk between commands
+        state_mirror = get_boolean_variable("LAUNCHFLOW_STATE_MIRROR", True)
+        # The format state and outputs files are written in, either json or yaml
+        state_format = os.getenv("LAUNCHFLOW_STATE_FORMAT", "json").lower()
+        # Whether resource outputs are packaged with services when they are built, and
+        # used to seed the outputs cache when the service is running
+        runtime_manifest = get_boolean_variable("LAUNCHFLOW_RUNTIME_MANIFEST", True)
+        # Overrides where deployed services look for their runtime manifest
+        runtime_manifest_path = os.getenv("LAUNCHFLOW_RUNTIME_MANIFEST_PATH", None)
+        # How many seconds cached resource outputs are used before they are refreshed
+        # in the background, 0 means they are never refreshed
+        outputs_cache_ttl: Optional[float] = float(
+            os.getenv("LAUNCHFLOW_OUTPUTS_CACHE_TTL", "300")
+        )
+        if outputs_cache_ttl is not None and outputs_cache_ttl <= 0:
+            outputs_cache_ttl = None
+        outputs_cache_max_entries = int(
+            os.getenv("LAUNCHFLOW_OUTPUTS_CACHE_MAX_ENTRIES", "1024")
+        )
+        # The gzip level (1-9) source tarballs are compressed with before remote builds
+        build_compression_level = int(
+            os.getenv("LAUNCHFLOW_BUILD_COMPRESSION_LEVEL", "6")
+        )
+        # Whether remote builds reuse source tarballs and images that were already
+        # built from identical source trees
+        source_cache = get_boolean_variable("LAUNCHFLOW_SOURCE_CACHE", True)
+        # Comma separated ignore files, like .gitignore or .dockerignore, in build
+        # directories whose patterns are excluded from packaged source
+        build_ignore_files = [
+            f.strip()
+            for f in os.getenv("LAUNCHFLOW_BUILD_IGNORE_FILES", "").split(",")
+            if f.strip()
+        ]
 
         return cls(
             tofu_path=tofu_path,
+            tofu_cache_dir=tofu_cache_dir,
+            reuse_tofu_workspaces=reuse_tofu_workspaces,
+            max_parallel_plans=max_parallel_plans,
+            state_mirror=state_mirror,
+            state_format=state_format,
+            runtime_manifest=runtime_manifest,
+            runtime_manifest_path=runtime_manifest_path,
+            outputs_cache_ttl=outputs_cache_ttl,
+            outputs_cache_max_entries=outputs_cache_max_entries,
+            build_compression_level=build_compression_level,
+            source_cache=source_cache,
+            build_ignore_files=build_ignore_files,
             project=project,
             cloud_provider=cloud_provider,
             environment=environment,
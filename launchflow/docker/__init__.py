@@ -1,3 +1,27 @@
 # ruff: noqa
-from .postgres import DockerPostgres
-from .redis import DockerRedis
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .postgres import DockerPostgres
+    from .redis import DockerRedis
+
+# Maps each exported name to the submodule that defines it. Submodules are only
+# imported when one of their names is first accessed.
+_LAZY_ATTRIBUTES = {
+    "DockerPostgres": "postgres",
+    "DockerRedis": "redis",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_LAZY_ATTRIBUTES[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
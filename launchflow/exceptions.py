@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from launchflow.utils import get_failure_text
 
@@ -473,6 +473,12 @@ class FailedToLockPlans(Exception):
         super().__init__(f"Failed to lock one or more plans: {exceptions_list}")
 
 
+class PlanDependencyCycle(Exception):
+    def __init__(self, cycle: List[Any]) -> None:
+        cycle_str = " -> ".join(str(plan) for plan in cycle)
+        super().__init__(f"Plans have a circular dependency: {cycle_str}")
+
+
 class GCPDockerPullFailed(Exception):
     def __init__(self, service_account_email: Optional[str], docker_image: str) -> None:
         split_image = docker_image.split("/")
@@ -543,3 +549,21 @@ class S3ObjectNotFound(Exception):
 class NixPacksBuildFailed(Exception):
     def __init__(self, service_name: str) -> None:
         super().__init__(f"NixPacks build failed for service '{service_name}'")
+
+
+class SQSSendMessagesFailed(Exception):
+    def __init__(self, queue_url: str, failed: List[Dict[str, Any]]) -> None:
+        super().__init__(
+            f"Failed to send {len(failed)} message(s) to SQS queue '{queue_url}': "
+            f"{failed[0].get('Code')}: {failed[0].get('Message')}"
+        )
+        self.failed = failed
+
+
+class BigQueryInsertFailed(Exception):
+    def __init__(self, table_id: str, errors: List[Dict[str, Any]]) -> None:
+        super().__init__(
+            f"Failed to insert {len(errors)} row(s) into BigQuery table '{table_id}': "
+            f"{errors[0].get('errors')}"
+        )
+        self.errors = errors
@@ -42,7 +42,10 @@ from launchflow.flows.plan import (
 from launchflow.flows.plan_utils import lock_plans, print_plans, select_plans
 from launchflow.locks import Lock, LockOperation, OperationType, ReleaseReason
 from launchflow.logger import logger
-from launchflow.managers.environment_manager import EnvironmentManager
+from launchflow.managers.environment_manager import (
+    EnvironmentManager,
+    EnvironmentSnapshot,
+)
 from launchflow.managers.resource_manager import ResourceManager
 from launchflow.managers.service_manager import ServiceManager
 from launchflow.models.enums import (
@@ -770,6 +773,7 @@ async def plan_create_resource(
     environment_state: EnvironmentState,
     environment_manager: EnvironmentManager,
     verbose: bool,
+    environment_snapshot: Optional[EnvironmentSnapshot] = None,
 ) -> Union[CreateResourcePlan, FailedToPlan]:
     try:
         validate_resource_name(resource.name)
@@ -805,7 +809,12 @@ async def plan_create_resource(
     else:
         resource_manager = environment_manager.create_resource_manager(resource.name)  # type: ignore
     try:
-        existing_resource_state = await resource_manager.load_resource()
+        if environment_snapshot is not None and not isinstance(
+            resource, DockerResource
+        ):
+            existing_resource_state = environment_snapshot.get_resource(resource.name)
+        else:
+            existing_resource_state = await resource_manager.load_resource()
     except exceptions.ResourceNotFound:
         existing_resource_state = None
 
@@ -846,7 +855,10 @@ async def plan_create_resources(
     environment_manager: EnvironmentManager,
     verbose: bool,
     parent_resource_plans: Dict[str, CreateResourcePlan] = {},
+    environment_snapshot: Optional[EnvironmentSnapshot] = None,
 ) -> List[Union[CreateResourcePlan, FailedToPlan]]:
+    if environment_snapshot is None:
+        environment_snapshot = await environment_manager.load_snapshot()
     plan_tasks = []
     for resource in resources:
         plan_tasks.append(
@@ -855,6 +867,7 @@ async def plan_create_resources(
                 environment_state=environment_state,
                 environment_manager=environment_manager,
                 verbose=verbose,
+                environment_snapshot=environment_snapshot,
             )
         )
     resource_plans: List[
@@ -879,11 +892,10 @@ async def plan_create_resources(
                 resource_dependency.name not in resource_name_to_plan
                 and resource_dependency.name not in parent_resource_plans
             ):
-                resource_manager = environment_manager.create_resource_manager(
-                    resource_dependency.name
-                )
                 try:
-                    remote_resource = await resource_manager.load_resource()
+                    remote_resource = environment_snapshot.get_resource(
+                        resource_dependency.name
+                    )
                     if remote_resource.product != resource_dependency.product:
                         return FailedToPlan(
                             resource=plan.resource,
@@ -941,6 +953,7 @@ async def plan_create_service(
     environment_manager: EnvironmentManager,
     verbose: bool,
     parent_resource_plans: Dict[str, CreateResourcePlan],
+    environment_snapshot: Optional[EnvironmentSnapshot] = None,
 ) -> Union[CreateServicePlan, FailedToPlan]:
     try:
         validate_service_name(service.name)
@@ -965,7 +978,10 @@ async def plan_create_service(
 
     service_manager = environment_manager.create_service_manager(service.name)
     try:
-        existing_service = await service_manager.load_service()
+        if environment_snapshot is not None:
+            existing_service = environment_snapshot.get_service(service.name)
+        else:
+            existing_service = await service_manager.load_service()
     except exceptions.ServiceNotFound:
         existing_service = None
 
@@ -993,6 +1009,7 @@ async def plan_create_service(
         environment_manager=environment_manager,
         verbose=verbose,
         parent_resource_plans=parent_resource_plans,
+        environment_snapshot=environment_snapshot,
     )
     failed_resource_plans = [
         plan for plan in resource_plans if isinstance(plan, FailedToPlan)
@@ -1020,7 +1037,10 @@ async def plan_create_services(
     environment_manager: EnvironmentManager,
     verbose: bool,
     parent_resource_plans: Dict[str, CreateResourcePlan],
+    environment_snapshot: Optional[EnvironmentSnapshot] = None,
 ) -> List[Union[CreateResourcePlan, FailedToPlan]]:
+    if environment_snapshot is None:
+        environment_snapshot = await environment_manager.load_snapshot()
     plan_tasks = []
     for service in services:
         plan_tasks.append(
@@ -1030,6 +1050,7 @@ async def plan_create_services(
                 environment_manager=environment_manager,
                 verbose=verbose,
                 parent_resource_plans=parent_resource_plans,
+                environment_snapshot=environment_snapshot,
             )
         )
     return await asyncio.gather(*plan_tasks)  # type: ignore
@@ -1040,6 +1061,7 @@ async def plan_create(
     environment_state: EnvironmentState,
     environment_manager: EnvironmentManager,
     verbose: bool,
+    environment_snapshot: Optional[EnvironmentSnapshot] = None,
 ) -> List[Union[CreateResourcePlan, CreateServicePlan, FailedToPlan]]:
     resource_nodes: List[Resource] = []
     service_nodes: List[Service] = []
@@ -1051,11 +1073,17 @@ async def plan_create(
         else:
             raise ValueError(f"Unknown node type {node}")
 
+    # NOTE: All state lookups while planning are served from a single snapshot
+    # of the environment instead of loading each resource and service separately
+    if environment_snapshot is None:
+        environment_snapshot = await environment_manager.load_snapshot()
+
     resource_plans = await plan_create_resources(
         *resource_nodes,
         environment_state=environment_state,
         environment_manager=environment_manager,
         verbose=verbose,
+        environment_snapshot=environment_snapshot,
     )
 
     keyed_resource_plans = {
@@ -1070,6 +1098,7 @@ async def plan_create(
         environment_manager=environment_manager,
         verbose=verbose,
         parent_resource_plans=keyed_resource_plans,
+        environment_snapshot=environment_snapshot,
     )
 
     return resource_plans + service_plans  # type: ignore
@@ -5,7 +5,7 @@ import io
 import logging
 import os
 import time
-from typing import Any, List, Literal, Optional, Tuple, Union
+from typing import IO, Any, Dict, List, Literal, Optional, Tuple, Union
 
 import rich
 from rich.console import Console
@@ -19,7 +19,13 @@ from rich.tree import Tree
 import launchflow
 from launchflow import exceptions
 from launchflow.aws.service import AWSService
-from launchflow.cli.resource_utils import is_secret_resource
+from launchflow.cache.launchflow_tmp import build_cache_key
+from launchflow.cache.runtime_manifest import (
+    contains_secret_outputs,
+    remove_staged_runtime_manifest,
+    stage_runtime_manifest,
+)
+from launchflow.cli.resource_utils import is_local_resource, is_secret_resource
 from launchflow.clients.docker_client import docker_service_available
 from launchflow.config import config
 from launchflow.flows.create_flows import (
@@ -49,7 +55,10 @@ from launchflow.flows.plan import (
 from launchflow.flows.plan_utils import lock_plans, print_plans, select_plans
 from launchflow.gcp.service import GCPService
 from launchflow.locks import Lock, LockOperation, OperationType, ReleaseReason
-from launchflow.managers.environment_manager import EnvironmentManager
+from launchflow.managers.environment_manager import (
+    EnvironmentManager,
+    EnvironmentSnapshot,
+)
 from launchflow.managers.service_manager import ServiceManager
 from launchflow.models.enums import CloudProvider, EnvironmentStatus, ServiceStatus
 from launchflow.models.flow_state import EnvironmentState, ServiceState
@@ -73,6 +82,9 @@ class BuildServicePlan(ServicePlan):
     environment_state: EnvironmentState
     deployment_id: str
     build_local: bool = False
+    # Resources whose outputs are written into the service's runtime manifest, in
+    # addition to the service's own resources
+    manifest_resources: List[Resource] = dataclasses.field(default_factory=list)
 
     def __post_init__(self):
         if (
@@ -99,6 +111,61 @@ class BuildServicePlan(ServicePlan):
         result.error_message = f"Build abandoned: {reason}"
         return result
 
+    async def _stage_runtime_manifest(self, build_log_file: IO):
+        project_name = self.service_manager.project_name
+        environment_name = self.service_manager.environment_name
+        resources: Dict[Tuple[str, str], Resource] = {}
+        try:
+            service_resources = self.service.resources()
+        except NotImplementedError:
+            service_resources = []
+        for resource in [*self.manifest_resources, *service_resources]:
+            # Local resources aren't reachable from deployed services
+            if not is_local_resource(resource):
+                resources[(resource.product, resource.name)] = resource
+
+        async def resolve_outputs(resource: Resource):
+            try:
+                return await resource.outputs_async(
+                    project=project_name,
+                    environment=environment_name,
+                    use_cache=False,
+                )
+            except Exception as e:
+                # The service will fetch these outputs at runtime instead
+                build_log_file.write(
+                    f"Skipping {resource} in the runtime manifest: {e}\n"
+                )
+                return None
+
+        all_outputs = await asyncio.gather(
+            *[resolve_outputs(resource) for resource in resources.values()]
+        )
+        resource_outputs = {}
+        for resource, outputs in zip(resources.values(), all_outputs):
+            if outputs is None:
+                continue
+            outputs_dict = outputs.to_dict()
+            # Secrets are never packaged with the service, it fetches these outputs
+            # at runtime instead
+            if contains_secret_outputs(outputs_dict):
+                build_log_file.write(
+                    f"Skipping {resource} in the runtime manifest: its outputs "
+                    "contain secrets\n"
+                )
+                continue
+            key = build_cache_key(
+                project_name, environment_name, resource.product, resource.name
+            )
+            resource_outputs[key] = outputs_dict
+        stage_runtime_manifest(
+            self.service.build_directory, self.deployment_id, resource_outputs
+        )
+        build_log_file.write(
+            f"Staged outputs of {len(resource_outputs)} resources in the runtime "
+            "manifest\n"
+        )
+
     async def execute_plan(
         self,
         tree: Tree,
@@ -112,6 +179,13 @@ class BuildServicePlan(ServicePlan):
             f"{base_logging_dir}/{self.service.name}-{int(time.time())}.log"
         )
         with open(build_logs_file, "w") as build_log_file:
+            if config.env.runtime_manifest:
+                try:
+                    await self._stage_runtime_manifest(build_log_file)
+                except OSError as e:
+                    # The service still works without a manifest, it just fetches
+                    # its resource outputs at runtime
+                    build_log_file.write(f"Failed to stage runtime manifest: {e}\n")
             try:
                 release_inputs = await self.service.build(
                     environment_state=self.environment_state,
@@ -131,6 +205,11 @@ class BuildServicePlan(ServicePlan):
                 )
                 result.error_message = str(e)
                 return result
+            finally:
+                # The manifest is only needed while the service is packaged
+                remove_staged_runtime_manifest(
+                    self.service.build_directory, self.deployment_id
+                )
         return BuildServiceResult(
             self, True, build_logs_file=build_logs_file, release_inputs=release_inputs
         )
@@ -562,6 +641,8 @@ async def plan_deploy_service(
     verbose: bool,
     build_local: bool,
     skip_build: bool,
+    environment_snapshot: Optional[EnvironmentSnapshot] = None,
+    manifest_resources: Optional[List[Resource]] = None,
 ) -> Union[DeployServicePlan, FailedToPlan]:
     try:
         validate_service_name(service.name)
@@ -586,7 +667,10 @@ async def plan_deploy_service(
 
     service_manager = environment_manager.create_service_manager(service.name)
     try:
-        existing_service = await service_manager.load_service()
+        if environment_snapshot is not None:
+            existing_service = environment_snapshot.get_service(service.name)
+        else:
+            existing_service = await service_manager.load_service()
     except exceptions.ServiceNotFound:
         existing_service = None
 
@@ -615,6 +699,7 @@ async def plan_deploy_service(
             depends_on=[],
             verbose=verbose,
             build_local=build_local,
+            manifest_resources=manifest_resources or [],
         )
     else:
         if existing_service is None:
@@ -674,6 +759,10 @@ async def plan_deploy(
         else:
             raise ValueError(f"Unknown node type {node}")
 
+    # NOTE: All state lookups while planning are served from a single snapshot
+    # of the environment instead of loading each resource and service separately
+    environment_snapshot = await environment_manager.load_snapshot()
+
     create_plans = []
     if not skip_create:
         create_plans = await plan_create(
@@ -682,6 +771,7 @@ async def plan_deploy(
             environment_state=environment_state,
             environment_manager=environment_manager,
             verbose=verbose,
+            environment_snapshot=environment_snapshot,
         )
 
     deploy_service_plans = await asyncio.gather(
@@ -693,6 +783,8 @@ async def plan_deploy(
                 verbose=verbose,
                 build_local=build_local,
                 skip_build=skip_build,
+                environment_snapshot=environment_snapshot,
+                manifest_resources=resource_nodes,
             )
             for service in service_nodes
         ]
@@ -712,6 +804,7 @@ async def plan_deploy(
                     environment_manager=environment_manager,
                     verbose=verbose,
                     parent_resource_plans={},
+                    environment_snapshot=environment_snapshot,
                 )
                 for service in service_nodes
             ]
@@ -1,19 +1,28 @@
 import asyncio
+import time
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Dict, Generic, List, Optional, TypeVar, Union
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar, Union
 
 import rich
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Column
 from rich.tree import Tree
 
+from launchflow.cache.launchflow_tmp import load_launchflow_cache
 from launchflow.flows.flow_utils import ResourceRef, ServiceRef
+from launchflow.flows.plan_dag import PlanDAG
+from launchflow.flows.plan_scheduler import PlanScheduler, current_scheduler
 from launchflow.locks import Lock
+from launchflow.logger import logger
 from launchflow.resource import Resource
 from launchflow.service import Service
 
 T = TypeVar("T", bound="Plan")
 
+# Plans faster than this don't affect scheduling so we don't record them
+_MIN_RECORDED_PLAN_SECONDS = 1.0
+
 
 @dataclass
 class Result(Generic[T]):
@@ -128,103 +137,168 @@ class ServicePlan(Plan):
 class _ExecutePlanNode:
     plan: Plan
     tree: Tree
+    # Higher priority plans are given execution slots first
+    priority: int = 0
     execute_task: Optional[asyncio.Task] = field(default=None, init=False)
 
 
-# This is a global context for all plans that have been executed so far
-# This is used so we don't start the same plan multiple times
-_ALL_PLAN_NODES: Dict[str, _ExecutePlanNode] = {}
-
-
-async def execute_plans(plans: List[Plan], tree: Tree) -> List[Result]:
-    # We keep a global context of plans that are / have been executed to ensure
-    # multiple calls to execute plans don't start the same plan multiple times
-    global _ALL_PLAN_NODES
-
-    plan_nodes = [_ExecutePlanNode(plan, tree) for plan in plans]
-    for node in plan_nodes:
-        _ALL_PLAN_NODES[node.plan.id] = node
-
-    async def _execute_with_dependencies(dependency: _ExecutePlanNode) -> Result:
-        if (
-            dependency.plan.id in _ALL_PLAN_NODES
-            and _ALL_PLAN_NODES[dependency.plan.id].execute_task is not None
-        ):
-            # The task has already been started so we don't need to go down the chain
-            execute_task = _ALL_PLAN_NODES[dependency.plan.id].execute_task
-            return await execute_task  # type: ignore
-
-        async def task():
-            # SETUP
-            dependency_tasks: List[asyncio.Task] = []
-            spinner_column = SpinnerColumn(finished_text="[green]✓[/green]")
-            progress = Progress(
-                spinner_column,
-                TextColumn("{task.description}", table_column=Column(overflow="fold")),
-                TimeElapsedColumn(),
+@dataclass
+class _PlanExecution:
+    """State shared by all (possibly nested) execute_plans calls of a flow."""
+
+    scheduler: PlanScheduler
+    # All plans that are / have been executed by this flow, keyed by the identity
+    # of the plan. This is used so we don't start the same plan multiple times.
+    # NOTE: Plan ids aren't used since a service and one of its child plans can
+    # share an id (e.g. a GKE service and its container).
+    nodes: Dict[int, _ExecutePlanNode] = field(default_factory=dict)
+    # How long each leaf plan took to execute, keyed by (operation, product)
+    durations: Dict[Tuple[str, str], float] = field(default_factory=dict)
+
+
+_current_execution: ContextVar[Optional[_PlanExecution]] = ContextVar(
+    "current_plan_execution", default=None
+)
+
+
+async def execute_plans(
+    plans: List[Plan], tree: Tree, scheduler: Optional[PlanScheduler] = None
+) -> List[Result]:
+    # NOTE: Plans can call execute_plans for their child plans, in which case the
+    # nested call shares the execution state of the outer call. This lets child
+    # plans depend on plans that are executed by the parent flow.
+    execution = _current_execution.get()
+    if execution is not None:
+        return await _execute_plans(plans, tree, execution)
+
+    execution = _PlanExecution(scheduler=scheduler or PlanScheduler())
+    execution_token = _current_execution.set(execution)
+    scheduler_token = current_scheduler.set(execution.scheduler)
+    try:
+        return await _execute_plans(plans, tree, execution)
+    finally:
+        current_scheduler.reset(scheduler_token)
+        _current_execution.reset(execution_token)
+        try:
+            load_launchflow_cache().record_plan_durations(execution.durations)
+        except Exception as e:
+            logger.debug("Failed to record plan durations: %s", e, exc_info=True)
+
+
+async def _execute_plans(
+    plans: List[Plan], tree: Tree, execution: _PlanExecution
+) -> List[Result]:
+    dag = PlanDAG.build(plans)
+    nodes = execution.nodes
+    plan_nodes: Dict[str, _ExecutePlanNode] = {}
+    for plan in dag.plans:
+        existing = nodes.get(id(plan))
+        if existing is not None:
+            # The plan was already added by another execute_plans call
+            plan_nodes[plan.id] = existing
+            continue
+        node = _ExecutePlanNode(
+            plan, tree, priority=int(dag.remaining_seconds[plan.id])
+        )
+        plan_nodes[plan.id] = node
+        nodes[id(plan)] = node
+
+    def _dependency_node(dep: Plan) -> Optional[_ExecutePlanNode]:
+        node = nodes.get(id(dep))
+        if node is None:
+            node = plan_nodes.get(dep.id)
+        return node
+
+    def _start(node: _ExecutePlanNode) -> asyncio.Task:
+        if node.execute_task is None:
+            node.execute_task = asyncio.create_task(_execute_node(node))
+        return node.execute_task
+
+    async def _execute_node(node: _ExecutePlanNode) -> Result:
+        # SETUP
+        spinner_column = SpinnerColumn(finished_text="[green]✓[/green]")
+        progress = Progress(
+            spinner_column,
+            TextColumn("{task.description}", table_column=Column(overflow="fold")),
+            TimeElapsedColumn(),
+        )
+        subtree = node.tree.add(progress)
+        task_id = progress.add_task(node.plan.pending_message(), start=False, total=1)
+
+        # PENDING
+        dependency_nodes = [_dependency_node(dep) for dep in node.plan.depends_on]
+        missing_dependencies = [
+            dep
+            for dep, dep_node in zip(node.plan.depends_on, dependency_nodes)
+            if dep_node is None
+        ]
+        if missing_dependencies:
+            dep = missing_dependencies[0]
+            progress.start_task(task_id)
+            spinner_column.finished_text = "[yellow]⚠[/yellow]"  # type: ignore
+            progress.update(
+                task_id,
+                description=f"{node.plan} canceled due to missing dependency: {dep}",
+                completed=1,
             )
-            subtree = dependency.tree.add(progress)
-            task_id = progress.add_task(
-                dependency.plan.pending_message(), start=False, total=1
+            progress.stop_task(task_id)
+            return await node.plan.abandon_plan(f"Missing dependency: {dep}")
+
+        # CHECK DEPENDENCY RESULTS
+        dependency_results: List[Result] = await asyncio.gather(
+            *[_start(dep_node) for dep_node in dependency_nodes]  # type: ignore
+        )
+        if not all(result.success for result in dependency_results):
+            progress.start_task(task_id)
+            spinner_column.finished_text = "[yellow]⚠[/yellow]"  # type: ignore
+            progress.update(
+                task_id,
+                description=f"{node.plan} canceled due to dependency failure",
+                completed=1,
             )
+            progress.stop_task(task_id)
+            return await node.plan.abandon_plan("Dependency failure")
 
-            # PENDING
-            for dep in dependency.plan.depends_on:
-                if dep.id not in _ALL_PLAN_NODES:
-                    progress.start_task(task_id)
-                    spinner_column.finished_text = "[yellow]⚠[/yellow]"  # type: ignore
-                    progress.update(
-                        task_id,
-                        description=f"{dependency.plan} canceled due to missing dependency: {dep}",
-                        completed=1,
+        # EXECUTE PLAN
+        if node.plan.child_plans():
+            # NOTE: Plans with child plans don't take an execution slot since
+            # their children need slots to make progress.
+            progress.start_task(task_id)
+            progress.update(task_id, description=node.plan.task_message())
+            result = await node.plan.execute_plan(subtree, dependency_results)
+        else:
+            async with execution.scheduler.slot(node.plan, node.priority):
+                progress.start_task(task_id)
+                progress.update(task_id, description=node.plan.task_message())
+                start_time = time.monotonic()
+                result = await node.plan.execute_plan(subtree, dependency_results)
+                duration = time.monotonic() - start_time
+                if result.success and duration >= _MIN_RECORDED_PLAN_SECONDS:
+                    key = (
+                        node.plan.operation_type,
+                        node.plan.resource_or_service.product,
                     )
-                    progress.stop_task(task_id)
-                    for dep_task in dependency_tasks:
-                        dep_task.cancel()
+                    execution.durations[key] = duration
+        if not result.success:
+            spinner_column.finished_text = "[red]✗[/red]"  # type: ignore
+            failure_message = f"{node.plan} failed"
+            if result.error_message:
+                failure_message += f": {result.error_message}"
+            progress.update(task_id, description=failure_message, completed=1)
+        else:
+            progress.update(
+                task_id, description=node.plan.success_message(), completed=1
+            )
 
-                    return await dependency.plan.abandon_plan(
-                        f"Missing dependency: {dep}"
-                    )
+        # DONE
+        return result
 
-                dep_node = _ALL_PLAN_NODES[dep.id]
-                dep_task = asyncio.create_task(_execute_with_dependencies(dep_node))
-                dependency_tasks.append(dep_task)
+    # NOTE: Plans are started wave by wave, longest remaining path first, so long
+    # running plans (e.g. databases and clusters) get going as early as possible.
+    # Each plan only waits on its own dependencies, not on the whole prior wave.
+    for wave in dag.waves():
+        for plan in wave:
+            _start(plan_nodes[plan.id])
 
-            # CHECK DEPENDENCY RESULTS
-            dependency_results: List[Result] = await asyncio.gather(*dependency_tasks)
-            if not all(result.success for result in dependency_results):
-                progress.start_task(task_id)
-                spinner_column.finished_text = "[yellow]⚠[/yellow]"  # type: ignore
-                progress.update(
-                    task_id,
-                    description=f"{dependency.plan} canceled due to dependency failure",
-                    completed=1,
-                )
-                progress.stop_task(task_id)
-                return await dependency.plan.abandon_plan("Dependency failure")
-
-            # EXECUTE PLAN
-            progress.start_task(task_id)
-            progress.update(task_id, description=dependency.plan.task_message())
-            result = await dependency.plan.execute_plan(subtree, dependency_results)
-            if not result.success:
-                spinner_column.finished_text = "[red]✗[/red]"  # type: ignore
-                failure_message = f"{dependency.plan} failed"
-                if result.error_message:
-                    failure_message += f": {result.error_message}"
-                progress.update(task_id, description=failure_message, completed=1)
-            else:
-                progress.update(
-                    task_id, description=dependency.plan.success_message(), completed=1
-                )
-
-            # DONE
-            return result
-
-        _ALL_PLAN_NODES[dependency.plan.id].execute_task = asyncio.create_task(task())
-        return await _ALL_PLAN_NODES[dependency.plan.id].execute_task  # type: ignore
-
-    results = await asyncio.gather(
-        *[_execute_with_dependencies(node) for node in plan_nodes]
-    )
-    return results
+    # NOTE: Results are returned in the same order as the plans are passed in
+    return await asyncio.gather(*[_start(plan_nodes[plan.id]) for plan in plans])
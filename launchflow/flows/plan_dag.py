@@ -0,0 +1,173 @@
+import dataclasses
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from launchflow import exceptions
+from launchflow.cache.launchflow_tmp import load_launchflow_cache
+from launchflow.models.enums import ResourceProduct, ServiceProduct
+
+if TYPE_CHECKING:
+    from launchflow.flows.plan import Plan
+
+# Rough estimates (in seconds) of how long it takes to create a resource. These
+# are only used until we have recorded how long the plan took on this machine.
+_DEFAULT_DURATION_ESTIMATES: Dict[str, float] = {
+    ResourceProduct.GCP_SQL_POSTGRES.value: 900,
+    ResourceProduct.GCP_GKE_CLUSTER.value: 600,
+    ResourceProduct.GCP_GKE_NODE_POOL.value: 300,
+    ResourceProduct.GCP_MEMORYSTORE_REDIS.value: 600,
+    ResourceProduct.GCP_MANAGED_SSL_CERTIFICATE.value: 300,
+    ResourceProduct.GCP_WORKBENCH_INSTANCE.value: 300,
+    ResourceProduct.AWS_RDS_POSTGRES.value: 600,
+    ResourceProduct.AWS_RDS.value: 600,
+    ResourceProduct.AWS_ELASTICACHE_REDIS.value: 600,
+    ResourceProduct.AWS_NAT_GATEWAY.value: 180,
+    ResourceProduct.AWS_ACM_CERTIFICATE.value: 180,
+    ServiceProduct.GCP_CLOUD_RUN.value: 120,
+    ServiceProduct.AWS_ECS_FARGATE.value: 180,
+}
+_DEFAULT_DURATION_ESTIMATE = 30.0
+
+
+def estimate_plan_duration(plan: "Plan") -> float:
+    """Estimates how many seconds a plan will take to execute.
+
+    Recorded durations from previous runs are preferred over the defaults.
+    """
+    child_plans = plan.child_plans()
+    if child_plans:
+        # Child plans mostly run in parallel
+        return max(estimate_plan_duration(child) for child in child_plans)
+    product = plan.resource_or_service.product
+    recorded = load_launchflow_cache().get_plan_duration(plan.operation_type, product)
+    if recorded is not None:
+        return recorded
+    return _DEFAULT_DURATION_ESTIMATES.get(product, _DEFAULT_DURATION_ESTIMATE)
+
+
+@dataclasses.dataclass
+class PlanDAG:
+    """The dependency graph of a set of plans.
+
+    Only dependencies between the given plans are edges in the graph, plans can
+    still depend on plans outside of the graph (i.e. plans of a parent flow).
+    """
+
+    # The plans in topological order, within a level the plans with the longest
+    # remaining path come first
+    plans: List["Plan"]
+    dependencies: Dict[str, List["Plan"]]
+    dependents: Dict[str, List["Plan"]]
+    # The number of dependency edges between the plan and a plan with no
+    # dependencies in the graph
+    levels: Dict[str, int]
+    # The estimated seconds between a plan starting and the end of the longest
+    # chain of plans that depend on it
+    remaining_seconds: Dict[str, float]
+
+    @classmethod
+    def build(
+        cls,
+        plans: List["Plan"],
+        estimate_duration: Callable[["Plan"], float] = estimate_plan_duration,
+    ) -> "PlanDAG":
+        plans_by_id = {plan.id: plan for plan in plans}
+        dependencies: Dict[str, List["Plan"]] = {plan.id: [] for plan in plans}
+        dependents: Dict[str, List["Plan"]] = {plan.id: [] for plan in plans}
+        for plan in plans:
+            for dep in plan.depends_on:
+                if dep.id in plans_by_id:
+                    dependencies[plan.id].append(plans_by_id[dep.id])
+                    dependents[dep.id].append(plan)
+
+        # Kahn's algorithm, anything left over is part of (or blocked by) a cycle
+        in_degree = {plan.id: len(dependencies[plan.id]) for plan in plans}
+        levels: Dict[str, int] = {}
+        ordered: List["Plan"] = []
+        current = [plan for plan in plans if in_degree[plan.id] == 0]
+        level = 0
+        while current:
+            next_level = []
+            for plan in current:
+                levels[plan.id] = level
+                ordered.append(plan)
+                for dependent in dependents[plan.id]:
+                    in_degree[dependent.id] -= 1
+                    if in_degree[dependent.id] == 0:
+                        next_level.append(dependent)
+            current = next_level
+            level += 1
+        if len(ordered) != len(plans):
+            raise exceptions.PlanDependencyCycle(
+                _find_cycle([plan for plan in plans if plan.id not in levels])
+            )
+
+        remaining_seconds: Dict[str, float] = {}
+        for plan in reversed(ordered):
+            remaining_seconds[plan.id] = estimate_duration(plan) + max(
+                (remaining_seconds[dependent.id] for dependent in dependents[plan.id]),
+                default=0,
+            )
+
+        # NOTE: Estimates are compared in whole seconds so plans with similar
+        # estimates keep the order they were passed in
+        ordered.sort(
+            key=lambda plan: (levels[plan.id], -int(remaining_seconds[plan.id]))
+        )
+        return cls(
+            plans=ordered,
+            dependencies=dependencies,
+            dependents=dependents,
+            levels=levels,
+            remaining_seconds=remaining_seconds,
+        )
+
+    def waves(self) -> List[List["Plan"]]:
+        """Groups the plans by level, each wave only depends on earlier waves."""
+        waves: List[List["Plan"]] = []
+        for plan in self.plans:
+            level = self.levels[plan.id]
+            if level == len(waves):
+                waves.append([])
+            waves[level].append(plan)
+        return waves
+
+    def critical_path(self) -> List["Plan"]:
+        """Returns the chain of plans with the longest estimated duration."""
+        path: List["Plan"] = []
+        candidates = [plan for plan in self.plans if self.levels[plan.id] == 0]
+        while candidates:
+            plan = max(candidates, key=lambda p: self.remaining_seconds[p.id])
+            path.append(plan)
+            candidates = self.dependents[plan.id]
+        return path
+
+
+def _find_cycle(plans: List["Plan"]) -> List["Plan"]:
+    plans_by_id = {plan.id: plan for plan in plans}
+    visiting: Dict[str, int] = {}
+    stack: List["Plan"] = []
+
+    def _visit(plan: "Plan") -> Optional[List["Plan"]]:
+        visiting[plan.id] = len(stack)
+        stack.append(plan)
+        for dep in plan.depends_on:
+            if dep.id not in plans_by_id:
+                continue
+            if dep.id in visiting:
+                if visiting[dep.id] >= 0:
+                    return stack[visiting[dep.id] :] + [plans_by_id[dep.id]]
+                continue
+            cycle = _visit(plans_by_id[dep.id])
+            if cycle is not None:
+                return cycle
+        stack.pop()
+        # Mark as fully explored
+        visiting[plan.id] = -1
+        return None
+
+    for plan in plans:
+        if plan.id not in visiting:
+            cycle = _visit(plan)
+            if cycle is not None:
+                return cycle
+    return plans
@@ -0,0 +1,120 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Tuple
+
+from launchflow.config import config
+
+if TYPE_CHECKING:
+    from launchflow.flows.plan import Plan
+
+# The max number of plans that can execute at once against a single provider.
+# These are intentionally below the per-project API quotas of each provider so a
+# large environment doesn't trigger rate limit errors.
+DEFAULT_PROVIDER_LIMITS: Dict[str, int] = {
+    "gcp": 8,
+    "aws": 8,
+    "kubernetes": 4,
+    "docker": 2,
+}
+
+
+def plan_provider(plan: "Plan") -> str:
+    """Returns the provider group used for rate limiting a plan."""
+    product = plan.resource_or_service.product
+    if product.startswith("kubernetes"):
+        return "kubernetes"
+    if product.startswith("local_docker"):
+        return "docker"
+    return plan.resource_or_service.cloud_provider().value
+
+
+class PrioritySemaphore:
+    """An asyncio semaphore that wakes up the highest priority waiter first."""
+
+    def __init__(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("Semaphore value must be at least 1")
+        self._value = value
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    def locked(self) -> bool:
+        return self._value == 0
+
+    async def acquire(self, priority: int = 0) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        # NOTE: heapq is a min heap so we negate the priority
+        heapq.heappush(self._waiters, (-priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed to us right before we were cancelled
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+
+class PlanScheduler:
+    """Limits how many plans execute concurrently.
+
+    Plans acquire a slot from their provider's semaphore and then from the global
+    semaphore. Waiting plans are woken up in priority order, which lets plans on
+    the critical path of the dependency graph start first.
+    """
+
+    def __init__(
+        self,
+        max_parallelism: Optional[int] = None,
+        provider_limits: Optional[Dict[str, int]] = None,
+    ) -> None:
+        if max_parallelism is None:
+            max_parallelism = config.env.max_parallel_plans
+        if provider_limits is None:
+            provider_limits = DEFAULT_PROVIDER_LIMITS
+        self.max_parallelism = max_parallelism
+        self._global = PrioritySemaphore(max_parallelism)
+        self._provider_limits = provider_limits
+        self._providers: Dict[str, PrioritySemaphore] = {}
+
+    def _provider_semaphore(self, provider: str) -> PrioritySemaphore:
+        if provider not in self._providers:
+            limit = self._provider_limits.get(provider, self.max_parallelism)
+            self._providers[provider] = PrioritySemaphore(
+                min(limit, self.max_parallelism)
+            )
+        return self._providers[provider]
+
+    @contextlib.asynccontextmanager
+    async def slot(self, plan: "Plan", priority: int = 0) -> AsyncIterator[None]:
+        # NOTE: We acquire the provider slot first so a plan waiting on a busy
+        # provider never holds a global slot that another provider could use.
+        provider_semaphore = self._provider_semaphore(plan_provider(plan))
+        await provider_semaphore.acquire(priority)
+        try:
+            await self._global.acquire(priority)
+            try:
+                yield
+            finally:
+                self._global.release()
+        finally:
+            provider_semaphore.release()
+
+
+# The scheduler shared by all (possibly nested) execute_plans calls of a flow
+current_scheduler: ContextVar[Optional[PlanScheduler]] = ContextVar(
+    "current_scheduler", default=None
+)
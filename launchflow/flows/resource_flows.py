@@ -346,12 +346,13 @@ async def destroy(
             )
 
         if not local_only:
-            environment = await environment_manager.load_environment()
-            remote_resources = await environment_manager.list_resources()
-            remote_services = await environment_manager.list_services()
+            environment, snapshot = await asyncio.gather(
+                environment_manager.load_environment(),
+                environment_manager.load_snapshot(),
+            )
             # TODO: handle the case where local and remote resources share the same name
-            resources.update(remote_resources)
-            services.update(remote_services)
+            resources.update(snapshot.resources)
+            services.update(snapshot.services)
 
         # If nodes are provided, filter for them. If none are provided, we destroy everything
         if nodes:
@@ -1,32 +1,91 @@
 # ruff: noqa
-from .artifact_registry_repository import ArtifactRegistryRepository
-from .bigquery import BigQueryDataset
-from .cloud_run import CloudRunService
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .artifact_registry_repository import ArtifactRegistryRepository
+    from .bigquery import BigQueryDataset
+    from .cloud_run import CloudRunService
+
+    CloudRun = CloudRunService
+    from .cloud_run_container import CloudRunServiceContainer
+    from .cloud_tasks import CloudTasksQueue
+    from .cloudsql import CloudSQLDatabase, CloudSQLPostgres, CloudSQLUser
+    from .compute_engine import ComputeEnginePostgres, ComputeEngineRedis
+    from .compute_engine_service import ComputeEngineService
+    from .custom_domain_mapping import CustomDomainMapping
+    from .firebase import FirebaseHostingSite, FirebaseProject
+    from .firebase_site import FirebaseStaticSite
+    from .gcs import BackendBucket, GCSBucket
+    from .gke import GKECluster, NodePool
+    from .gke_service import GKEService
+    from .http_health_check import HttpHealthCheck
+    from .launchflow_cloud_releaser import LaunchFlowCloudReleaser
+    from .memorystore import MemorystoreRedis
+    from .networking import FirewallAllowRule
+    from .pubsub import PubsubSubscription, PubsubTopic
+    from .regional_autoscaler import RegionalAutoscaler
+    from .regional_managed_instance_group import RegionalManagedInstanceGroup
+    from .resource import GCPResource
+    from .secret_manager import SecretManagerSecret
+    from .static_site import GCSWebsite
+    from .utils import get_service_account_credentials
+    from .workbench import WorkbenchInstance
+
+# Maps each exported name to the submodule that defines it. Submodules are only
+# imported when one of their names is first accessed.
+_LAZY_ATTRIBUTES = {
+    "ArtifactRegistryRepository": "artifact_registry_repository",
+    "BigQueryDataset": "bigquery",
+    "CloudRunService": "cloud_run",
+    "CloudRunServiceContainer": "cloud_run_container",
+    "CloudTasksQueue": "cloud_tasks",
+    "CloudSQLDatabase": "cloudsql",
+    "CloudSQLPostgres": "cloudsql",
+    "CloudSQLUser": "cloudsql",
+    "ComputeEnginePostgres": "compute_engine",
+    "ComputeEngineRedis": "compute_engine",
+    "ComputeEngineService": "compute_engine_service",
+    "CustomDomainMapping": "custom_domain_mapping",
+    "FirebaseHostingSite": "firebase",
+    "FirebaseProject": "firebase",
+    "FirebaseStaticSite": "firebase_site",
+    "BackendBucket": "gcs",
+    "GCSBucket": "gcs",
+    "GKECluster": "gke",
+    "NodePool": "gke",
+    "GKEService": "gke_service",
+    "HttpHealthCheck": "http_health_check",
+    "LaunchFlowCloudReleaser": "launchflow_cloud_releaser",
+    "MemorystoreRedis": "memorystore",
+    "FirewallAllowRule": "networking",
+    "PubsubSubscription": "pubsub",
+    "PubsubTopic": "pubsub",
+    "RegionalAutoscaler": "regional_autoscaler",
+    "RegionalManagedInstanceGroup": "regional_managed_instance_group",
+    "GCPResource": "resource",
+    "SecretManagerSecret": "secret_manager",
+    "GCSWebsite": "static_site",
+    "get_service_account_credentials": "utils",
+    "WorkbenchInstance": "workbench",
+}
+# TODO: Deprecate this alias somehow
+_ALIASES = {"CloudRun": "CloudRunService"}
+
+
+def __getattr__(name: str) -> Any:
+    target = _ALIASES.get(name, name)
+    if target not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_LAZY_ATTRIBUTES[target]}")
+    value = getattr(module, target)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_ALIASES))
 
-CloudRun = CloudRunService  # TODO: Deprecate this alias somehow
-from .cloud_run_container import CloudRunServiceContainer
-from .cloud_tasks import CloudTasksQueue
-from .cloudsql import CloudSQLDatabase, CloudSQLPostgres, CloudSQLUser
-from .compute_engine import ComputeEnginePostgres, ComputeEngineRedis
-from .compute_engine_service import ComputeEngineService
-from .custom_domain_mapping import CustomDomainMapping
-from .firebase import FirebaseHostingSite, FirebaseProject
-from .firebase_site import FirebaseStaticSite
-from .gcs import BackendBucket, GCSBucket
-from .gke import GKECluster, NodePool
-from .gke_service import GKEService
-from .http_health_check import HttpHealthCheck
-from .launchflow_cloud_releaser import LaunchFlowCloudReleaser
-from .memorystore import MemorystoreRedis
-from .networking import FirewallAllowRule
-from .pubsub import PubsubSubscription, PubsubTopic
-from .regional_autoscaler import RegionalAutoscaler
-from .regional_managed_instance_group import RegionalManagedInstanceGroup
-from .resource import GCPResource
-from .secret_manager import SecretManagerSecret
-from .static_site import GCSWebsite
-from .utils import get_service_account_credentials
-from .workbench import WorkbenchInstance
 
 __all__ = [
     "ArtifactRegistryRepository",
@@ -3,11 +3,22 @@ try:
 except ImportError:
     bigquery = None  # type: ignore
 
+import asyncio
+import concurrent.futures
 import dataclasses
+import functools
+import io
+import itertools
+import os
 import re
+import sys
+import time
+import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 
+from launchflow import exceptions
+from launchflow.client_registry import client_registry
 from launchflow.gcp.resource import GCPResource
 from launchflow.models.enums import ResourceProduct
 from launchflow.models.flow_state import EnvironmentState
@@ -15,6 +26,24 @@ from launchflow.node import Outputs
 from launchflow.resource import ResourceInputs
 
 _DATASET_NAME_PATTERN = r"^[\w]{1,1024}$"
+# Streaming insert errors that mean a row wasn't inserted but can be retried. Rows
+# that are "stopped" weren't inserted because of another row in the same request.
+# https://cloud.google.com/bigquery/docs/error-messages
+_RETRYABLE_INSERT_REASONS = {
+    "backendError",
+    "internalError",
+    "rateLimitExceeded",
+    "stopped",
+    "timeout",
+}
+_SOURCE_FORMATS_BY_EXTENSION = {
+    ".avro": "AVRO",
+    ".csv": "CSV",
+    ".json": "NEWLINE_DELIMITED_JSON",
+    ".jsonl": "NEWLINE_DELIMITED_JSON",
+    ".ndjson": "NEWLINE_DELIMITED_JSON",
+    ".parquet": "PARQUET",
+}
 
 
 @dataclasses.dataclass
@@ -138,7 +167,10 @@ class BigQueryDataset(GCPResource[BigQueryDatasetOutputs]):
         self._validate_installation()
 
         connection_info = self.outputs()
-        return bigquery.Client(project=connection_info.gcp_project_id)
+        return client_registry.get(
+            ("gcp:bigquery", connection_info.gcp_project_id),
+            lambda: bigquery.Client(project=connection_info.gcp_project_id),
+        )
 
     def dataset(self) -> "bigquery.Dataset":
         """Get the BigQuery Dataset object.
@@ -238,3 +270,272 @@ class BigQueryDataset(GCPResource[BigQueryDatasetOutputs]):
         """
         self._validate_installation()
         self.client().insert_rows_json(self.get_table_uuid(table_name), rows_to_insert)
+
+    def _insert_chunk(
+        self,
+        client: "bigquery.Client",
+        table_id: str,
+        rows: List[Dict[Any, Any]],
+        max_retries: int,
+    ) -> List[Dict[str, Any]]:
+        # NOTE: Row ids are kept across retries so BigQuery can deduplicate rows that
+        # were inserted by a request that still reported an error
+        row_ids = [str(uuid.uuid4()) for _ in rows]
+        failed: List[Dict[str, Any]] = []
+        retries = 0
+        while True:
+            errors = client.insert_rows_json(table_id, rows, row_ids=row_ids)
+            retryable = []
+            for error in errors:
+                # Report errors with the row they were for rather than the index
+                # into this request
+                row_error = {**error, "row": rows[error["index"]]}
+                if retries < max_retries and all(
+                    e.get("reason") in _RETRYABLE_INSERT_REASONS
+                    for e in error["errors"]
+                ):
+                    retryable.append(error)
+                else:
+                    failed.append(row_error)
+            if not retryable:
+                return failed
+            # NOTE: Rows that only failed because another row in the request was
+            # invalid (reason "stopped") are retried on their own
+            rows = [rows[error["index"]] for error in retryable]
+            row_ids = [row_ids[error["index"]] for error in retryable]
+            time.sleep(min(0.5 * 2**retries, 10))
+            retries += 1
+
+    def stream_table_data(
+        self,
+        table_name: str,
+        rows: Iterable[Dict[Any, Any]],
+        chunk_size: int = 500,
+        max_workers: int = 4,
+        max_retries: int = 3,
+    ) -> None:
+        """Insert rows into a table with concurrent streaming inserts.
+
+        Rows are sent in requests of `chunk_size` rows, with at most `max_workers`
+        requests in flight. Rows are only read from `rows` as earlier requests
+        complete, so it can be a generator over more rows than fit in memory. Rows
+        that fail for transient reasons are retried with an exponential backoff.
+
+        **Args:**
+        - `table_name (str)`: The name of the table to insert the data into.
+        - `rows (Iterable[Dict[Any, Any]])`: The rows to insert.
+        - `chunk_size (int)`: The number of rows per request. Defaults to 500.
+        - `max_workers (int)`: The max number of requests to send at once. Defaults to 4.
+        - `max_retries (int)`: The max number of times to retry failed rows. Defaults to 3.
+
+        **Raises:**
+        - `BigQueryInsertFailed`: If any rows could not be inserted. All other rows are still inserted.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        dataset = lf.gcp.BigQueryDataset("my_dataset")
+
+        dataset.stream_table_data(
+            "table_name", ({"name": f"user-{i}", "age": i} for i in range(100000))
+        )
+        ```
+        """
+        self._validate_installation()
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        client = self.client()
+        table_id = self.get_table_uuid(table_name)
+        insert = functools.partial(
+            self._insert_chunk, client, table_id, max_retries=max_retries
+        )
+
+        errors: List[Dict[str, Any]] = []
+        rows_iter = iter(rows)
+        in_flight: "Set[concurrent.futures.Future]" = set()
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            while chunk := list(itertools.islice(rows_iter, chunk_size)):
+                if len(in_flight) >= max_workers:
+                    done, in_flight = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        errors.extend(future.result())
+                in_flight.add(executor.submit(insert, chunk))
+            for future in concurrent.futures.as_completed(in_flight):
+                errors.extend(future.result())
+        if errors:
+            raise exceptions.BigQueryInsertFailed(table_id, errors)
+
+    async def stream_table_data_async(
+        self,
+        table_name: str,
+        rows: Iterable[Dict[Any, Any]],
+        chunk_size: int = 500,
+        max_workers: int = 4,
+        max_retries: int = 3,
+    ) -> None:
+        """Asynchronously insert rows into a table with concurrent streaming inserts.
+
+        The inserts run in a thread pool so the event loop isn't blocked, see
+        `stream_table_data` for details.
+
+        **Args:**
+        - `table_name (str)`: The name of the table to insert the data into.
+        - `rows (Iterable[Dict[Any, Any]])`: The rows to insert.
+        - `chunk_size (int)`: The number of rows per request. Defaults to 500.
+        - `max_workers (int)`: The max number of requests to send at once. Defaults to 4.
+        - `max_retries (int)`: The max number of times to retry failed rows. Defaults to 3.
+
+        **Raises:**
+        - `BigQueryInsertFailed`: If any rows could not be inserted. All other rows are still inserted.
+        """
+        # Resolve the outputs without blocking the event loop
+        await self.outputs_async()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.stream_table_data,
+                table_name,
+                rows,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                max_retries=max_retries,
+            ),
+        )
+
+    def load_table_data(
+        self,
+        table_name: str,
+        source: Union[str, Path, Any],
+        *,
+        source_format: Optional[str] = None,
+        write_disposition: str = "WRITE_APPEND",
+        csv_header: bool = True,
+        autodetect: bool = False,
+        wait: bool = True,
+    ) -> "bigquery.LoadJob":
+        """Load data into a table with a load job.
+
+        Load jobs are free and much faster than streaming inserts for large amounts
+        of data.
+
+        **Args:**
+        - `table_name (str)`: The name of the table to load the data into.
+        - `source (Union[str, Path, pandas.DataFrame, pyarrow.Table])`: A local Parquet, newline delimited JSON, Avro or CSV file, or an in-memory pandas DataFrame or pyarrow Table.
+        - `source_format (Optional[str])`: The [format](https://cloud.google.com/python/docs/reference/bigquery/latest/google.cloud.bigquery.job.SourceFormat) of a file source. Defaults to the format of the file's extension.
+        - `write_disposition (str)`: Whether to append to (`WRITE_APPEND`), overwrite (`WRITE_TRUNCATE`) or only write to an empty table (`WRITE_EMPTY`). Defaults to `WRITE_APPEND`.
+        - `csv_header (bool)`: Whether the first row of a CSV file is a header row, which is skipped. Defaults to True.
+        - `autodetect (bool)`: Whether BigQuery should infer the schema of a CSV or JSON file, e.g. to create a new table. Defaults to False, in which case the schema of the existing table is used.
+        - `wait (bool)`: Whether to wait for the job to complete. Defaults to True.
+
+        **Returns:**
+        - The [BigQuery LoadJob](https://cloud.google.com/python/docs/reference/bigquery/latest/google.cloud.bigquery.job.LoadJob).
+
+        **Raises:**
+        - `ValueError`: If the format of the source can't be determined.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        dataset = lf.gcp.BigQueryDataset("my_dataset")
+
+        dataset.load_table_data("table_name", "data.parquet")
+        ```
+        """
+        self._validate_installation()
+        client = self.client()
+        table_id = self.get_table_uuid(table_name)
+        job_config = bigquery.LoadJobConfig(write_disposition=write_disposition)
+
+        # NOTE: pandas and pyarrow are optional, so they're only checked for if they
+        # were already imported by the caller
+        pandas = sys.modules.get("pandas")
+        pyarrow = sys.modules.get("pyarrow")
+        if pandas is not None and isinstance(source, pandas.DataFrame):
+            job = client.load_table_from_dataframe(
+                source, table_id, job_config=job_config
+            )
+        elif pyarrow is not None and isinstance(source, pyarrow.Table):
+            import pyarrow.parquet  # type: ignore
+
+            buffer = io.BytesIO()
+            pyarrow.parquet.write_table(source, buffer)
+            buffer.seek(0)
+            job_config.source_format = bigquery.SourceFormat.PARQUET
+            job = client.load_table_from_file(buffer, table_id, job_config=job_config)
+        elif isinstance(source, (str, Path)):
+            if source_format is None:
+                extension = os.path.splitext(str(source))[1].lower()
+                source_format = _SOURCE_FORMATS_BY_EXTENSION.get(extension)
+                if source_format is None:
+                    raise ValueError(
+                        f"Unable to determine the format of `{source}`, pass source_format explicitly."
+                    )
+            job_config.source_format = source_format
+            if source_format == bigquery.SourceFormat.CSV and csv_header:
+                job_config.skip_leading_rows = 1
+            if autodetect:
+                job_config.autodetect = True
+            with open(source, "rb") as f:
+                job = client.load_table_from_file(f, table_id, job_config=job_config)
+        else:
+            raise ValueError(
+                f"Unsupported source type `{type(source).__name__}`, expected a file path, pandas DataFrame or pyarrow Table."
+            )
+
+        if wait:
+            job.result()
+        return job
+
+    async def load_table_data_async(
+        self,
+        table_name: str,
+        source: Union[str, Path, Any],
+        *,
+        source_format: Optional[str] = None,
+        write_disposition: str = "WRITE_APPEND",
+        csv_header: bool = True,
+        autodetect: bool = False,
+        poll_interval: float = 1.0,
+    ) -> "bigquery.LoadJob":
+        """Asynchronously load data into a table with a load job.
+
+        The source is uploaded in a thread pool and the job is polled without
+        blocking the event loop, see `load_table_data` for details.
+
+        **Args:**
+        - `table_name (str)`: The name of the table to load the data into.
+        - `source (Union[str, Path, pandas.DataFrame, pyarrow.Table])`: A local Parquet, newline delimited JSON, Avro or CSV file, or an in-memory pandas DataFrame or pyarrow Table.
+        - `source_format (Optional[str])`: The format of a file source. Defaults to the format of the file's extension.
+        - `write_disposition (str)`: Whether to append to, overwrite or only write to an empty table. Defaults to `WRITE_APPEND`.
+        - `csv_header (bool)`: Whether the first row of a CSV file is a header row, which is skipped. Defaults to True.
+        - `autodetect (bool)`: Whether BigQuery should infer the schema of a CSV or JSON file. Defaults to False.
+        - `poll_interval (float)`: How often to check if the job completed, in seconds. Defaults to 1.
+
+        **Returns:**
+        - The completed [BigQuery LoadJob](https://cloud.google.com/python/docs/reference/bigquery/latest/google.cloud.bigquery.job.LoadJob).
+        """
+        await self.outputs_async()
+        loop = asyncio.get_running_loop()
+        job = await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.load_table_data,
+                table_name,
+                source,
+                source_format=source_format,
+                write_disposition=write_disposition,
+                csv_header=csv_header,
+                autodetect=autodetect,
+                wait=False,
+            ),
+        )
+        while not await loop.run_in_executor(None, job.done):
+            await asyncio.sleep(poll_interval)
+        # Raises if the job failed
+        await loop.run_in_executor(None, job.result)
+        return job
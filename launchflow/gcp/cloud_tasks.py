@@ -1,9 +1,12 @@
+import asyncio
+import concurrent.futures
 import dataclasses
 import datetime
 import json as _json
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from launchflow.gcp.resource import GCPResource
+from launchflow.gcp_clients import get_cloud_tasks_async_client, get_cloud_tasks_client
 from launchflow.models.enums import ResourceProduct
 from launchflow.models.flow_state import EnvironmentState
 from launchflow.node import Outputs
@@ -25,6 +28,57 @@ class CloudTasksQueueInputs(ResourceInputs):
     location: Optional[str]
 
 
+@dataclasses.dataclass
+class EnqueueRequest:
+    """A task to enqueue with `CloudTasksQueue.enqueue_many`.
+
+    **Args:**
+    - `url (str)`: The url the task will call.
+    - `method (str)`: The HTTP method to use. Defaults to "POST".
+    - `headers (Optional[Dict[str, str]])`: A dictionary of headers to include in the request.
+    - `body (Optional[bytes])`: The body of the request. Only one of `body` or `json` can be provided.
+    - `json (Optional[Dict])`: A dictionary to be serialized as JSON and sent as the body of the request. Only one of `body` or `json` can be provided.
+    - `oauth_token (Optional[str])`: An OAuth token to include in the request.
+    - `oidc_token (Optional[str])`: An OIDC token to include in the request.
+    - `schedule_time (Optional[datetime.datetime])`: The time to schedule the task for.
+    """
+
+    url: str
+    method: str = "POST"
+    headers: Optional[Dict[str, str]] = None
+    body: Optional[bytes] = None
+    json: Optional[Dict] = None
+    oauth_token: Optional[str] = None
+    oidc_token: Optional[str] = None
+    schedule_time: Optional[datetime.datetime] = None
+
+    def to_task(self) -> "tasks.Task":
+        if self.body is not None and self.json is not None:
+            raise ValueError("Cannot provide both body and json")
+        body = self.body
+        if body is None and self.json is not None:
+            body = _json.dumps(self.json).encode("utf-8")
+        return tasks.Task(
+            http_request=tasks.HttpRequest(
+                url=self.url,
+                http_method=self.method,
+                headers=self.headers,
+                body=body,
+                oauth_token=self.oauth_token,
+                oidc_token=self.oidc_token,
+            ),
+            schedule_time=self.schedule_time,
+        )
+
+
+@dataclasses.dataclass
+class EnqueueResult:
+    request: EnqueueRequest
+    # The created task, or None if enqueueing it failed
+    task: Optional["tasks.Task"] = None
+    error: Optional[Exception] = None
+
+
 # TODO: add methods that automatically enqueue a task with
 # the environment credentials
 class CloudTasksQueue(GCPResource[CloudTasksQueueOutputs]):
@@ -116,26 +170,19 @@ class CloudTasksQueue(GCPResource[CloudTasksQueueOutputs]):
                 "google-cloud-tasks not installed. Please install it with "
                 "`pip install launchflow[gcp]`."
             )
-        if body is not None and json is not None:
-            raise ValueError("Cannot provide both body and json")
-        if body is None and json is not None:
-            body = _json.dumps(json).encode("utf-8")
+        task = EnqueueRequest(
+            url=url,
+            method=method,
+            headers=headers,
+            body=body,
+            json=json,
+            oauth_token=oauth_token,
+            oidc_token=oidc_token,
+            schedule_time=schedule_time,
+        ).to_task()
         info = self.outputs()
-        client = tasks.CloudTasksClient()
-        return client.create_task(
-            parent=info.queue_id,
-            task=tasks.Task(
-                http_request=tasks.HttpRequest(
-                    url=url,
-                    http_method=method,
-                    headers=headers,
-                    body=body,
-                    oauth_token=oauth_token,
-                    oidc_token=oidc_token,
-                ),
-                schedule_time=schedule_time,
-            ),
-        )
+        client = get_cloud_tasks_client()
+        return client.create_task(parent=info.queue_id, task=task)
 
     async def enqueue_async(
         self,
@@ -181,23 +228,143 @@ class CloudTasksQueue(GCPResource[CloudTasksQueueOutputs]):
                 "google-cloud-tasks not installed. Please install it with "
                 "`pip install launchflow[gcp]`."
             )
-        if body is not None and json is not None:
-            raise ValueError("Cannot provide both body and json")
-        if body is None and json is not None:
-            body = _json.dumps(json).encode("utf-8")
+        task = EnqueueRequest(
+            url=url,
+            method=method,
+            headers=headers,
+            body=body,
+            json=json,
+            oauth_token=oauth_token,
+            oidc_token=oidc_token,
+            schedule_time=schedule_time,
+        ).to_task()
         info = await self.outputs_async()
-        client = tasks.CloudTasksAsyncClient()
-        return await client.create_task(
-            parent=info.queue_id,
-            task=tasks.Task(
-                http_request=tasks.HttpRequest(
-                    url=url,
-                    http_method=method,
-                    headers=headers,
-                    body=body,
-                    oauth_token=oauth_token,
-                    oidc_token=oidc_token,
-                ),
-                schedule_time=schedule_time,
-            ),
+        client = get_cloud_tasks_async_client()
+        return await client.create_task(parent=info.queue_id, task=task)
+
+    def enqueue_many(
+        self, requests: Iterable[EnqueueRequest], max_concurrency: int = 32
+    ) -> List[EnqueueResult]:
+        """Enqueue many tasks in the Cloud Tasks queue.
+
+        Tasks are created concurrently, with at most `max_concurrency` requests in
+        flight. Requests are only read from `requests` as earlier ones complete, so
+        it can be a generator over more tasks than fit in memory at once.
+
+        **Args:**
+        - `requests (Iterable[EnqueueRequest])`: The tasks to enqueue.
+        - `max_concurrency (int)`: The max number of tasks to create at once. Defaults to 32.
+
+        **Returns:**
+        - `List[EnqueueResult]`: The result of each task, in the order the tasks were given. Tasks that failed to enqueue have their `error` set instead of raising.
+
+        **Raises:**
+        - `ImportError`: If the google-cloud-tasks library is not installed.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+        from launchflow.gcp.cloud_tasks import EnqueueRequest
+
+        queue = lf.gcp.CloudTasksQueue("my-queue")
+
+        results = queue.enqueue_many(
+            EnqueueRequest("https://example.com/endpoint", json={"id": i})
+            for i in range(10000)
         )
+        failed = [result for result in results if result.error is not None]
+        ```
+        """
+        if tasks is None:
+            raise ImportError(
+                "google-cloud-tasks not installed. Please install it with "
+                "`pip install launchflow[gcp]`."
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        info = self.outputs()
+        client = get_cloud_tasks_client()
+
+        def enqueue(request: EnqueueRequest) -> EnqueueResult:
+            try:
+                task = client.create_task(parent=info.queue_id, task=request.to_task())
+            except Exception as e:
+                return EnqueueResult(request=request, error=e)
+            return EnqueueResult(request=request, task=task)
+
+        results: List[Optional[EnqueueResult]] = []
+        in_flight: "Dict[concurrent.futures.Future, int]" = {}
+        with concurrent.futures.ThreadPoolExecutor(max_concurrency) as executor:
+            for request in requests:
+                if len(in_flight) >= max_concurrency:
+                    done, _ = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        results[in_flight.pop(future)] = future.result()
+                in_flight[executor.submit(enqueue, request)] = len(results)
+                results.append(None)
+            for future in concurrent.futures.as_completed(in_flight):
+                results[in_flight[future]] = future.result()
+        return results  # type: ignore
+
+    async def enqueue_many_async(
+        self, requests: Iterable[EnqueueRequest], max_concurrency: int = 100
+    ) -> List[EnqueueResult]:
+        """Asynchronously enqueue many tasks in the Cloud Tasks queue.
+
+        Tasks are created concurrently over a shared async client, with at most
+        `max_concurrency` requests in flight. Requests are only read from `requests`
+        as earlier ones complete, so it can be a generator over more tasks than fit
+        in memory at once.
+
+        **Args:**
+        - `requests (Iterable[EnqueueRequest])`: The tasks to enqueue.
+        - `max_concurrency (int)`: The max number of tasks to create at once. Defaults to 100.
+
+        **Returns:**
+        - `List[EnqueueResult]`: The result of each task, in the order the tasks were given. Tasks that failed to enqueue have their `error` set instead of raising.
+
+        **Raises:**
+        - `ImportError`: If the google-cloud-tasks library is not installed.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+        from launchflow.gcp.cloud_tasks import EnqueueRequest
+
+        queue = lf.gcp.CloudTasksQueue("my-queue")
+
+        results = await queue.enqueue_many_async(
+            EnqueueRequest("https://example.com/endpoint", json={"id": i})
+            for i in range(10000)
+        )
+        ```
+        """
+        if tasks is None:
+            raise ImportError(
+                "google-cloud-tasks not installed. Please install it with "
+                "`pip install launchflow[gcp]`."
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        info = await self.outputs_async()
+        client = get_cloud_tasks_async_client()
+        results: List[Tuple[int, EnqueueResult]] = []
+        # Workers pull from a shared iterator so at most `max_concurrency` requests
+        # are read ahead of the ones that completed
+        pending = enumerate(requests)
+
+        async def worker():
+            for i, request in pending:
+                try:
+                    task = await client.create_task(
+                        parent=info.queue_id, task=request.to_task()
+                    )
+                    result = EnqueueResult(request=request, task=task)
+                except Exception as e:
+                    result = EnqueueResult(request=request, error=e)
+                results.append((i, result))
+
+        await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+        return [result for _, result in sorted(results, key=lambda r: r[0])]
@@ -1,7 +1,9 @@
 import dataclasses
 import io
-from typing import IO, Dict, Optional
+import os
+from typing import IO, AsyncIterator, Dict, Iterator, List, Optional
 
+from launchflow import exceptions
 from launchflow.gcp_clients import get_storage_client
 from launchflow.models.enums import ResourceProduct
 from launchflow.models.flow_state import EnvironmentState
@@ -17,6 +19,11 @@ from typing import Union
 from launchflow.gcp.resource import GCPResource
 from launchflow.node import Outputs
 from launchflow.resource import ResourceInputs
+from launchflow.utils import is_relative_path, iterate_in_executor, list_files
+
+# The size of each chunk of parallel transfers and streaming reads
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 8
 
 
 @dataclasses.dataclass
@@ -175,6 +182,251 @@ class GCSBucket(GCPResource[GCSBucketOutputs]):
         bucket = self.bucket()
         return bucket.blob(bucket_path).download_as_bytes()
 
+    def _bucket_reference(self) -> "storage.Bucket":
+        # Unlike bucket() this doesn't fetch the bucket's metadata
+        if storage is None:
+            raise ImportError(
+                "google-cloud-storage not found. "
+                "You can install it with pip install launchflow[gcp]"
+            )
+        return get_storage_client().bucket(self.outputs().bucket_name)
+
+    def open(
+        self, bucket_path: str, mode: str = "rb", chunk_size: Optional[int] = None
+    ) -> IO:
+        """Opens a file in the GCS bucket for streaming reads or writes.
+
+        **Args:**
+        - `bucket_path (str)`: The path to the file in the bucket.
+        - `mode (str)`: The mode to open the file with, one of "r", "rb", "w" or "wb". Defaults to "rb".
+        - `chunk_size (Optional[int])`: The number of bytes read or written per request. Defaults to the client library's default.
+
+        **Returns:**
+        - A file-like object that reads or writes the file in chunks.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.gcp.GCSBucket("my-bucket")
+        with bucket.open("large-file.csv", "r") as f:
+            for line in f:
+                print(line)
+        ```
+        """
+        blob = self._bucket_reference().blob(bucket_path)
+        return blob.open(mode, chunk_size=chunk_size)
+
+    def iter_download(
+        self, bucket_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Downloads a file from the GCS bucket in chunks.
+
+        **Args:**
+        - `bucket_path (str)`: The path to the file in the bucket.
+        - `chunk_size (int)`: The max size of each chunk in bytes. Defaults to 32 MiB.
+
+        **Yields:**
+        - The contents of the file, one chunk at a time.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.gcp.GCSBucket("my-bucket")
+        with open("large-file.bin", "wb") as f:
+            for chunk in bucket.iter_download("large-file.bin"):
+                f.write(chunk)
+        ```
+        """
+        with self.open(bucket_path, "rb", chunk_size=chunk_size) as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def iter_download_async(
+        self, bucket_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Asynchronously downloads a file from the GCS bucket in chunks.
+
+        **Args:**
+        - `bucket_path (str)`: The path to the file in the bucket.
+        - `chunk_size (int)`: The max size of each chunk in bytes. Defaults to 32 MiB.
+
+        **Yields:**
+        - The contents of the file, one chunk at a time.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.gcp.GCSBucket("my-bucket")
+        async for chunk in bucket.iter_download_async("large-file.bin"):
+            ...
+        ```
+        """
+        return iterate_in_executor(self.iter_download(bucket_path, chunk_size))
+
+    def parallel_upload(
+        self,
+        file_path: str,
+        bucket_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Uploads a large file to the GCS bucket in chunks uploaded in parallel.
+
+        **Args:**
+        - `file_path (str)`: The path of the local file to upload.
+        - `bucket_path (str)`: The path to upload the file to in the bucket.
+        - `chunk_size (int)`: The size of each chunk in bytes. Defaults to 32 MiB.
+        - `max_workers (int)`: The max number of chunks to upload at once. Defaults to 8.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.gcp.GCSBucket("my-bucket")
+        bucket.parallel_upload("model.bin", "models/model.bin")
+        ```
+        """
+        from google.cloud.storage import transfer_manager
+
+        transfer_manager.upload_chunks_concurrently(
+            file_path,
+            self._bucket_reference().blob(bucket_path),
+            chunk_size=chunk_size,
+            worker_type=transfer_manager.THREAD,
+            max_workers=max_workers,
+        )
+
+    def parallel_download(
+        self,
+        bucket_path: str,
+        file_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Downloads a large file from the GCS bucket with parallel ranged requests.
+
+        **Args:**
+        - `bucket_path (str)`: The path to the file in the bucket.
+        - `file_path (str)`: The path of the local file to download to.
+        - `chunk_size (int)`: The size of each range in bytes. Defaults to 32 MiB.
+        - `max_workers (int)`: The max number of ranges to download at once. Defaults to 8.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.gcp.GCSBucket("my-bucket")
+        bucket.parallel_download("models/model.bin", "model.bin")
+        ```
+        """
+        from google.cloud.storage import transfer_manager
+
+        bucket = self._bucket_reference()
+        # The blob's size is needed to split it into ranges
+        blob = bucket.get_blob(bucket_path)
+        if blob is None:
+            raise exceptions.GCSObjectNotFound(bucket.name, bucket_path)
+        transfer_manager.download_chunks_concurrently(
+            blob,
+            file_path,
+            chunk_size=chunk_size,
+            worker_type=transfer_manager.THREAD,
+            max_workers=max_workers,
+        )
+
+    def upload_directory(
+        self,
+        directory: str,
+        prefix: str = "",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[str]:
+        """Uploads all files in a local directory to the GCS bucket.
+
+        **Args:**
+        - `directory (str)`: The local directory to upload.
+        - `prefix (str)`: The prefix to upload the files under in the bucket, for example "static/". Defaults to the root of the bucket.
+        - `max_workers (int)`: The max number of files to upload at once. Defaults to 8.
+
+        **Returns:**
+        - The paths of the uploaded files in the bucket.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.gcp.GCSBucket("my-bucket")
+        bucket.upload_directory("dist", prefix="static/")
+        ```
+        """
+        from google.cloud.storage import transfer_manager
+
+        file_names = [
+            file_name.replace(os.sep, "/") for file_name in list_files(directory)
+        ]
+        transfer_manager.upload_many_from_filenames(
+            self._bucket_reference(),
+            file_names,
+            source_directory=directory,
+            blob_name_prefix=prefix,
+            raise_exception=True,
+            worker_type=transfer_manager.THREAD,
+            max_workers=max_workers,
+        )
+        return [prefix + file_name for file_name in file_names]
+
+    def download_prefix(
+        self,
+        prefix: str,
+        directory: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[str]:
+        """Downloads all files under a prefix of the GCS bucket to a local directory.
+
+        **Args:**
+        - `prefix (str)`: The prefix of the files to download, for example "static/".
+        - `directory (str)`: The local directory to download the files to. Files are written to their path relative to the prefix.
+        - `max_workers (int)`: The max number of files to download at once. Defaults to 8.
+
+        **Returns:**
+        - The local paths of the downloaded files.
+
+        **Example usage:**
+        ```python
+        import launchflow as lf
+
+        bucket = lf.gcp.GCSBucket("my-bucket")
+        bucket.download_prefix("static/", "dist")
+        ```
+        """
+        from google.cloud.storage import transfer_manager
+
+        bucket = self._bucket_reference()
+        blob_names = []
+        for blob in bucket.list_blobs(prefix=prefix):
+            blob_name = blob.name[len(prefix) :]
+            # Skip "directory" placeholder objects and names that would be written
+            # outside of the directory
+            if (
+                not blob_name
+                or blob_name.endswith("/")
+                or not is_relative_path(blob_name)
+            ):
+                continue
+            blob_names.append(blob_name)
+        transfer_manager.download_many_to_path(
+            bucket,
+            blob_names,
+            destination_directory=directory,
+            blob_name_prefix=prefix,
+            raise_exception=True,
+            worker_type=transfer_manager.THREAD,
+            max_workers=max_workers,
+        )
+        return [os.path.join(directory, blob_name) for blob_name in blob_names]
+
 
 @dataclasses.dataclass
 class BackendBucketOutputs(Outputs):
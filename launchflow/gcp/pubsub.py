@@ -30,24 +30,53 @@ subscription = lf.gcp.PubsubSubscription("my-pubsub-sub", topic=topic)
 
 try:
     from google.cloud.pubsub import PublisherClient  # type: ignore
+    from google.cloud.pubsub_v1 import types as pubsub_types  # type: ignore
     from google.pubsub_v1.services.publisher import PublisherAsyncClient
     from google.pubsub_v1.types import PubsubMessage
 except ImportError:
     PublisherClient = None  # type: ignore
+    pubsub_types = None  # type: ignore
     PublisherAsyncClient = None  # type: ignore
     PubsubMessage = None  # type: ignore
 
 
+import asyncio
+import concurrent.futures
 import dataclasses
 import datetime
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
+from launchflow.client_registry import client_registry
 from launchflow.gcp.resource import GCPResource
+from launchflow.gcp_clients import get_publisher_async_client, get_publisher_client
 from launchflow.models.enums import ResourceProduct
 from launchflow.models.flow_state import EnvironmentState
 from launchflow.node import Depends, Inputs, Outputs
 from launchflow.resource import ResourceInputs
 
+# The limits of a single Pub/Sub publish request, a little headroom is left on the
+# request size for the encoding of each message
+# https://cloud.google.com/pubsub/quotas#resource_limits
+MAX_PUBLISH_REQUEST_MESSAGES = 1000
+MAX_PUBLISH_REQUEST_BYTES = 9 * 1024 * 1024
+
+
+def _chunk_messages(
+    messages: Sequence[bytes],
+    max_messages: int = MAX_PUBLISH_REQUEST_MESSAGES,
+    max_bytes: int = MAX_PUBLISH_REQUEST_BYTES,
+) -> Iterator[Sequence[bytes]]:
+    start = 0
+    size = 0
+    for i, data in enumerate(messages):
+        if i > start and (i - start >= max_messages or size + len(data) > max_bytes):
+            yield messages[start:i]
+            start = i
+            size = 0
+        size += len(data)
+    if start < len(messages):
+        yield messages[start:]
+
 
 @dataclasses.dataclass
 class PubsubTopicOutputs(Outputs):
@@ -147,7 +176,7 @@ class PubsubTopic(GCPResource[PubsubTopicOutputs]):
                 "`pip install launchflow[gcp]`."
             )
         connection = self.outputs()
-        client = PublisherClient()
+        client = get_publisher_client()
         return client.publish(connection.topic_id, data, ordering_key=ordering_key)
 
     async def publish_async(self, data: bytes, ordering_key: str = ""):
@@ -179,12 +208,191 @@ class PubsubTopic(GCPResource[PubsubTopicOutputs]):
                 "`pip install launchflow[gcp]`."
             )
         connection = await self.outputs_async()
-        client = PublisherAsyncClient()
+        client = get_publisher_async_client()
         return await client.publish(
             messages=[PubsubMessage(data=data, ordering_key=ordering_key)],
             topic=connection.topic_id,
         )
 
+    def batch_publisher(
+        self,
+        max_messages: int = 100,
+        max_bytes: int = 1024 * 1024,
+        max_latency: float = 0.01,
+    ) -> "PublisherClient":
+        """Returns a publisher client that batches messages before sending them.
+
+        Messages are sent once `max_messages` or `max_bytes` are buffered, or
+        `max_latency` seconds after the first message of a batch. Message ordering is
+        enabled so messages with the same ordering key are delivered in the order
+        they were published. Publishers are shared by all topics of the process that
+        use the same settings.
+
+        **Args:**
+        - `max_messages (int)`: The max number of messages in a batch. Defaults to 100.
+        - `max_bytes (int)`: The max size of a batch in bytes. Defaults to 1 MiB.
+        - `max_latency (float)`: The max number of seconds to wait before sending a batch. Defaults to 0.01.
+
+        **Returns:**
+        - A [`PublisherClient`](https://cloud.google.com/python/docs/reference/pubsub/latest/google.cloud.pubsub_v1.publisher.client.Client).
+
+        **Raises:***:
+        - `ImportError`: If the google-cloud-pubsub library is not installed.
+
+        **Example usage:**
+
+        ```python
+        import launchflow as lf
+
+        topic = lf.gcp.PubsubTopic("my-pubsub-topic")
+
+        publisher = topic.batch_publisher(max_messages=500, max_latency=0.05)
+        future = publisher.publish(topic.outputs().topic_id, b"Hello, world!")
+        ```
+        """
+        if PublisherClient is None:
+            raise ImportError(
+                "google-cloud-pubsub not installed. Please install it with "
+                "`pip install launchflow[gcp]`."
+            )
+        return client_registry.get(
+            ("gcp:pubsub:batch", max_messages, max_bytes, max_latency),
+            lambda: PublisherClient(
+                batch_settings=pubsub_types.BatchSettings(
+                    max_messages=max_messages,
+                    max_bytes=max_bytes,
+                    max_latency=max_latency,
+                ),
+                publisher_options=pubsub_types.PublisherOptions(
+                    enable_message_ordering=True
+                ),
+            ),
+        )
+
+    def publish_many(
+        self, data: Iterable[bytes], ordering_key: str = ""
+    ) -> List["concurrent.futures.Future"]:
+        """Publish messages to the topic without waiting for them to be sent.
+
+        Messages are batched by `batch_publisher()` with its default settings.
+
+        **Args:**
+        - `data (Iterable[bytes])`: The bytes of each message to publish.
+        - `ordering_key (str)`: An optional ordering key for the messages.
+
+        **Returns:**
+        - A future per message that resolves to the id of the published message.
+
+        **Raises:***:
+        - `ImportError`: If the google-cloud-pubsub library is not installed.
+
+        **Example usage:**
+
+        ```python
+        import launchflow as lf
+
+        topic = lf.gcp.PubsubTopic("my-pubsub-topic")
+
+        futures = topic.publish_many([b"Hello", b"world!"])
+        message_ids = [future.result() for future in futures]
+        ```
+        """
+        publisher = self.batch_publisher()
+        topic_id = self.outputs().topic_id
+        return [
+            publisher.publish(topic_id, message, ordering_key=ordering_key)
+            for message in data
+        ]
+
+    def publish_batch(self, data: Iterable[bytes], ordering_key: str = "") -> List[str]:
+        """Publish messages to the topic and wait for all of them to be sent.
+
+        **Args:**
+        - `data (Iterable[bytes])`: The bytes of each message to publish.
+        - `ordering_key (str)`: An optional ordering key for the messages.
+
+        **Returns:**
+        - The ids of the published messages, in the order they were given.
+
+        **Raises:***:
+        - `ImportError`: If the google-cloud-pubsub library is not installed.
+
+        **Example usage:**
+
+        ```python
+        import launchflow as lf
+
+        topic = lf.gcp.PubsubTopic("my-pubsub-topic")
+
+        message_ids = topic.publish_batch([b"Hello", b"world!"])
+        ```
+        """
+        futures = self.publish_many(data, ordering_key=ordering_key)
+        try:
+            return [future.result() for future in futures]
+        except Exception:
+            if ordering_key:
+                # Publishing is paused for an ordering key after a failure so later
+                # messages aren't delivered out of order, resume it for the next call
+                self.batch_publisher().resume_publish(
+                    self.outputs().topic_id, ordering_key
+                )
+            raise
+
+    async def publish_batch_async(
+        self, data: Sequence[bytes], ordering_key: str = ""
+    ) -> List[str]:
+        """Asynchronously publish messages to the topic.
+
+        Messages are sent in as few requests as the Pub/Sub request limits allow.
+        Requests are sent concurrently, unless an ordering key is given in which case
+        they are sent one after the other to preserve the order of the messages.
+
+        **Args:**
+        - `data (Sequence[bytes])`: The bytes of each message to publish.
+        - `ordering_key (str)`: An optional ordering key for the messages.
+
+        **Returns:**
+        - The ids of the published messages, in the order they were given.
+
+        **Raises:***:
+        - `ImportError`: If the google-cloud-pubsub library is not installed.
+
+        **Example usage:**
+
+        ```python
+        import launchflow as lf
+
+        topic = lf.gcp.PubsubTopic("my-pubsub-topic")
+
+        message_ids = await topic.publish_batch_async([b"Hello", b"world!"])
+        ```
+        """
+        if PublisherAsyncClient is None:
+            raise ImportError(
+                "google-cloud-pubsub not installed. Please install it with "
+                "`pip install launchflow[gcp]`."
+            )
+        connection = await self.outputs_async()
+        client = get_publisher_async_client()
+
+        async def publish_chunk(chunk: Sequence[bytes]) -> List[str]:
+            response = await client.publish(
+                messages=[
+                    PubsubMessage(data=message, ordering_key=ordering_key)
+                    for message in chunk
+                ],
+                topic=connection.topic_id,
+            )
+            return list(response.message_ids)
+
+        chunks = list(_chunk_messages(data))
+        if ordering_key:
+            responses = [await publish_chunk(chunk) for chunk in chunks]
+        else:
+            responses = await asyncio.gather(*(publish_chunk(c) for c in chunks))
+        return [message_id for response in responses for message_id in response]
+
 
 @dataclasses.dataclass
 class OidcToken(Inputs):
@@ -2,6 +2,7 @@ import dataclasses
 from typing import Dict
 
 from launchflow.gcp.resource import GCPResource
+from launchflow.gcp_clients import get_secret_manager_client
 from launchflow.models.enums import ResourceProduct
 from launchflow.models.flow_state import EnvironmentState
 from launchflow.node import Outputs
@@ -75,14 +76,14 @@ class SecretManagerSecret(GCPResource[SecretManagerOutputs]):
         if use_cache and version in self._cached_versions:
             return self._cached_versions[version]
         try:
-            from google.cloud import secretmanager
+            from google.cloud import secretmanager  # noqa: F401
         except ImportError:
             raise ImportError(
                 "google-cloud-secret-manager not found. "
                 "You can install it with pip install launchflow[gcp]"
             )
         connection_info = self.outputs()
-        client = secretmanager.SecretManagerServiceClient()
+        client = get_secret_manager_client()
         response = client.access_secret_version(
             name=f"{connection_info.secret_name}/versions/{version}"
         )
@@ -116,7 +117,7 @@ class SecretManagerSecret(GCPResource[SecretManagerOutputs]):
                 "You can install it with pip install launchflow[gcp]"
             )
         connection_info = self.outputs()
-        client = secretmanager.SecretManagerServiceClient()
+        client = get_secret_manager_client()
         client.add_secret_version(
             parent=connection_info.secret_name,
             payload=secretmanager.SecretPayload(data=payload),
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from launchflow import exceptions
-from launchflow.gcp.gcs import BackendBucket
+from launchflow.gcp.gcs import DEFAULT_MAX_WORKERS, BackendBucket
 from launchflow.gcp.service import GCPService
 from launchflow.models.enums import ServiceProduct
 from launchflow.node import Inputs
@@ -38,6 +38,10 @@ class GCSWebsite(GCPService):
         build_directory: str = ".",
         build_ignore: List[str] = [],
         wait_for_cdn_invalidation: bool = False,
+        cache_control: Optional[str] = None,
+        gzip_files: bool = False,
+        delete_stale_files: bool = False,
+        max_upload_workers: int = DEFAULT_MAX_WORKERS,
         # backend bucket inputs
         region: Optional[str] = None,
         domain: Optional[str] = None,
@@ -48,6 +52,11 @@ class GCSWebsite(GCPService):
         - `name (str)`: The name of the service.
         - `build_directory (str)`: The directory of static files to serve. This should be a relative path from the project root where your `launchflow.yaml` is defined.
         - `build_ignore (List[str])`: A list of files to ignore when deploying the service. This can be in the same syntax you would use for a `.gitignore`.
+        - `wait_for_cdn_invalidation (bool)`: Whether to wait for the CDN to invalidate the changed files before the deployment finishes. Defaults to False.
+        - `cache_control (Optional[str])`: The `Cache-Control` header to serve the files with, for example `"public, max-age=3600"`. Defaults to the bucket's default.
+        - `gzip_files (bool)`: Whether to store text files (html, css, js, json, svg, etc.) gzipped. Clients that don't accept gzip are served the decompressed file. Defaults to False.
+        - `delete_stale_files (bool)`: Whether to delete files from the bucket that are no longer in the build directory. Defaults to False.
+        - `max_upload_workers (int)`: The max number of files to upload at once. Defaults to 8.
         - `region (Optional[str])`: The region to deploy the service to.
         - `domain (Optional[str])`: The custom domain to map to the service.
         """
@@ -59,6 +68,10 @@ class GCSWebsite(GCPService):
         self.dist = dist
         self.build_command = build_command
         self.wait_for_cdn_invalidation = wait_for_cdn_invalidation
+        self.cache_control = cache_control
+        self.gzip_files = gzip_files
+        self.delete_stale_files = delete_stale_files
+        self.max_upload_workers = max_upload_workers
         self.region = region
         self.domain = domain
 
@@ -1,60 +1,127 @@
 import asyncio
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING
 
 import requests
 
 from launchflow import exceptions
+from launchflow.cache.state_mirror import (
+    delete_mirrored_state,
+    get_mirrored_state,
+    mirror_state,
+)
+from launchflow.client_registry import client_registry
 
 if TYPE_CHECKING:
+    from google.cloud import secretmanager, storage, tasks  # type: ignore
+    from google.cloud.pubsub import PublisherClient  # type: ignore
+    from google.pubsub_v1.services.publisher import PublisherAsyncClient
+
+
+def _create_storage_client() -> "storage.Client":
     from google.cloud import storage  # type: ignore
 
-_storage_client: Optional["storage.Client"] = None
+    client = storage.Client()
+    # Workaroud to allow more connections to GCS and increase max retries
+    # https://github.com/googleapis/python-storage/issues/253#issuecomment-687068266
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=128, pool_maxsize=128, max_retries=5
+    )
+    client._http.mount("https://", adapter)
+    client._http._auth_request.session.mount("https://", adapter)
+    return client
 
 
 def get_storage_client() -> "storage.Client":
     try:
-        from google.cloud import storage  # type: ignore
+        from google.cloud import storage  # type: ignore # noqa: F401
     except ImportError:
         raise exceptions.MissingGCPDependency()
-    global _storage_client
-    if _storage_client is None:
-        _storage_client = storage.Client()
-        # Workaroud to allow more connections to GCS and increase max retries
-        # https://github.com/googleapis/python-storage/issues/253#issuecomment-687068266
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=128, pool_maxsize=128, max_retries=5
-        )
-        _storage_client._http.mount("https://", adapter)
-        _storage_client._http._auth_request.session.mount("https://", adapter)
-    return _storage_client
-
-
-async def write_to_gcs(bucket: str, prefix: str, data: str):
-    client = get_storage_client()
-    remote_bucket = client.bucket(bucket)
-    blob = remote_bucket.blob(prefix)
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, blob.upload_from_string, data)
+    return client_registry.get("gcp:storage", _create_storage_client)
 
 
-async def read_from_gcs(bucket: str, prefix: str) -> str:
+def get_publisher_client() -> "PublisherClient":
     try:
-        from google.api_core.exceptions import NotFound
+        from google.cloud.pubsub import PublisherClient  # type: ignore
+    except ImportError:
+        raise exceptions.MissingGCPDependency()
+    return client_registry.get("gcp:pubsub", PublisherClient)
+
+
+def get_publisher_async_client() -> "PublisherAsyncClient":
+    try:
+        from google.pubsub_v1.services.publisher import PublisherAsyncClient
+    except ImportError:
+        raise exceptions.MissingGCPDependency()
+    return client_registry.get_async("gcp:pubsub", PublisherAsyncClient)
+
+
+def get_cloud_tasks_client() -> "tasks.CloudTasksClient":
+    try:
+        from google.cloud import tasks  # type: ignore
+    except ImportError:
+        raise exceptions.MissingGCPDependency()
+    return client_registry.get("gcp:tasks", tasks.CloudTasksClient)
+
+
+def get_cloud_tasks_async_client() -> "tasks.CloudTasksAsyncClient":
+    try:
+        from google.cloud import tasks  # type: ignore
+    except ImportError:
+        raise exceptions.MissingGCPDependency()
+    return client_registry.get_async("gcp:tasks", tasks.CloudTasksAsyncClient)
+
+
+def get_secret_manager_client() -> "secretmanager.SecretManagerServiceClient":
+    try:
+        from google.cloud import secretmanager  # type: ignore
     except ImportError:
         raise exceptions.MissingGCPDependency()
+    return client_registry.get(
+        "gcp:secretmanager", secretmanager.SecretManagerServiceClient
+    )
+
+
+async def write_to_gcs(bucket: str, prefix: str, data: str, mirror: bool = False):
     client = get_storage_client()
     remote_bucket = client.bucket(bucket)
-    try:
-        blob = remote_bucket.blob(prefix)
-        loop = asyncio.get_event_loop()
-        return (await loop.run_in_executor(None, blob.download_as_bytes)).decode(
-            "utf-8"
-        )
-    except NotFound:
-        raise exceptions.GCSObjectNotFound(bucket, prefix)
+    blob = remote_bucket.blob(prefix)
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(None, blob.upload_from_string, data)
+    if mirror:
+        # The upload sets the generation on the blob, so the next read of the
+        # file only needs to revalidate it
+        mirror_state(bucket, prefix, blob.generation, data.encode("utf-8"))
+
+
+def download_mirrored_blob(bucket: str, path: str, blob: "storage.Blob") -> bytes:
+    """Downloads a blob, reusing the mirrored copy if it is still up to date.
+
+    Blobs returned by a listing already have their generation, in which case an
+    up to date mirrored copy is used without making any request.
+    """
+    from google.api_core.exceptions import NotModified
+
+    mirrored = get_mirrored_state(bucket, path)
+    if mirrored is None:
+        data = blob.download_as_bytes()
+    else:
+        generation, data = mirrored
+        if blob.generation == generation:
+            return data
+        try:
+            data = blob.download_as_bytes(if_generation_not_match=generation)
+        except NotModified:
+            return data
+    mirror_state(bucket, path, blob.generation, data)
+    return data
+
+
+async def read_from_gcs(bucket: str, prefix: str, mirror: bool = False) -> str:
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, read_from_gcs_sync, bucket, prefix, mirror)
 
 
-def read_from_gcs_sync(bucket: str, prefix: str):
+def read_from_gcs_sync(bucket: str, prefix: str, mirror: bool = False) -> str:
     try:
         from google.api_core.exceptions import NotFound
     except ImportError:
@@ -63,8 +130,12 @@ def read_from_gcs_sync(bucket: str, prefix: str):
     remote_bucket = client.bucket(bucket)
     try:
         blob = remote_bucket.blob(prefix)
+        if mirror:
+            return download_mirrored_blob(bucket, prefix, blob).decode("utf-8")
         return blob.download_as_bytes().decode("utf-8")
     except NotFound:
+        if mirror:
+            delete_mirrored_state(bucket, prefix)
         raise exceptions.GCSObjectNotFound(bucket, prefix)
 
 
@@ -1,14 +1,16 @@
 import asyncio
+import dataclasses
 import datetime
 import os
 import shutil
-from typing import Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Union
 
 import httpx
-import yaml
 
 from launchflow import exceptions
 from launchflow.backend import GCSBackend, LaunchFlowBackend, LocalBackend
+from launchflow.cache.state_mirror import delete_mirrored_state
 from launchflow.clients.docker_client import DockerClient, docker_service_available
 from launchflow.clients.environments_client import (
     EnvironmentsAsyncClient,
@@ -18,6 +20,7 @@ from launchflow.clients.resources_client import ResourcesAsyncClient
 from launchflow.clients.services_client import ServicesAsyncClient
 from launchflow.config import config
 from launchflow.gcp_clients import (
+    download_mirrored_blob,
     get_storage_client,
     read_from_gcs,
     read_from_gcs_sync,
@@ -33,6 +36,7 @@ from launchflow.managers.resource_manager import ResourceManager
 from launchflow.managers.service_manager import ServiceManager
 from launchflow.models.enums import ResourceProduct, ResourceStatus
 from launchflow.models.flow_state import EnvironmentState, ResourceState, ServiceState
+from launchflow.state_codec import decode_state, encode_state
 
 
 def _load_local_environment(path: str, project_name: str, environment_name: str):
@@ -40,7 +44,7 @@ def _load_local_environment(path: str, project_name: str, environment_name: str)
     env_path = os.path.join(base_env_path, "flow.state")
     try:
         with open(env_path, "r") as f:
-            raw_env = yaml.safe_load(f)
+            raw_env = decode_state(f.read())
             env = EnvironmentState.model_validate(raw_env)
     except FileNotFoundError:
         raise exceptions.EnvironmentNotFound(environment_name)
@@ -52,7 +56,7 @@ async def _load_gcs_environment(
 ):
     try:
         env_path = os.path.join(prefix, project_name, environment_name, "flow.state")
-        raw_state = yaml.safe_load(await read_from_gcs(bucket, env_path))
+        raw_state = decode_state(await read_from_gcs(bucket, env_path, mirror=True))
         state = EnvironmentState.model_validate(raw_state)
         return state
     except exceptions.GCSObjectNotFound:
@@ -64,7 +68,7 @@ def _load_gcs_environment_sync(
 ):
     try:
         env_path = os.path.join(prefix, project_name, environment_name, "flow.state")
-        raw_state = yaml.safe_load(read_from_gcs_sync(bucket, env_path))
+        raw_state = decode_state(read_from_gcs_sync(bucket, env_path, mirror=True))
         state = EnvironmentState.model_validate(raw_state)
         return state
     except exceptions.GCSObjectNotFound:
@@ -122,7 +126,7 @@ def _save_local_environment(
         os.makedirs(env_path)
     with open(os.path.join(env_path, "flow.state"), "w") as f:
         json_data = environment_state.to_dict()
-        yaml.dump(json_data, f, sort_keys=False)
+        f.write(encode_state(json_data))
 
 
 async def _save_gcs_environment(
@@ -136,7 +140,8 @@ async def _save_gcs_environment(
     await write_to_gcs(
         bucket,
         env_path,
-        yaml.dump(environment_state.to_dict(), sort_keys=False),
+        encode_state(environment_state.to_dict()),
+        mirror=True,
     )
 
 
@@ -175,11 +180,84 @@ def _list_resources_from_local_backend(
                     resource_name = os.path.basename(dir.path)
                     resource_path = os.path.join(dir.path, "flow.state")
                     with open(resource_path, "r") as f:
-                        resource = ResourceState.model_validate(yaml.safe_load(f))
+                        resource = ResourceState.model_validate(decode_state(f.read()))
                         resources[resource_name] = resource
     return resources
 
 
+# The max number of state files downloaded from GCS at once. This stays well below
+# the connection pool size used by get_storage_client.
+_MAX_PARALLEL_GCS_DOWNLOADS = 32
+
+
+def _list_states_from_gcs_backend(
+    backend: GCSBackend, project_name: str, environment_name: str, state_dir: str
+) -> Dict[str, Any]:
+    """Downloads and parses every resource or service flow.state in an environment.
+
+    The state files are listed in a single call and downloaded in parallel. State
+    files whose mirrored copy matches the listed generation are not downloaded.
+    """
+    try:
+        from google.api_core.exceptions import NotFound
+    except ImportError:
+        raise exceptions.MissingGCPDependency()
+
+    gcs_client = get_storage_client()
+    bucket = gcs_client.bucket(backend.bucket)
+    prefix = os.path.join(backend.prefix, project_name, environment_name, state_dir)
+    state_blobs = {}
+    for blob in bucket.list_blobs(prefix=prefix):
+        relative_path = blob.name.replace(prefix + "/", "")
+        split_path = relative_path.split("/")
+        if relative_path.endswith("flow.state") and len(split_path) == 2:
+            state_blobs[blob.name.split("/")[-2]] = blob
+    if not state_blobs:
+        return {}
+
+    def download_state(blob):
+        try:
+            return decode_state(
+                download_mirrored_blob(backend.bucket, blob.name, blob).decode("utf-8")
+            )
+        except NotFound:
+            # The state was deleted after we listed it
+            delete_mirrored_state(backend.bucket, blob.name)
+            return None
+
+    max_workers = min(_MAX_PARALLEL_GCS_DOWNLOADS, len(state_blobs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        states = executor.map(download_state, state_blobs.values())
+        return {
+            name: state
+            for name, state in zip(state_blobs.keys(), states)
+            if state is not None
+        }
+
+
+@dataclasses.dataclass
+class EnvironmentSnapshot:
+    """The state of every resource and service in an environment.
+
+    Planning looks up the state of many resources and services, loading them all
+    up front avoids a round trip to the backend for each lookup.
+    """
+
+    resources: Dict[str, ResourceState]
+    services: Dict[str, ServiceState]
+
+    def get_resource(self, resource_name: str) -> ResourceState:
+        if resource_name not in self.resources:
+            raise exceptions.ResourceNotFound(resource_name)
+        # NOTE: We return a copy so plans can't modify each other's state
+        return self.resources[resource_name].model_copy(deep=True)
+
+    def get_service(self, service_name: str) -> ServiceState:
+        if service_name not in self.services:
+            raise exceptions.ServiceNotFound(service_name)
+        return self.services[service_name].model_copy(deep=True)
+
+
 class EnvironmentManager(BaseManager):
     def __init__(
         self,
@@ -383,31 +461,19 @@ class EnvironmentManager(BaseManager):
                 )
                 return resources
         elif isinstance(self.backend, GCSBackend):
-            resources = {}
-
-            def read_blobs():
-                gcs_client = get_storage_client()
-                bucket = gcs_client.bucket(self.backend.bucket)
-                prefix = os.path.join(
-                    self.backend.prefix,
-                    self.project_name,
-                    self.environment_name,
-                    "resources",
-                )
-                blobs = bucket.list_blobs(prefix=prefix)
-                for blob in blobs:
-                    relative_path = blob.name.replace(prefix + "/", "")
-                    split_path = relative_path.split("/")
-                    if relative_path.endswith("flow.state") and len(split_path) == 2:
-                        resource_name = blob.name.split("/")[-2]
-                        resource = ResourceState.model_validate(
-                            yaml.safe_load(blob.download_as_bytes().decode("utf-8"))
-                        )
-                        resources[resource_name] = resource
-                return resources
-
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, read_blobs)
+            states = await loop.run_in_executor(
+                None,
+                _list_states_from_gcs_backend,
+                self.backend,
+                self.project_name,
+                self.environment_name,
+                "resources",
+            )
+            return {
+                name: ResourceState.model_validate(state)
+                for name, state in states.items()
+            }
         else:
             raise NotImplementedError(f"Unsupported backend: {self.backend}")
 
@@ -458,7 +524,9 @@ class EnvironmentManager(BaseManager):
                             service_name = os.path.basename(dir.path)
                             service_path = os.path.join(dir.path, "flow.state")
                             with open(service_path, "r") as f:
-                                service = ServiceState.model_validate(yaml.safe_load(f))
+                                service = ServiceState.model_validate(
+                                    decode_state(f.read())
+                                )
                                 services[service_name] = service
             return services
         elif isinstance(self.backend, LaunchFlowBackend):
@@ -474,34 +542,28 @@ class EnvironmentManager(BaseManager):
                 )
                 return services
         elif isinstance(self.backend, GCSBackend):
-            services = {}
-
-            def read_blobs():
-                gcs_client = get_storage_client()
-                bucket = gcs_client.bucket(self.backend.bucket)
-                prefix = os.path.join(
-                    self.backend.prefix,
-                    self.project_name,
-                    self.environment_name,
-                    "services",
-                )
-                blobs = bucket.list_blobs(prefix=prefix)
-                for blob in blobs:
-                    relative_path = blob.name.replace(prefix + "/", "")
-                    split_path = relative_path.split("/")
-                    if relative_path.endswith("flow.state") and len(split_path) == 2:
-                        service_name = blob.name.split("/")[-2]
-                        service = ServiceState.model_validate(
-                            yaml.safe_load(blob.download_as_bytes().decode("utf-8"))
-                        )
-                        services[service_name] = service
-                return services
-
             loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, read_blobs)
+            states = await loop.run_in_executor(
+                None,
+                _list_states_from_gcs_backend,
+                self.backend,
+                self.project_name,
+                self.environment_name,
+                "services",
+            )
+            return {
+                name: ServiceState.model_validate(state)
+                for name, state in states.items()
+            }
         else:
             raise NotImplementedError("Unsupported backend: {self.backend}")
 
+    async def load_snapshot(self) -> EnvironmentSnapshot:
+        resources, services = await asyncio.gather(
+            self.list_resources(), self.list_services()
+        )
+        return EnvironmentSnapshot(resources=resources, services=services)
+
     def create_resource_manager(self, resource_name: str) -> ResourceManager:
         return ResourceManager(
             project_name=self.project_name,
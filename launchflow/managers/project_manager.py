@@ -3,7 +3,6 @@ import os
 from typing import Dict, Union
 
 import httpx
-import yaml
 
 from launchflow import exceptions
 from launchflow.backend import GCSBackend, LaunchFlowBackend, LocalBackend
@@ -14,6 +13,7 @@ from launchflow.gcp_clients import get_storage_client, read_from_gcs, write_to_g
 from launchflow.managers.base import BaseManager
 from launchflow.managers.environment_manager import EnvironmentManager
 from launchflow.models.flow_state import EnvironmentState, ProjectState
+from launchflow.state_codec import decode_state, encode_state
 
 
 def _save_local_project_state(project_state: ProjectState, path: str):
@@ -23,7 +23,7 @@ def _save_local_project_state(project_state: ProjectState, path: str):
     flow_path = os.path.join(base_path, "flow.state")
     with open(flow_path, "w") as f:
         json_data = project_state.to_dict()
-        yaml.dump(json_data, f, sort_keys=False)
+        f.write(encode_state(json_data))
 
 
 async def _save_gcs_project_state(
@@ -33,14 +33,17 @@ async def _save_gcs_project_state(
     await write_to_gcs(
         bucket,
         base_path,
-        yaml.dump(project_state.to_dict(), sort_keys=False),
+        encode_state(project_state.to_dict()),
+        mirror=True,
     )
 
 
 async def _load_project_state_from_gcs(project_name: str, backend: GCSBackend):
     flow_path = os.path.join(backend.prefix, project_name, "flow.state")
     try:
-        raw_state = yaml.safe_load(await read_from_gcs(backend.bucket, flow_path))
+        raw_state = decode_state(
+            await read_from_gcs(backend.bucket, flow_path, mirror=True)
+        )
         state = ProjectState.model_validate(raw_state)
         return state
     except exceptions.GCSObjectNotFound:
@@ -70,7 +73,7 @@ def _load_project_state_from_local(project_name: str, backend: LocalBackend):
     flow_path = os.path.join(os.path.abspath(backend.path), project_name, "flow.state")
     try:
         with open(flow_path, "r") as f:
-            raw_project_state = yaml.safe_load(f)
+            raw_project_state = decode_state(f.read())
             project_state = ProjectState.model_validate(raw_project_state)
     except FileNotFoundError:
         raise exceptions.ProjectStateNotFound()
@@ -128,7 +131,7 @@ class ProjectManager(BaseManager):
                             env_name = os.path.basename(dir.path)
                             env_path = os.path.join(dir.path, "flow.state")
                             with open(env_path, "r") as f:
-                                raw_env = yaml.safe_load(f)
+                                raw_env = decode_state(f.read())
                                 env = EnvironmentState.model_validate(raw_env)
                                 envs[env_name] = env
             return envs
@@ -161,9 +164,7 @@ class ProjectManager(BaseManager):
                     split_path = relative_path.split("/")
                     if relative_path.endswith("flow.state") and len(split_path) == 2:
                         env_name = blob.name.split("/")[-2]
-                        raw_env = yaml.safe_load(
-                            blob.download_as_bytes().decode("utf-8")
-                        )
+                        raw_env = decode_state(blob.download_as_bytes().decode("utf-8"))
                         env = EnvironmentState.model_validate(raw_env)
                         envs[env_name] = env
                 return envs
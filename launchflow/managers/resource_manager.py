@@ -4,7 +4,6 @@ import shutil
 from typing import Union
 
 import httpx
-import yaml
 
 from launchflow import exceptions
 from launchflow.backend import GCSBackend, LaunchFlowBackend, LocalBackend
@@ -14,6 +13,7 @@ from launchflow.gcp_clients import get_storage_client, read_from_gcs, write_to_g
 from launchflow.locks import GCSLock, LaunchFlowLock, LocalLock, Lock, LockOperation
 from launchflow.managers.base import BaseManager
 from launchflow.models.flow_state import ResourceState
+from launchflow.state_codec import decode_state, encode_state
 
 # TODO: need to add tests to this file once it is all working
 
@@ -23,7 +23,7 @@ def _load_local_resource(path: str, name: str, project_name: str, env_name: str)
     resource_path = os.path.join(base_resource_path, "flow.state")
     try:
         with open(resource_path, "r") as f:
-            raw_resource = yaml.safe_load(f)
+            raw_resource = decode_state(f.read())
             resource = ResourceState.model_validate(raw_resource)
     except FileNotFoundError:
         raise exceptions.ResourceNotFound(name)
@@ -41,7 +41,7 @@ async def _load_gcs_resource(
         prefix, project_name, environment_name, "resources", resource_name, "flow.state"
     )
     try:
-        raw_state = yaml.safe_load(await read_from_gcs(bucket, env_path))
+        raw_state = decode_state(await read_from_gcs(bucket, env_path, mirror=True))
         state = ResourceState.model_validate(raw_state)
     except exceptions.GCSObjectNotFound:
         raise exceptions.ResourceNotFound(resource_name)
@@ -88,7 +88,7 @@ def _save_local_resource(
         os.makedirs(resource_path)
     with open(resource_file, "w") as f:
         json_data = resource.to_dict()
-        yaml.dump(json_data, f, sort_keys=False)
+        f.write(encode_state(json_data))
 
 
 def _delete_local_resource(
@@ -114,7 +114,8 @@ async def _save_gcs_resource(
     await write_to_gcs(
         bucket,
         resource_path,
-        yaml.dump(resource.to_dict(), sort_keys=False),
+        encode_state(resource.to_dict()),
+        mirror=True,
     )
 
 
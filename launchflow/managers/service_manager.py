@@ -4,7 +4,6 @@ import shutil
 from typing import Union
 
 import httpx
-import yaml
 
 from launchflow import exceptions
 from launchflow.backend import GCSBackend, LaunchFlowBackend, LocalBackend
@@ -14,6 +13,7 @@ from launchflow.gcp_clients import get_storage_client, read_from_gcs, write_to_g
 from launchflow.locks import GCSLock, LaunchFlowLock, LocalLock, Lock, LockOperation
 from launchflow.managers.base import BaseManager
 from launchflow.models.flow_state import ServiceState
+from launchflow.state_codec import decode_state, encode_state
 
 # TODO: need to add tests to this file once it is all working
 
@@ -23,7 +23,7 @@ def _load_local_service(path: str, name: str, project_name: str, env_name: str):
     service_path = os.path.join(base_service_path, "flow.state")
     try:
         with open(service_path, "r") as f:
-            raw_service = yaml.safe_load(f)
+            raw_service = decode_state(f.read())
             service = ServiceState.model_validate(raw_service)
         return service
     except FileNotFoundError:
@@ -42,7 +42,7 @@ async def _load_gcs_service(
         prefix, project_name, environment_name, "services", service_name, "flow.state"
     )
     try:
-        raw_state = yaml.safe_load(await read_from_gcs(bucket, env_path))
+        raw_state = decode_state(await read_from_gcs(bucket, env_path, mirror=True))
         state = ServiceState.model_validate(raw_state)
     except exceptions.GCSObjectNotFound:
         raise exceptions.ServiceNotFound(service_name)
@@ -89,7 +89,7 @@ def _save_local_service(
         os.makedirs(service_path)
     with open(service_file, "w") as f:
         json_data = service.to_dict()
-        yaml.dump(json_data, f, sort_keys=False)
+        f.write(encode_state(json_data))
 
 
 async def _save_gcs_service(
@@ -106,7 +106,8 @@ async def _save_gcs_service(
     await write_to_gcs(
         bucket,
         service_path,
-        yaml.dump(service.to_dict(), sort_keys=False),
+        encode_state(service.to_dict()),
+        mirror=True,
     )
 
 
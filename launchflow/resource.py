@@ -1,19 +1,23 @@
+import asyncio
 import dataclasses
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Set
-
-import yaml
+import threading
+import weakref
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set
 
 import launchflow
 from launchflow import exceptions
 from launchflow.cache import cache
+from launchflow.cache.launchflow_tmp import build_cache_key
+from launchflow.cache.outputs_cache import CachedOutputs
 from launchflow.clients.file_client import read_file
 from launchflow.config import config
 from launchflow.managers.environment_manager import EnvironmentManager
 from launchflow.models.enums import CloudProvider, ResourceProduct
 from launchflow.models.flow_state import EnvironmentState
 from launchflow.node import Inputs, Node, NodeType, T
+from launchflow.state_codec import decode_state
 
 
 @dataclasses.dataclass
@@ -64,23 +68,71 @@ def _load_outputs_from_mounted_volume(resource_uri: _ResourceURI):
             return None
         else:
             with open(local_resource_path) as f:
-                return yaml.safe_load(f)
+                return decode_state(f)
 
 
 # Step 2: Check the cache for outputs, otherwise fetch from remote
-def _load_outputs_from_cache(resource_uri: _ResourceURI):
-    resource_outputs = cache.get_resource_outputs(
+def _load_outputs_from_cache(resource_uri: _ResourceURI) -> Optional[CachedOutputs]:
+    cached_outputs = cache.get_cached_resource_outputs(
         resource_uri.project_name,
         resource_uri.environment_name,
         resource_uri.product,
         resource_uri.resource_name,
     )
-    if resource_outputs is not None:
+    if cached_outputs is not None and cached_outputs.outputs:
         logging.debug(f"Using cached resource outputs for {resource_uri}")
-        return resource_outputs
+        return cached_outputs
+    return None
+
+
+# Holds references to refresh tasks so they aren't garbage collected while running
+_background_refreshes: Set[asyncio.Task] = set()
+
+
+def _refresh_outputs_in_background(resource: "Resource", resource_uri: _ResourceURI):
+    """Refreshes stale cached outputs while the stale outputs keep being served."""
+    if not cache.start_resource_outputs_refresh(
+        resource_uri.project_name,
+        resource_uri.environment_name,
+        resource_uri.product,
+        resource_uri.resource_name,
+    ):
+        # A refresh is already running for this resource
+        return
+
+    async def refresh():
+        success = False
+        try:
+            # NOTE: This updates the cache with the latest outputs
+            await resource.outputs_async(
+                project=resource_uri.project_name,
+                environment=resource_uri.environment_name,
+                use_cache=False,
+            )
+            success = True
+        except Exception as e:
+            logging.warning(f"Failed to refresh outputs for {resource_uri}: {e}")
+        finally:
+            cache.finish_resource_outputs_refresh(
+                resource_uri.project_name,
+                resource_uri.environment_name,
+                resource_uri.product,
+                resource_uri.resource_name,
+                success,
+            )
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Synchronous callers may not have an event loop so we refresh on a thread
+        threading.Thread(target=asyncio.run, args=(refresh(),), daemon=True).start()
+        return
+    task = loop.create_task(refresh())
+    _background_refreshes.add(task)
+    task.add_done_callback(_background_refreshes.discard)
 
 
-# Step 3a: Load artifact bucket from environment variable
+# Step 4a: Load artifact bucket from environment variable
 def _get_artifact_bucket_path_from_local(resource_uri: _ResourceURI):
     if config.env.artifact_bucket is not None:
         # If the bucket env var is set, we use it to build the outputs path
@@ -114,13 +166,42 @@ def _resource_path_from_env(resource_uri: _ResourceURI, env: EnvironmentState) -
     return f"{bucket_url}/resources/{resource_uri.resource_name}.yaml"
 
 
+# Remote lookups that are in flight on each event loop, keyed by what they look up
+_inflight_lookups: "weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Task]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _single_flight(
+    key: str, lookup: Callable[[], Coroutine[Any, Any, Any]]
+) -> Any:
+    """Runs the lookup, sharing the result with concurrent callers with the same key."""
+    loop = asyncio.get_running_loop()
+    inflight = _inflight_lookups.setdefault(loop, {})
+    task = inflight.get(key)
+    if task is None:
+        task = loop.create_task(lookup())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    # NOTE: The lookup is shielded so a cancelled caller doesn't cancel it for the
+    # other callers waiting on it
+    return await asyncio.shield(task)
+
+
 async def _get_artifact_bucket_from_remote_async(resource_uri: _ResourceURI):
-    em = EnvironmentManager(
-        project_name=resource_uri.project_name,
-        environment_name=resource_uri.environment_name,
-        backend=config.launchflow_yaml.backend,
+    async def load_environment():
+        em = EnvironmentManager(
+            project_name=resource_uri.project_name,
+            environment_name=resource_uri.environment_name,
+            backend=config.launchflow_yaml.backend,
+        )
+        return await em.load_environment()
+
+    # Resources in the same environment share a single environment load
+    env = await _single_flight(
+        f"environment:{resource_uri.project_name}:{resource_uri.environment_name}",
+        load_environment,
     )
-    env = await em.load_environment()
     return _resource_path_from_env(resource_uri, env)
 
 
@@ -138,7 +219,7 @@ def _load_outputs_from_remote_bucket(
     resource_outputs_bucket_path: str, resource_name: str
 ):
     try:
-        resource_outputs = yaml.safe_load(read_file(resource_outputs_bucket_path))
+        resource_outputs = decode_state(read_file(resource_outputs_bucket_path))
     except (
         exceptions.FileNotFound,
         exceptions.GCSObjectNotFound,
@@ -226,10 +307,12 @@ class Resource(Node[T]):
 
         if use_cache:
             # Load outputs from cache
-            resource_outputs = _load_outputs_from_cache(resource_uri)
-            if resource_outputs:
+            cached_outputs = _load_outputs_from_cache(resource_uri)
+            if cached_outputs is not None:
                 logging.debug(f"Loaded outputs from cache for {resource_uri}")
-                return _to_output_type(resource_outputs, self._outputs_type)  # type: ignore
+                if cached_outputs.stale:
+                    _refresh_outputs_in_background(self, resource_uri)
+                return _to_output_type(cached_outputs.outputs, self._outputs_type)  # type: ignore
             logging.debug(f"No outputs found in cache for {resource_uri}")
 
         # Load outputs from remote bucket
@@ -277,21 +360,39 @@ class Resource(Node[T]):
 
         if use_cache:
             # Load outputs from cache
-            resource_outputs = _load_outputs_from_cache(resource_uri)
-            if resource_outputs:
+            cached_outputs = _load_outputs_from_cache(resource_uri)
+            if cached_outputs is not None:
                 logging.debug(f"Loaded outputs from cache for {resource_uri}")
-                return _to_output_type(resource_outputs, self._outputs_type)  # type: ignore
+                if cached_outputs.stale:
+                    _refresh_outputs_in_background(self, resource_uri)
+                return _to_output_type(cached_outputs.outputs, self._outputs_type)  # type: ignore
             logging.debug(f"No outputs found in cache for {resource_uri}")
 
         # Load outputs from remote bucket
-        artifact_bucket_path = _get_artifact_bucket_path_from_local(resource_uri)
-        if artifact_bucket_path is None:
-            artifact_bucket_path = await _get_artifact_bucket_from_remote_async(
-                resource_uri
+        async def load_outputs_from_remote():
+            artifact_bucket_path = _get_artifact_bucket_path_from_local(resource_uri)
+            if artifact_bucket_path is None:
+                artifact_bucket_path = await _get_artifact_bucket_from_remote_async(
+                    resource_uri
+                )
+            # NOTE: The GCS / S3 clients are blocking so we read from a thread
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                _load_outputs_from_remote_bucket,
+                artifact_bucket_path,
+                resource_uri.resource_name,
             )
 
-        resource_outputs = _load_outputs_from_remote_bucket(
-            artifact_bucket_path, resource_uri.resource_name
+        # Concurrent lookups of the same resource share a single read
+        resource_outputs = await _single_flight(
+            "outputs:"
+            + build_cache_key(
+                resource_uri.project_name,
+                resource_uri.environment_name,
+                resource_uri.product,
+                resource_uri.resource_name,
+            ),
+            load_outputs_from_remote,
         )
         # NOTE: We still update the cache even if use_cache is False
         cache.set_resource_outputs(
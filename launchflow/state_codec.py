@@ -0,0 +1,57 @@
+"""Encoding and decoding of the state and outputs files LaunchFlow persists.
+
+Files are written as compact JSON, using orjson when it is installed. Files
+written by older versions of LaunchFlow are YAML and can still be read. Since
+JSON is a subset of YAML, older versions of LaunchFlow can also read files
+written in the JSON format.
+"""
+
+import json
+from typing import IO, Any, Optional, Union
+
+import yaml
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+from launchflow.config import config
+
+JSON_FORMAT = "json"
+# The format used by LaunchFlow before the JSON format was introduced
+YAML_FORMAT = "yaml"
+STATE_FORMATS = (JSON_FORMAT, YAML_FORMAT)
+
+
+def encode_state(data: Any, state_format: Optional[str] = None) -> str:
+    if state_format is None:
+        state_format = config.env.state_format
+    if state_format == JSON_FORMAT:
+        if orjson is not None:
+            return orjson.dumps(data).decode("utf-8")
+        return json.dumps(data, separators=(",", ":"))
+    if state_format == YAML_FORMAT:
+        return yaml.dump(data, sort_keys=False)
+    raise ValueError(
+        f"Unsupported state format `{state_format}`, expected one of {STATE_FORMATS}"
+    )
+
+
+def decode_state(data: Union[str, bytes, IO]) -> Any:
+    # NOTE: Streams are accepted for parity with yaml.safe_load
+    if isinstance(data, (str, bytes)):
+        content = data
+    else:
+        content = data.read()
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    if content.lstrip().startswith("{"):
+        try:
+            if orjson is not None:
+                return orjson.loads(content)
+            return json.loads(content)
+        except ValueError:
+            # A YAML flow mapping can also start with a brace
+            pass
+    return yaml.safe_load(content)
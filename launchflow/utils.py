@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import logging
 import logging.handlers
@@ -8,7 +9,7 @@ import sys
 import time
 import traceback
 from io import IOBase
-from typing import IO, Optional, Union
+from typing import IO, AsyncIterator, Iterator, Optional, TypeVar, Union
 
 import httpx
 from requests import Response
@@ -117,3 +118,34 @@ def dump_exception_with_stacktrace(e: Exception, file: IO):
         e,
         exc_info=True,
     )
+
+
+T = TypeVar("T")
+
+
+async def iterate_in_executor(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """Iterates over a blocking iterator without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    done = object()
+    while True:
+        item = await loop.run_in_executor(None, next, iterator, done)
+        if item is done:
+            return
+        yield item  # type: ignore
+
+
+def list_files(directory: str) -> Iterator[str]:
+    """Yields the paths of all files under a directory, relative to it."""
+    for root, _, files in os.walk(directory):
+        for file_name in files:
+            yield os.path.relpath(os.path.join(root, file_name), directory)
+
+
+def is_relative_path(path: str) -> bool:
+    """Returns True if a path stays inside the directory it is relative to."""
+    normalized = os.path.normpath(path)
+    return not (
+        os.path.isabs(normalized)
+        or normalized == os.pardir
+        or normalized.startswith(os.pardir + os.sep)
+    )
@@ -1,7 +1,5 @@
 from typing import Any
 
-import yaml
-
 from launchflow import exceptions
 from launchflow.aws.resource import AWSResource
 from launchflow.backend import Backend
@@ -11,6 +9,7 @@ from launchflow.kubernetes.resource import KubernetesResource
 from launchflow.models.flow_state import EnvironmentState
 from launchflow.models.launchflow_uri import LaunchFlowURI
 from launchflow.resource import _to_output_type
+from launchflow.state_codec import encode_state
 from launchflow.tofu import TofuResource
 from launchflow.workflows.apply_resource_tofu.schemas import ApplyResourceTofuOutputs
 from launchflow.workflows.commands.tf_commands import TFApplyCommand
@@ -24,12 +23,12 @@ async def update_gcp_tofu_resource_outputs(
 ):
     # TODO: it would be nice if we could have some validation here
     output_key = f"resources/{resource_name}.yaml"
-    yaml_data = yaml.safe_dump(outputs)
+    outputs_data = encode_state(outputs)
 
     await write_to_gcs(
         bucket=artifact_bucket,
         prefix=output_key,
-        data=yaml_data,
+        data=outputs_data,
     )
 
 
@@ -40,7 +39,7 @@ async def update_aws_tofu_resource_outputs(
 ):
     # TODO: it would be nice if we could have some validation here
     output_key = f"resources/{resource_name}.yaml"
-    yaml_data = yaml.safe_dump(outputs)
+    outputs_data = encode_state(outputs)
 
     try:
         import boto3
@@ -50,7 +49,7 @@ async def update_aws_tofu_resource_outputs(
     client.put_object(
         Bucket=artifact_bucket,
         Key=output_key,
-        Body=yaml_data,
+        Body=outputs_data,
     )
 
 
@@ -0,0 +1,126 @@
+"""Lists the files of a build context that aren't matched by its ignore patterns.
+
+Every packager (source tarballs, Lambda zips, static site uploads) walks its build
+directory with `walk_build_context` so ignore patterns behave the same everywhere.
+Ignored directories like `node_modules/` are pruned before they are descended into,
+instead of every file inside them being matched one by one.
+"""
+
+import os
+from typing import Iterator, List, Optional, Sequence
+
+from pathspec import PathSpec
+
+# Ignore files whose patterns are relative to the root of the build context instead
+# of matching at any depth like .gitignore patterns do
+_ANCHORED_IGNORE_FILES = {".dockerignore"}
+
+
+def read_ignore_file(file_path: str) -> List[str]:
+    """Returns the patterns in a .gitignore or .dockerignore file.
+
+    .dockerignore patterns only match from the root of the build context, so they
+    are anchored to it before being returned.
+    """
+    anchored = os.path.basename(file_path) in _ANCHORED_IGNORE_FILES
+    patterns = []
+    with open(file_path, "r") as f:
+        for line in f:
+            pattern = line.strip()
+            if not pattern or pattern.startswith("#"):
+                continue
+            if anchored:
+                negated = pattern.startswith("!")
+                pattern = pattern.lstrip("!").lstrip("/")
+                if pattern.startswith("./"):
+                    pattern = pattern[2:]
+                if not pattern.startswith("**"):
+                    pattern = "/" + pattern
+                if negated:
+                    pattern = "!" + pattern
+            patterns.append(pattern)
+    return patterns
+
+
+def compile_ignore_spec(
+    directory: str,
+    ignore_patterns: Sequence[str],
+    ignore_files: Sequence[str] = (),
+) -> PathSpec:
+    """Compiles the ignore patterns of a build context.
+
+    Args:
+        directory: The root of the build context.
+        ignore_patterns: gitignore style patterns to ignore.
+        ignore_files: Names of ignore files in `directory`, like `.gitignore`, whose
+            patterns are ignored as well. Missing files are skipped.
+    """
+    # NOTE: Later patterns take precedence, so duplicates are dropped in order
+    patterns = list(dict.fromkeys(ignore_patterns))
+    for ignore_file in ignore_files:
+        ignore_file_path = os.path.join(directory, ignore_file)
+        if os.path.isfile(ignore_file_path):
+            patterns.extend(read_ignore_file(ignore_file_path))
+    return PathSpec.from_lines("gitwildmatch", patterns)
+
+
+def _prune_spec(spec: PathSpec) -> PathSpec:
+    # A directory can only be skipped if nothing inside it could be re-included, so
+    # only patterns after the last negation are used to prune directories
+    last_negation = -1
+    for i, pattern in enumerate(spec.patterns):
+        if pattern.include is False:
+            last_negation = i
+    return PathSpec(
+        [p for p in spec.patterns[last_negation + 1 :] if p.include is not None]
+    )
+
+
+def walk_build_context(
+    directory: str,
+    ignore_patterns: Sequence[str] = (),
+    ignore_files: Sequence[str] = (),
+    spec: Optional[PathSpec] = None,
+) -> Iterator[str]:
+    """Yields the paths, relative to `directory`, of the files to package.
+
+    Files are yielded in sorted order per directory. Symlinks to directories are
+    skipped and symlinks to files are yielded, the same as `os.walk` would.
+
+    Args:
+        directory: The root of the build context.
+        ignore_patterns: gitignore style patterns to ignore.
+        ignore_files: Names of ignore files in `directory` to read patterns from.
+        spec: A spec from `compile_ignore_spec` to use instead of compiling one.
+    """
+    if spec is None:
+        spec = compile_ignore_spec(directory, ignore_patterns, ignore_files)
+    prune_spec = _prune_spec(spec)
+
+    # NOTE: We keep our own stack instead of recursing so deep trees can't hit the
+    # recursion limit
+    stack = [""]
+    while stack:
+        relative_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(directory, relative_dir)) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            relative_path = os.path.join(relative_dir, entry.name)
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if entry.is_symlink():
+                    continue
+                if prune_spec.match_file(relative_path + "/"):
+                    continue
+                subdirs.append(relative_path)
+            elif not spec.match_file(relative_path):
+                yield relative_path
+        # Subdirectories are pushed in reverse so they're visited in sorted order
+        stack.extend(reversed(subdirs))
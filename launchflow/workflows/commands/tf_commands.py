@@ -1,11 +1,14 @@
 import asyncio
 import dataclasses
+import functools
+import hashlib
 import importlib
 import importlib.resources
 import importlib.util
 import json
 import os
 import shutil
+import tempfile
 from typing import Any, Dict, List, Optional, Union
 
 import httpx
@@ -15,6 +18,15 @@ from launchflow.backend import GCSBackend, LaunchFlowBackend, LocalBackend
 from launchflow.config import config
 from launchflow.logger import logger
 from launchflow.utils import logging_output
+from launchflow.workflows.commands.tf_workspaces import (
+    TofuWorkspace,
+    plugin_cache_dir,
+    plugin_cache_lock,
+    provider_lock_file_path,
+)
+
+# The dependency lock file tofu init writes to the working directory
+_TF_LOCK_FILE = ".terraform.lock.hcl"
 
 _GCS_BACKEND_TEMPLATE = """
 terraform {
@@ -31,6 +43,36 @@ terraform {
 """
 
 
+@functools.lru_cache(maxsize=None)
+def tf_module_hash(tf_module_dir: str) -> str:
+    """Returns a hash of the files of a tf module relative to launchflow/workflows/tf."""
+    hasher = hashlib.sha256()
+    with importlib.resources.path(
+        "launchflow.workflows.tf", "__init__.py"
+    ) as init_path:
+        module_path = init_path.parent / tf_module_dir
+        for file in sorted(module_path.iterdir()):
+            if not file.is_file():
+                continue
+            hasher.update(file.name.encode("utf-8"))
+            hasher.update(file.read_bytes())
+    return hasher.hexdigest()
+
+
+def _save_lock_file(working_dir: str, lock_file_path: str):
+    working_lock_file = os.path.join(working_dir, _TF_LOCK_FILE)
+    if not os.path.exists(working_lock_file):
+        return
+    lock_dir = os.path.dirname(lock_file_path)
+    os.makedirs(lock_dir, exist_ok=True)
+    # NOTE: The lock file is written atomically so concurrent inits never read a
+    # partial lock file
+    fd, tmp_path = tempfile.mkstemp(dir=lock_dir, suffix=".tmp")
+    os.close(fd)
+    shutil.copyfile(working_lock_file, tmp_path)
+    os.replace(tmp_path, lock_file_path)
+
+
 def parse_value(value, type_info):
     if value is None:
         return None
@@ -114,6 +156,32 @@ class TFCommand:
             for file in module_path.iterdir():
                 shutil.copy(file, working_dir)
 
+    def init_fingerprint(self) -> Optional[str]:
+        """Returns a hash of everything `tofu init` depends on.
+
+        This covers the module files and the backend configuration. Returns None
+        if the working directory for this command can't be safely reused.
+        """
+        if isinstance(self.backend, LaunchFlowBackend):
+            # NOTE: LaunchFlow Cloud state is downloaded into the working directory
+            # so we always start from a fresh directory to avoid reusing stale state.
+            return None
+        hasher = hashlib.sha256()
+        hasher.update(self.tf_init_command().encode("utf-8"))
+        hasher.update(type(self.backend).__name__.encode("utf-8"))
+        hasher.update(tf_module_hash(self.tf_module_dir).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def subprocess_env(self) -> Dict[str, str]:
+        env = dict(os.environ)
+        # Share downloaded providers across all working directories
+        env.setdefault("TF_PLUGIN_CACHE_DIR", plugin_cache_dir())
+        # Our modules don't ship a lock file, without this the first init of a
+        # module ignores the plugin cache and downloads its providers again. Later
+        # inits start from a saved lock file, see provider_lock_file_path.
+        env.setdefault("TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE", "true")
+        return env
+
     def tf_init_command(self) -> str:
         if isinstance(self.backend, LocalBackend):
             path = os.path.join(
@@ -139,9 +207,9 @@ class TFCommand:
             raise ValueError(f"Unsupported backend type: {self.backend}")
         return " ".join(command_lines)
 
-    async def run(self, working_dir: str):
+    async def run(self, working_dir: str, workspace: Optional[TofuWorkspace] = None):
         try:
-            return await self._run(working_dir)
+            return await self._run(working_dir, workspace)
         finally:
             tf_state_path = os.path.join(working_dir, self.tf_state_prefix)
 
@@ -164,9 +232,44 @@ class TFCommand:
                             "Failed to upload tofu state, please try again."
                         )
 
-    async def _run(self, working_dir: str):
+    async def _run(self, working_dir: str, workspace: Optional[TofuWorkspace]):
         raise NotImplementedError("_run method not implemented")
 
+    async def _run_init(
+        self, working_dir: str, f, workspace: Optional[TofuWorkspace]
+    ) -> None:
+        if workspace is not None and workspace.is_initialized():
+            logger.info(f"Reusing initialized tofu workspace: {working_dir}")
+            return
+        logger.info(f"Running tofu init command: {self.tf_init_command()}")
+        lock_file_path = provider_lock_file_path(tf_module_hash(self.tf_module_dir))
+        if os.path.exists(lock_file_path):
+            # NOTE: The lock file pins init to the providers that are already in
+            # the plugin cache, so the cache is only read and no lock is needed.
+            shutil.copyfile(lock_file_path, os.path.join(working_dir, _TF_LOCK_FILE))
+            status_code = await self._run_init_command(working_dir, f)
+        else:
+            async with plugin_cache_lock():
+                status_code = await self._run_init_command(working_dir, f)
+                if status_code == 0:
+                    _save_lock_file(working_dir, lock_file_path)
+        if status_code != 0:
+            raise exceptions.TofuInitFailure()
+        if workspace is not None:
+            workspace.mark_initialized()
+
+    async def _run_init_command(self, working_dir: str, f) -> int:
+        proc = await asyncio.create_subprocess_shell(
+            self.tf_init_command(),
+            cwd=working_dir,
+            env=self.subprocess_env(),
+            # Stops the child process from receiving signals sent to the parent
+            preexec_fn=os.setpgrp,
+            stdout=f,
+            stderr=f,
+        )
+        return await proc.wait()
+
     def _var_flags(self):
         var_flags = []
         for key, value in self.tf_vars.items():
@@ -191,29 +294,19 @@ class TFDestroyCommand(TFCommand):
             *self._var_flags(),
         ]
 
-    async def _run(self, working_dir: str):
+    async def _run(self, working_dir: str, workspace: Optional[TofuWorkspace]):
         with logging_output(self.logs_file) as f:
             self.initialize_working_dir(working_dir)
 
             # Run tofu init
-            logger.info(f"Running tofu init command: {self.tf_init_command()}")
-            proc = await asyncio.create_subprocess_shell(
-                self.tf_init_command(),
-                cwd=working_dir,
-                # Stops the child process from receiving signals sent to the parent
-                preexec_fn=os.setpgrp,
-                stdout=f,
-                stderr=f,
-            )
-            status_code = await proc.wait()
-            if status_code != 0:
-                raise exceptions.TofuInitFailure()
+            await self._run_init(working_dir, f, workspace)
 
             # Run tofu destroy
             logger.info(f"Running tofu destroy command: {self.tf_destroy_command()}")
             proc = await asyncio.create_subprocess_exec(
                 *self.tf_destroy_command(),
                 cwd=working_dir,
+                env=self.subprocess_env(),
                 # Stops the child process from receiving signals sent to the parent
                 preexec_fn=os.setpgrp,
                 stdout=f,
@@ -240,29 +333,21 @@ class TFApplyCommand(TFCommand):
             *self._var_flags(),
         ]
 
-    async def _run(self, working_dir: str) -> Dict[str, Any]:
+    async def _run(
+        self, working_dir: str, workspace: Optional[TofuWorkspace]
+    ) -> Dict[str, Any]:
         self.initialize_working_dir(working_dir)
 
         with logging_output(self.logs_file) as f:
             # Run tofu init
-            logger.info(f"Running tofu init command: {self.tf_init_command()}")
-            proc = await asyncio.create_subprocess_shell(
-                self.tf_init_command(),
-                cwd=working_dir,
-                # Stops the child process from receiving signals sent to the parent
-                preexec_fn=os.setpgrp,
-                stdout=f,
-                stderr=f,
-            )
-            status_code = await proc.wait()
-            if status_code != 0:
-                raise exceptions.TofuInitFailure()
+            await self._run_init(working_dir, f, workspace)
 
             # Run tofu apply
             logger.info(f"Running tofu apply command: {self.tf_apply_command()}")
             proc = await asyncio.create_subprocess_exec(
                 *self.tf_apply_command(),
                 cwd=working_dir,
+                env=self.subprocess_env(),
                 # Stops the child process from receiving signals sent to the parent
                 preexec_fn=os.setpgrp,
                 stdout=f,
@@ -278,6 +363,7 @@ class TFApplyCommand(TFCommand):
             proc = await asyncio.create_subprocess_shell(
                 tofu_output_command,
                 cwd=working_dir,
+                env=self.subprocess_env(),
                 stdout=asyncio.subprocess.PIPE,
                 # Stops the child process from receiving signals sent to the parent
                 preexec_fn=os.setpgrp,
@@ -305,23 +391,12 @@ class TFImportCommand(TFApplyCommand):
             resource_id,
         ]
 
-    async def _run(self, working_dir: str):
+    async def _run(self, working_dir: str, workspace: Optional[TofuWorkspace]):
         self.initialize_working_dir(working_dir)
 
         with logging_output(self.logs_file, drop_logs=self.drop_logs) as f:
             # Run tofu init
-            logger.info(f"Running tofu init command: {self.tf_init_command()}")
-            proc = await asyncio.create_subprocess_shell(
-                self.tf_init_command(),
-                cwd=working_dir,
-                # Stops the child process from receiving signals sent to the parent
-                preexec_fn=os.setpgrp,
-                stdout=f,
-                stderr=f,
-            )
-            status_code = await proc.wait()
-            if status_code != 0:
-                raise exceptions.TofuInitFailure()
+            await self._run_init(working_dir, f, workspace)
 
             # Run tofu import
             command = self.tf_import_command(self.resource, self.resource_id)
@@ -329,6 +404,7 @@ class TFImportCommand(TFApplyCommand):
             proc = await asyncio.create_subprocess_exec(
                 *command,
                 cwd=working_dir,
+                env=self.subprocess_env(),
                 # Stops the child process from receiving signals sent to the parent
                 preexec_fn=os.setpgrp,
                 stdout=f,
@@ -0,0 +1,163 @@
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional, Tuple
+
+from launchflow.config import config
+from launchflow.logger import logger
+
+try:
+    import fcntl
+except ImportError:
+    # NOTE: fcntl is not available on Windows, in which case we always fall back
+    # to a fresh temporary directory per run.
+    fcntl = None  # type: ignore
+
+if TYPE_CHECKING:
+    from launchflow.workflows.commands.tf_commands import TFCommand
+
+_INIT_STAMP_FILE = ".launchflow-init"
+
+
+def plugin_cache_dir() -> str:
+    path = os.path.join(config.env.tofu_cache_dir, "plugin-cache")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+@contextlib.asynccontextmanager
+async def plugin_cache_lock() -> AsyncIterator[None]:
+    """Holds an exclusive lock on the shared plugin cache.
+
+    Tofu doesn't guard the plugin cache against concurrent writers, so a
+    `tofu init` that can populate the cache runs under this lock.
+    """
+    if fcntl is None:
+        yield
+        return
+    loop = asyncio.get_running_loop()
+    with open(os.path.join(plugin_cache_dir(), ".lock"), "a") as lock_file:
+        # NOTE: flock blocks until the lock is free, so we wait on it in an
+        # executor to keep the event loop (and other plans) running.
+        await loop.run_in_executor(None, fcntl.flock, lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def provider_lock_file_path(tf_module_hash: str) -> str:
+    """Returns where the dependency lock file of a tf module is saved.
+
+    The lock file is saved by the first `tofu init` of the module, which installs
+    its providers into the plugin cache. Later inits start from the saved lock
+    file, so they select the cached providers and never write to the cache.
+    """
+    # NOTE: This lives in the plugin cache so it's removed with the cache
+    return os.path.join(plugin_cache_dir(), ".provider-locks", f"{tf_module_hash}.hcl")
+
+
+def workspaces_dir() -> str:
+    return os.path.join(config.env.tofu_cache_dir, "workspaces")
+
+
+@dataclasses.dataclass
+class TofuWorkspace:
+    """A reusable tofu working directory.
+
+    A workspace is keyed by (module, backend, state prefix) and remembers the
+    fingerprint of the module files and backend config it was last initialized
+    with. When the fingerprint is unchanged `tofu init` can be skipped entirely.
+    """
+
+    path: str
+    init_fingerprint: str
+
+    @property
+    def _stamp_path(self) -> str:
+        return os.path.join(self.path, _INIT_STAMP_FILE)
+
+    def is_initialized(self) -> bool:
+        if not os.path.isdir(os.path.join(self.path, ".terraform")):
+            return False
+        try:
+            with open(self._stamp_path, "r") as f:
+                return f.read().strip() == self.init_fingerprint
+        except FileNotFoundError:
+            return False
+
+    def mark_initialized(self):
+        with open(self._stamp_path, "w") as f:
+            f.write(self.init_fingerprint)
+
+    def reset(self):
+        """Wipes the workspace so the next run starts from a clean directory."""
+        for entry in os.listdir(self.path):
+            if entry == ".lock":
+                continue
+            full_path = os.path.join(self.path, entry)
+            if os.path.isdir(full_path) and not os.path.islink(full_path):
+                shutil.rmtree(full_path)
+            else:
+                os.remove(full_path)
+
+
+def _workspace_key(command: "TFCommand") -> str:
+    # NOTE: The init command contains the fully resolved backend config (backend
+    # type, bucket / local path and the state prefix).
+    key = f"{command.tf_module_dir}:{command.tf_init_command()}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+@contextlib.contextmanager
+def tofu_workspace(command: "TFCommand") -> Iterator[Optional[TofuWorkspace]]:
+    """Yields a locked, reusable workspace or None if one can't be used.
+
+    When None is yielded the caller should fall back to a temporary directory.
+    This happens when workspace reuse is disabled, the platform does not support
+    file locking, or another process / task is currently using the workspace.
+    """
+    if not config.env.reuse_tofu_workspaces or fcntl is None:
+        yield None
+        return
+    init_fingerprint = command.init_fingerprint()
+    if init_fingerprint is None:
+        yield None
+        return
+
+    path = os.path.join(workspaces_dir(), _workspace_key(command))
+    os.makedirs(path, exist_ok=True)
+    lock_file = open(os.path.join(path, ".lock"), "w")
+    try:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logger.debug(f"Tofu workspace {path} is busy, using a temporary directory")
+            yield None
+            return
+        workspace = TofuWorkspace(path=path, init_fingerprint=init_fingerprint)
+        if not workspace.is_initialized():
+            workspace.reset()
+        try:
+            yield workspace
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+    finally:
+        lock_file.close()
+
+
+@contextlib.contextmanager
+def tofu_working_dir(
+    command: "TFCommand",
+) -> Iterator[Tuple[str, Optional[TofuWorkspace]]]:
+    """Yields a (working_dir, workspace) tuple for running a tofu command."""
+    with tofu_workspace(command) as workspace:
+        if workspace is not None:
+            yield workspace.path, workspace
+            return
+        with tempfile.TemporaryDirectory() as tempdir:
+            yield tempdir, None
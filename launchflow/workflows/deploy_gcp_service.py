@@ -4,18 +4,30 @@ import hashlib
 import io
 import os
 import uuid
-from typing import IO, List
+from typing import IO, Dict, List, Optional
 
 import requests
 from docker.errors import APIError, BuildError
-from pathspec import PathSpec
 
 from launchflow import exceptions
+from launchflow.cache.runtime_manifest import runtime_manifest_files
 from launchflow.config import config
 from launchflow.gcp.firebase_site import FirebaseStaticSite
 from launchflow.gcp.static_site import GCSWebsite
 from launchflow.models.flow_state import GCPEnvironmentConfig
-from launchflow.workflows.utils import tar_source_in_memory
+from launchflow.workflows.build_context import walk_build_context
+from launchflow.workflows.static_site_sync import (
+    cdn_invalidation_paths,
+    sync_static_site,
+)
+from launchflow.workflows.utils import (
+    SOURCE_UPLOAD_CHUNK_SIZE,
+    list_source_files,
+    source_digest,
+    source_image_tag,
+    source_tarball_path,
+    tar_source,
+)
 
 
 async def _upload_source_tarball_to_gcs(
@@ -23,6 +35,8 @@ async def _upload_source_tarball_to_gcs(
     artifact_bucket: str,
     local_source_dir: str,
     build_ignore: List[str],
+    relative_paths: Optional[List[str]] = None,
+    extra_files: Optional[Dict[str, str]] = None,
 ):
     try:
         from google.cloud import storage  # type: ignore
@@ -30,13 +44,37 @@ async def _upload_source_tarball_to_gcs(
         raise exceptions.MissingGCPDependency()
 
     def upload_async():
-        source_tarball = tar_source_in_memory(local_source_dir, build_ignore)
         try:
             bucket = storage.Client().get_bucket(artifact_bucket)
             blob = bucket.blob(source_tarball_gcs_path)
-            blob.upload_from_file(source_tarball)
+            # Tarballs are stored by the digest of their contents, so an existing
+            # object already holds this exact source tree
+            if config.env.source_cache and blob.exists():
+                return
         except Exception:
             raise exceptions.UploadSrcTarballFailed()
+        try:
+            # The tarball is streamed into a resumable upload as it is built, so only
+            # one chunk of it is held in memory at a time
+            with blob.open(
+                "wb", chunk_size=SOURCE_UPLOAD_CHUNK_SIZE, ignore_flush=True
+            ) as f:
+                tar_source(
+                    local_source_dir,
+                    build_ignore,
+                    f,
+                    compresslevel=config.env.build_compression_level,
+                    relative_paths=relative_paths,
+                    extra_files=extra_files,
+                )
+        except Exception:
+            # NOTE: The writer finalizes whatever was written when it is closed, so
+            # we remove the partial tarball instead of leaving it for a later build
+            try:
+                blob.delete()
+            except Exception:
+                pass
+            raise exceptions.UploadSrcTarballFailed()
 
     loop = asyncio.get_event_loop()
     await loop.run_in_executor(None, upload_async)
@@ -53,6 +91,7 @@ async def _run_docker_gcp_cloud_build(
     artifact_bucket: str,
     service_account_email: str,
     build_log_file: IO,
+    source_tag: Optional[str] = None,
 ):
     try:
         from google.cloud.devtools import cloudbuild_v1
@@ -61,6 +100,13 @@ async def _run_docker_gcp_cloud_build(
 
     latest_image_name = f"{docker_repository}/{docker_image_name}:latest"
     tagged_image_name = f"{docker_repository}/{docker_image_name}:{docker_image_tag}"
+    image_names = [latest_image_name, tagged_image_name]
+    # NOTE: The source tag lets later deploys of the same source reuse this image
+    if source_tag is not None:
+        image_names.append(f"{docker_repository}/{docker_image_name}:{source_tag}")
+    tag_args = []
+    for image_name in image_names:
+        tag_args.extend(["-t", image_name])
 
     # Create the Cloud Build build plan
     build = cloudbuild_v1.Build(
@@ -86,10 +132,7 @@ async def _run_docker_gcp_cloud_build(
                 name="gcr.io/cloud-builders/docker",
                 args=[
                     "build",
-                    "-t",
-                    latest_image_name,
-                    "-t",
-                    tagged_image_name,
+                    *tag_args,
                     "--cache-from",
                     latest_image_name,
                     "-f",
@@ -99,7 +142,7 @@ async def _run_docker_gcp_cloud_build(
             ),
         ],
         # NOTE: This is what pushes the image to the registry
-        images=[latest_image_name, tagged_image_name],
+        images=image_names,
     )
     # Submit the build to Cloud Build
     cloud_build_client = cloudbuild_v1.CloudBuildAsyncClient()
@@ -127,6 +170,42 @@ async def _run_docker_gcp_cloud_build(
     return tagged_image_name
 
 
+_IMAGE_MANIFEST_MEDIA_TYPES = [
+    "application/vnd.docker.distribution.manifest.v2+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.oci.image.index.v1+json",
+]
+
+
+def _artifact_registry_image_exists(docker_image: str) -> bool:
+    """Returns whether a tagged image exists in an Artifact Registry repository."""
+    try:
+        import google.auth
+        import google.auth.transport.requests
+    except ImportError:
+        raise exceptions.MissingGCPDependency()
+
+    registry_host, _, image_path = docker_image.partition("/")
+    image_path, _, tag = image_path.rpartition(":")
+    try:
+        creds, _ = google.auth.default(
+            scopes=["https://www.googleapis.com/auth/cloud-platform"]
+        )
+        session = google.auth.transport.requests.AuthorizedSession(creds)
+        # NOTE: This is a HEAD request against the registry API so the image's
+        # manifest isn't downloaded
+        response = session.head(
+            f"https://{registry_host}/v2/{image_path}/manifests/{tag}",
+            headers={"Accept": ", ".join(_IMAGE_MANIFEST_MEDIA_TYPES)},
+            timeout=30,
+        )
+    except Exception:
+        # We fall back to building the image if the registry can't be checked
+        return False
+    return response.status_code == 200
+
+
 def _write_build_logs(f: IO, log_stream):
     for chunk in log_stream:
         if "stream" in chunk:
@@ -369,17 +448,23 @@ async def upload_local_files_to_static_site(
         static_site.build_directory,
     )
 
-    def should_include_file(pathspec: PathSpec, file_path: str, root_dir: str):
-        relative_path = os.path.relpath(file_path, root_dir)
-        return not pathspec.match_file(relative_path)
+    def sync():
+        relative_paths = list(walk_build_context(local_dir, static_site.build_ignore))
+        return sync_static_site(
+            bucket,
+            local_dir,
+            relative_paths,
+            cache_control=static_site.cache_control,
+            gzip_files=static_site.gzip_files,
+            delete_stale_files=static_site.delete_stale_files,
+            max_workers=static_site.max_upload_workers,
+        )
 
-    pathspec = PathSpec.from_lines("gitwildmatch", static_site.build_ignore)
-    for root, _, files in os.walk(local_dir):
-        for file in files:
-            file_path = os.path.join(root, file)
-            if should_include_file(pathspec, file_path, local_dir):
-                blob = bucket.blob(os.path.relpath(file_path, local_dir))
-                blob.upload_from_filename(file_path)
+    loop = asyncio.get_event_loop()
+    sync_result = await loop.run_in_executor(None, sync)
+    # Nothing to invalidate if every file was already up to date
+    if not sync_result.changed:
+        return service_url
 
     # Authenticate with the docker registry
     creds, _ = google.auth.default(
@@ -390,41 +475,42 @@ async def upload_local_files_to_static_site(
     # Build the Compute Engine service object
     compute_service = build("compute", "v1", credentials=creds)
 
-    # Invalidate the cache for the specified URL map
-    request_body = {
-        "path": "/*",
-    }
-    request_id = str(uuid.uuid4())  # Generate a unique request ID
-
     url_map_name = backend_bucket_outputs.url_map_resource_id.split("/")[-1]
-    # Perform the cache invalidation request
-    operation = (
-        compute_service.urlMaps()
-        .invalidateCache(
-            project=gcp_environment_config.project_id,  # type: ignore
-            urlMap=url_map_name,
-            body=request_body,
-            requestId=request_id,
+    # Invalidate the cache for only the paths that changed
+    operations = []
+    for path in cdn_invalidation_paths(sync_result.changed):
+        request_id = str(uuid.uuid4())  # Generate a unique request ID
+        operation = (
+            compute_service.urlMaps()
+            .invalidateCache(
+                project=gcp_environment_config.project_id,  # type: ignore
+                urlMap=url_map_name,
+                body={"path": path},
+                requestId=request_id,
+            )
+            .execute()
         )
-        .execute()
-    )
+        operations.append(operation)
 
     if static_site.wait_for_cdn_invalidation:
-        while True:
-            result = (
-                compute_service.globalOperations()
-                .get(
-                    project=gcp_environment_config.project_id,
-                    operation=operation["name"],
+        for operation in operations:
+            while True:
+                result = (
+                    compute_service.globalOperations()
+                    .get(
+                        project=gcp_environment_config.project_id,
+                        operation=operation["name"],
+                    )
+                    .execute()
                 )
-                .execute()
-            )
 
-            if result["status"] == "DONE":
-                if "error" in result:
-                    raise Exception(f"Operation failed with errors: {result['error']}")
-                break
-            await asyncio.sleep(5)
+                if result["status"] == "DONE":
+                    if "error" in result:
+                        raise Exception(
+                            f"Operation failed with errors: {result['error']}"
+                        )
+                    break
+                await asyncio.sleep(5)
 
     return service_url
 
@@ -487,13 +573,6 @@ async def deploy_local_files_to_firebase_static_site(
     if not VERSION_ID:
         raise ValueError("Failed to create a new version. VERSION_ID not found.")
 
-    pathspec = PathSpec.from_lines("gitwildmatch", firebase_static_site.build_ignore)
-
-    # Function to determine if a file should be included based on pathspec rules
-    def should_include_file(pathspec: PathSpec, file_path: str, root_dir: str):
-        relative_path = os.path.relpath(file_path, root_dir)
-        return not pathspec.match_file(relative_path)
-
     # Function to compress a file in memory and calculate its SHA256 hash
     def gzip_and_hash_file(file_path):
         # Open the file and compress it in memory
@@ -515,13 +594,11 @@ async def deploy_local_files_to_firebase_static_site(
     files_to_deploy = {}
 
     # Walk the directory tree and process each file
-    for root, _, files in os.walk(local_dir):
-        for file in files:
-            file_path = os.path.join(root, file)
-            if should_include_file(pathspec, file_path, local_dir):
-                file_hash, _ = gzip_and_hash_file(file_path)
-                relative_path = os.path.relpath(file_path, local_dir)
-                files_to_deploy[f"/{relative_path}"] = file_hash
+    for relative_path in walk_build_context(
+        local_dir, firebase_static_site.build_ignore
+    ):
+        file_hash, _ = gzip_and_hash_file(os.path.join(local_dir, relative_path))
+        files_to_deploy[f"/{relative_path}"] = file_hash
 
     # Step 4: Populate files for the new version
     populate_files_request_body = {"files": files_to_deploy}
@@ -629,16 +706,47 @@ async def build_artifact_registry_docker_image(
             build_log_file=build_log_file,
         )
     else:
-        source_tarball_gcs_path = f"builds/{launchflow_project_name}/{launchflow_environment_name}/services/{launchflow_service_name}/source.tar.gz"
-        # Step 1 - Upload the source tarball to GCS
+        loop = asyncio.get_event_loop()
+        relative_paths = await loop.run_in_executor(
+            None, list_source_files, build_directory, build_ignore
+        )
+        manifest_files = runtime_manifest_files(
+            build_directory, launchflow_deployment_id
+        )
+        digest = await loop.run_in_executor(
+            None, source_digest, build_directory, relative_paths, manifest_files
+        )
+        image_tag = source_image_tag(digest, dockerfile_path)
+        # Step 1 - Reuse the image if one was already built from identical source
+        if config.env.source_cache:
+            cached_image = (
+                f"{artifact_registry_repository}/{launchflow_service_name}:{image_tag}"
+            )
+            if await loop.run_in_executor(
+                None, _artifact_registry_image_exists, cached_image
+            ):
+                build_log_file.write(
+                    f"Source is unchanged, reusing image {cached_image}\n"
+                )
+                return cached_image
+
+        source_tarball_gcs_path = source_tarball_path(
+            launchflow_project_name,
+            launchflow_environment_name,
+            launchflow_service_name,
+            digest,
+        )
+        # Step 2 - Upload the source tarball to GCS
         await _upload_source_tarball_to_gcs(
             source_tarball_gcs_path=source_tarball_gcs_path,
             artifact_bucket=gcp_environment_config.artifact_bucket,  # type: ignore
             local_source_dir=build_directory,
             build_ignore=build_ignore,
+            relative_paths=relative_paths,
+            extra_files=manifest_files,
         )
 
-        # Step 2 - Build and push the docker image
+        # Step 3 - Build and push the docker image
         return await _run_docker_gcp_cloud_build(
             docker_repository=artifact_registry_repository,
             docker_image_name=launchflow_service_name,
@@ -650,6 +758,7 @@ async def build_artifact_registry_docker_image(
             artifact_bucket=gcp_environment_config.artifact_bucket,  # type: ignore
             service_account_email=gcp_environment_config.service_account_email,  # type: ignore
             build_log_file=build_log_file,
+            source_tag=image_tag,
         )
 
     return docker_image
@@ -1,9 +1,8 @@
 import tempfile
 
-import yaml
-
 from launchflow import exceptions
 from launchflow.gcp_clients import write_to_gcs
+from launchflow.state_codec import encode_state
 from launchflow.workflows.commands.tf_commands import TFApplyCommand, TFImportCommand
 from launchflow.workflows.import_tofu_resource.schemas import (
     ImportResourceTofuInputs,
@@ -69,12 +68,12 @@ async def import_tofu_resource(inputs: ImportResourceTofuInputs):
         output = await tf_apply_command.run(tempdir)
         # TODO: it would be nice if we could have some validation here
         output_key = f"resources/{inputs.launchflow_uri.resource_name}.yaml"
-        yaml_data = yaml.safe_dump(output)
+        outputs_data = encode_state(output)
         if inputs.gcp_env_config is not None:
             await write_to_gcs(
                 bucket=inputs.gcp_env_config.artifact_bucket,  # type: ignore
                 prefix=output_key,
-                data=yaml_data,
+                data=outputs_data,
             )
         if inputs.aws_env_config is not None:
             try:
@@ -85,7 +84,7 @@ async def import_tofu_resource(inputs: ImportResourceTofuInputs):
             client.put_object(
                 Bucket=inputs.aws_env_config.artifact_bucket,  # type: ignore
                 Key=output_key,
-                Body=yaml_data,
+                Body=outputs_data,
             )
 
     return ImportResourceTofuOutputs(
@@ -0,0 +1,201 @@
+"""Syncs the files of a static site to the bucket that serves it.
+
+Only files whose contents or upload settings changed since the last deploy are
+uploaded, so the CDN only needs to be invalidated for the paths that changed.
+"""
+
+import base64
+import dataclasses
+import gzip
+import hashlib
+import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from launchflow.gcp.gcs import DEFAULT_MAX_WORKERS
+
+# Stores the md5 of the uncompressed file, since the md5 GCS reports for gzipped
+# objects is of the compressed bytes
+CONTENT_MD5_METADATA_KEY = "launchflow-content-md5"
+# Past this many changed paths a single `/*` invalidation is issued instead
+MAX_TARGETED_INVALIDATIONS = 20
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_DEFAULT_CONTENT_TYPE = "application/octet-stream"
+_GZIP_CONTENT_TYPES = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/wasm",
+    "application/xml",
+    "image/svg+xml",
+}
+_LIST_FIELDS = "items(name,md5Hash,cacheControl,contentEncoding,metadata),nextPageToken"
+
+
+@dataclasses.dataclass
+class StaticSiteSyncResult:
+    uploaded: List[str]
+    deleted: List[str]
+    unchanged: int
+
+    @property
+    def changed(self) -> List[str]:
+        return self.uploaded + self.deleted
+
+
+def guess_content_type(relative_path: str) -> str:
+    content_type, _ = mimetypes.guess_type(relative_path)
+    return content_type or _DEFAULT_CONTENT_TYPE
+
+
+def should_gzip(content_type: str) -> bool:
+    return content_type.startswith("text/") or content_type in _GZIP_CONTENT_TYPES
+
+
+def local_md5(file_path: str) -> str:
+    """Returns the base64 encoded md5 of a file, in the format GCS reports it."""
+    md5 = hashlib.md5()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            md5.update(chunk)
+    return base64.b64encode(md5.digest()).decode("utf-8")
+
+
+def _is_unchanged(
+    blob, content_md5: str, gzipped: bool, cache_control: Optional[str]
+) -> bool:
+    if blob.cache_control != cache_control:
+        return False
+    if (blob.content_encoding == "gzip") != gzipped:
+        return False
+    stored_md5 = (blob.metadata or {}).get(CONTENT_MD5_METADATA_KEY)
+    if stored_md5 is not None:
+        return stored_md5 == content_md5
+    # NOTE: Objects uploaded before the content md5 was stored can only be compared
+    # when they weren't compressed
+    return not gzipped and blob.md5_hash == content_md5
+
+
+def _upload_file(
+    bucket,
+    local_dir: str,
+    relative_path: str,
+    content_md5: str,
+    gzip_files: bool,
+    cache_control: Optional[str],
+):
+    content_type = guess_content_type(relative_path)
+    blob = bucket.blob(relative_path)
+    blob.cache_control = cache_control
+    blob.metadata = {CONTENT_MD5_METADATA_KEY: content_md5}
+    file_path = os.path.join(local_dir, relative_path)
+    if gzip_files and should_gzip(content_type):
+        with open(file_path, "rb") as f:
+            data = gzip.compress(f.read(), compresslevel=9, mtime=0)
+        blob.content_encoding = "gzip"
+        blob.upload_from_string(data, content_type=content_type)
+    else:
+        blob.upload_from_filename(file_path, content_type=content_type)
+
+
+def sync_static_site(
+    bucket,
+    local_dir: str,
+    relative_paths: Sequence[str],
+    *,
+    cache_control: Optional[str] = None,
+    gzip_files: bool = False,
+    delete_stale_files: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> StaticSiteSyncResult:
+    """Uploads the files of a static site that differ from the objects in a bucket.
+
+    Args:
+        bucket: The `google.cloud.storage.Bucket` that serves the site.
+        local_dir: The directory of static files.
+        relative_paths: The paths of the files to serve, relative to `local_dir`.
+        cache_control: The Cache-Control header to serve the files with.
+        gzip_files: Whether to store text files gzipped. GCS decompresses them for
+            clients that don't accept gzip.
+        delete_stale_files: Whether to delete objects that have no local file.
+        max_workers: The max number of files to hash, upload or delete at once.
+
+    Returns:
+        StaticSiteSyncResult: The paths that were uploaded and deleted.
+    """
+    remote_blobs = {blob.name: blob for blob in bucket.list_blobs(fields=_LIST_FIELDS)}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        content_md5s = list(
+            executor.map(
+                local_md5, [os.path.join(local_dir, p) for p in relative_paths]
+            )
+        )
+
+        uploads: List[Tuple[str, str]] = []
+        for relative_path, content_md5 in zip(relative_paths, content_md5s):
+            blob = remote_blobs.get(relative_path)
+            gzipped = gzip_files and should_gzip(guess_content_type(relative_path))
+            if blob is None or not _is_unchanged(
+                blob, content_md5, gzipped, cache_control
+            ):
+                uploads.append((relative_path, content_md5))
+
+        # NOTE: Pages are uploaded after every other file so a new page is never
+        # served before the assets it references exist
+        assets = [u for u in uploads if not u[0].endswith(".html")]
+        pages = [u for u in uploads if u[0].endswith(".html")]
+        for batch in (assets, pages):
+            # NOTE: list() is used to raise the first upload error, if any
+            list(
+                executor.map(
+                    lambda upload: _upload_file(
+                        bucket,
+                        local_dir,
+                        upload[0],
+                        upload[1],
+                        gzip_files,
+                        cache_control,
+                    ),
+                    batch,
+                )
+            )
+
+        deleted: List[str] = []
+        if delete_stale_files:
+            local_paths = set(relative_paths)
+            deleted = sorted(name for name in remote_blobs if name not in local_paths)
+            list(executor.map(lambda name: bucket.blob(name).delete(), deleted))
+
+    return StaticSiteSyncResult(
+        uploaded=[relative_path for relative_path, _ in uploads],
+        deleted=deleted,
+        unchanged=len(relative_paths) - len(uploads),
+    )
+
+
+def cdn_invalidation_paths(
+    changed_paths: Iterable[str],
+    main_page_suffix: str = "index.html",
+    max_paths: int = MAX_TARGETED_INVALIDATIONS,
+) -> List[str]:
+    """Returns the URL paths to invalidate in the CDN for the changed objects.
+
+    Pages served for a directory, like `docs/index.html`, are invalidated at the
+    directory's paths too. If more than `max_paths` paths changed, `/*` is returned.
+    """
+    paths: Dict[str, None] = {}
+    for changed_path in changed_paths:
+        paths["/" + changed_path] = None
+        if os.path.basename(changed_path) == main_page_suffix:
+            directory = os.path.dirname(changed_path)
+            if directory:
+                paths[f"/{directory}"] = None
+                paths[f"/{directory}/"] = None
+            else:
+                paths["/"] = None
+    if len(paths) > max_paths:
+        return ["/*"]
+    return list(paths)
@@ -1,14 +1,17 @@
+import gzip
+import hashlib
 import io
 import os
 import random
 import tarfile
 import tempfile
 import zipfile
-from typing import IO, Generator, List, Optional, Union
-
-from pathspec import PathSpec
+from typing import IO, Dict, Generator, List, Optional, Sequence, Set, Union
 
+from launchflow.config import config
+from launchflow.workflows.build_context import walk_build_context
 from launchflow.workflows.commands.tf_commands import TFCommand
+from launchflow.workflows.commands.tf_workspaces import tofu_working_dir
 
 
 # NOTE: The first time this generator is called, it will yield the base_name. Every
@@ -39,8 +42,10 @@ def unique_resource_name_generator(
 
 # TODO: fix type hints so the outputs are correct (destroy returns bool, apply returns outputs)
 async def run_tofu(command: TFCommand):
-    with tempfile.TemporaryDirectory() as tempdir:
-        return await command.run(tempdir)
+    # NOTE: This reuses a persistent workspace when possible so repeated applies
+    # of the same module can skip `tofu init`.
+    with tofu_working_dir(command) as (working_dir, workspace):
+        return await command.run(working_dir, workspace)
 
 
 DEFAULT_IGNORE_PATTERNS = [
@@ -49,58 +54,179 @@ DEFAULT_IGNORE_PATTERNS = [
     ".env",
     ".git/",
     ".terraform/",
+    # LaunchFlow's local state, packagers add the runtime manifest explicitly
+    ".launchflow/",
 ]
 
 
-def tar_source_in_memory(directory: str, ignore_patterns: List[str]):
-    ignore_patterns = list(set(ignore_patterns + DEFAULT_IGNORE_PATTERNS))
+# NOTE: 6 is zlib's default and is much faster than 9 for a few percent larger output
+DEFAULT_COMPRESSION_LEVEL = 6
+# Tarballs larger than this are spilled to disk instead of being held in memory
+DEFAULT_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+# The size of each chunk source tarballs are uploaded in, this bounds how much of the
+# tarball is held in memory while it is streamed to a bucket
+SOURCE_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
 
-    def should_include_file(pathspec: PathSpec, file_path: str, root_dir: str):
-        relative_path = os.path.relpath(file_path, root_dir)
-        return not pathspec.match_file(relative_path)
 
-    pathspec = PathSpec.from_lines("gitwildmatch", ignore_patterns)
+def list_source_files(directory: str, ignore_patterns: List[str]) -> List[str]:
+    """Returns the sorted paths, relative to `directory`, of the files to package."""
+    relative_paths = walk_build_context(
+        directory,
+        ignore_patterns + DEFAULT_IGNORE_PATTERNS,
+        ignore_files=config.env.build_ignore_files,
+    )
+    # NOTE: We sort by path so the tarball doesn't depend on the filesystem's order
+    return sorted(relative_paths)
 
-    # Use BytesIO object as an in-memory file
-    in_memory_tar = io.BytesIO()
 
-    # Open the tarfile using the in-memory file-like object
-    with tarfile.open(fileobj=in_memory_tar, mode="w:gz") as tar:
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if should_include_file(pathspec, file_path, directory):
-                    tar.add(file_path, arcname=os.path.relpath(file_path, directory))
+def _normalize_tarinfo(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo:
+    # Drop everything that depends on the machine or checkout instead of the
+    # contents, so identical source trees produce identical tarballs
+    tarinfo.mtime = 0
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = ""
+    if tarinfo.isfile():
+        tarinfo.mode = 0o755 if tarinfo.mode & 0o111 else 0o644
+    return tarinfo
 
-    # Seek to the beginning of the in-memory file
-    in_memory_tar.seek(0)
 
-    # Return the in-memory file
-    return in_memory_tar
+def tar_source(
+    directory: str,
+    ignore_patterns: List[str],
+    fileobj: IO[bytes],
+    compresslevel: int = DEFAULT_COMPRESSION_LEVEL,
+    relative_paths: Optional[List[str]] = None,
+    extra_files: Optional[Dict[str, str]] = None,
+):
+    """Writes a gzipped tarball of `directory` to `fileobj` as it is built.
+
+    The tarball is written sequentially and `fileobj` never needs to be seekable, so
+    it can be an upload stream and compression overlaps with the upload. Entries are
+    sorted and their timestamps and owners are normalized, so the same files always
+    produce the same tarball.
+
+    `relative_paths` can be passed if the files to include were already listed with
+    `list_source_files`. `extra_files` maps paths in the tarball to files outside of
+    `directory` to add as well, like the runtime manifest.
+    """
+    if relative_paths is None:
+        relative_paths = list_source_files(directory, ignore_patterns)
+
+    # NOTE: We compress with our own GzipFile since tarfile's stream mode doesn't
+    # accept a compression level on all the python versions we support
+    with gzip.GzipFile(
+        fileobj=fileobj, mode="wb", compresslevel=compresslevel, mtime=0
+    ) as gz:
+        with tarfile.open(fileobj=gz, mode="w|") as tar:  # type: ignore
+            for relative_path in relative_paths:
+                tar.add(
+                    os.path.join(directory, relative_path),
+                    arcname=relative_path,
+                    recursive=False,
+                    filter=_normalize_tarinfo,
+                )
+            for arcname, file_path in sorted((extra_files or {}).items()):
+                tar.add(
+                    file_path,
+                    arcname=arcname,
+                    recursive=False,
+                    filter=_normalize_tarinfo,
+                )
+
+
+def source_digest(
+    directory: str,
+    relative_paths: List[str],
+    extra_files: Optional[Dict[str, str]] = None,
+) -> str:
+    """Returns a digest of the files that `tar_source` would package."""
+    from launchflow.cache.source_index import compute_source_digest, hash_file
+
+    digest = compute_source_digest(directory, relative_paths)
+    if not extra_files:
+        return digest
+    # NOTE: Extra files are keyed by their contents, so a runtime manifest with the
+    # same outputs doesn't change the digest between deployments
+    combined = hashlib.sha256(digest.encode("utf-8"))
+    for arcname, file_path in sorted(extra_files.items()):
+        combined.update(f"{arcname}\0{hash_file(file_path)}\n".encode())
+    return combined.hexdigest()
+
+
+def source_tarball_path(
+    project_name: str, environment_name: str, service_name: str, digest: str
+) -> str:
+    # NOTE: Each tarball gets its own folder since CodeBuild downloads every object
+    # under the source location
+    return f"builds/{project_name}/{environment_name}/services/{service_name}/sources/{digest}/source.tar.gz"
+
+
+def source_image_tag(digest: str, *build_args: Optional[str]) -> str:
+    """Returns the image tag for images built from a source digest.
+
+    `build_args` are anything besides the source that changes the image, like the
+    dockerfile path.
+    """
+    key = ":".join([digest] + [arg or "" for arg in build_args])
+    return "src-" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:40]
+
+
+def tar_source_in_memory(
+    directory: str,
+    ignore_patterns: List[str],
+    compresslevel: int = DEFAULT_COMPRESSION_LEVEL,
+    max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+) -> IO[bytes]:
+    """Returns a gzipped tarball of `directory` as a seekable file.
+
+    The tarball is held in memory until it grows past `max_size` bytes, after which
+    it is spilled to a temporary file on disk.
+    """
+    spooled_tar = tempfile.SpooledTemporaryFile(max_size=max_size)
+    tar_source(directory, ignore_patterns, spooled_tar, compresslevel)  # type: ignore
+    # Seek to the beginning of the file so it can be read
+    spooled_tar.seek(0)
+    return spooled_tar  # type: ignore
 
 
 def zip_source(
     directory: str,
     ignore_patterns: List[str],
     file: Union[str, IO[bytes]] = io.BytesIO(),
+    compresslevel: int = DEFAULT_COMPRESSION_LEVEL,
+    extra_directories: Sequence[str] = (),
+    extra_files: Optional[Dict[str, str]] = None,
 ):
-    ignore_patterns = list(set(ignore_patterns + DEFAULT_IGNORE_PATTERNS))
-
-    def should_include_file(pathspec: PathSpec, file_path: str, root_dir: str):
-        relative_path = os.path.relpath(file_path, root_dir)
-        return not pathspec.match_file(relative_path)
-
-    pathspec = PathSpec.from_lines("gitwildmatch", ignore_patterns)
-
-    with zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
-        for root, dirs, files in os.walk(directory):
-            for maybe_inclue in files:
-                file_path = os.path.join(root, maybe_inclue)
+    """Zips the files of `directory` into `file`.
+
+    Files in `extra_directories`, like installed dependencies, are added to the root
+    of the zip as well. If a path exists in more than one directory, the first one
+    added wins. `extra_files` maps paths in the zip to individual files to add, like
+    the runtime manifest.
+    """
+    ignore_patterns = ignore_patterns + DEFAULT_IGNORE_PATTERNS
+    added_paths: Set[str] = set()
+
+    with zipfile.ZipFile(
+        file, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+    ) as zipf:
+        for root_dir in [directory, *extra_directories]:
+            relative_paths = walk_build_context(
+                root_dir,
+                ignore_patterns,
+                ignore_files=config.env.build_ignore_files,
+            )
+            for relative_path in relative_paths:
+                file_path = os.path.join(root_dir, relative_path)
                 if isinstance(file, str) and file_path == file:
                     # Don't attempt to include our zip file in the zip file
                     continue
-                if should_include_file(pathspec, file_path, directory):
-                    zipf.write(file_path, os.path.relpath(file_path, directory))
+                if relative_path in added_paths:
+                    continue
+                added_paths.add(relative_path)
+                zipf.write(file_path, relative_path)
+        for arcname, file_path in sorted((extra_files or {}).items()):
+            zipf.write(file_path, arcname)
 
     if isinstance(file, str):
         return file
@@ -0,0 +1,70 @@
+"""Compares walking a build context with and without pruning ignored directories.
+
+Builds a synthetic tree where most files live under ignored directories, like a
+JavaScript project with node_modules/, then times os.walk with per-file matching
+against launchflow.workflows.build_context.walk_build_context.
+
+Usage:
+    python scripts/benchmarks/build_context_benchmark.py --files 100000
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+from pathspec import PathSpec
+
+from launchflow.workflows.build_context import walk_build_context
+
+_IGNORE_PATTERNS = ["node_modules/", ".venv/", "__pycache__/", "*.log", ".git/"]
+
+
+def _synthetic_tree(root: str, num_files: int, ignored_fraction: float):
+    num_ignored = int(num_files * ignored_fraction)
+    for i in range(num_files):
+        if i < num_ignored:
+            top = "node_modules" if i % 2 else ".venv"
+            directory = os.path.join(root, top, f"pkg{i // 100}", "lib")
+        else:
+            directory = os.path.join(root, "src", f"module{i // 100}")
+        os.makedirs(directory, exist_ok=True)
+        open(os.path.join(directory, f"file{i}.py"), "w").close()
+
+
+def _walk_and_match(directory: str):
+    pathspec = PathSpec.from_lines("gitwildmatch", _IGNORE_PATTERNS)
+    relative_paths = []
+    for root, _, files in os.walk(directory):
+        for file in files:
+            relative_path = os.path.relpath(os.path.join(root, file), directory)
+            if not pathspec.match_file(relative_path):
+                relative_paths.append(relative_path)
+    return relative_paths
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--ignored-fraction", type=float, default=0.9)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        _synthetic_tree(root, args.files, args.ignored_fraction)
+        included = len(list(walk_build_context(root, _IGNORE_PATTERNS)))
+        assert included == len(_walk_and_match(root))
+        print(f"{args.files} files, {included} included, best of {args.repeat} runs")
+        for name, walk in [
+            ("os.walk + match_file", lambda: _walk_and_match(root)),
+            (
+                "walk_build_context",
+                lambda: list(walk_build_context(root, _IGNORE_PATTERNS)),
+            ),
+        ]:
+            seconds = min(timeit.repeat(walk, number=1, repeat=args.repeat))
+            print(f"{name:>22}: {seconds * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
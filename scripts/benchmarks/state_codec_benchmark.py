@@ -0,0 +1,75 @@
+"""Compares load / save throughput of the state file formats.
+
+Builds a synthetic environment of resource states and times encoding and decoding
+them with each format supported by launchflow.state_codec.
+
+Usage:
+    python scripts/benchmarks/state_codec_benchmark.py --resources 1000
+"""
+
+import argparse
+import datetime
+import timeit
+
+from launchflow import state_codec
+from launchflow.models.enums import CloudProvider, ResourceProduct, ResourceStatus
+from launchflow.models.flow_state import ResourceState
+
+
+def _synthetic_states(num_resources: int):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return [
+        ResourceState(
+            name=f"resource-{i}",
+            product=ResourceProduct.GCP_STORAGE_BUCKET,
+            cloud_provider=CloudProvider.GCP,
+            created_at=now,
+            updated_at=now,
+            status=ResourceStatus.READY,
+            inputs={
+                "location": "US",
+                "force_destroy": False,
+                "labels": {f"label-{j}": f"value-{j}" for j in range(10)},
+            },
+            depends_on=[f"resource-{j}" for j in range(max(0, i - 3), i)],
+        ).to_dict()
+        for i in range(num_resources)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resources", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    states = _synthetic_states(args.resources)
+    print(
+        f"{args.resources} resources, best of {args.repeat} "
+        f"(orjson installed: {state_codec.orjson is not None})"
+    )
+    for state_format in state_codec.STATE_FORMATS:
+        encoded = [state_codec.encode_state(s, state_format) for s in states]
+        save = min(
+            timeit.repeat(
+                lambda: [state_codec.encode_state(s, state_format) for s in states],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        load = min(
+            timeit.repeat(
+                lambda: [state_codec.decode_state(e) for e in encoded],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        size = sum(len(e) for e in encoded)
+        print(
+            f"{state_format:>5}: save {save * 1000:8.1f}ms  "
+            f"load {load * 1000:8.1f}ms  size {size / 1024:8.1f}KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
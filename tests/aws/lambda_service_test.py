@@ -1,6 +1,10 @@
+import io
 import json
 import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 from unittest import mock
 
 import boto3
@@ -17,6 +21,8 @@ from launchflow.aws.lambda_service import (
     APIGatewayURL,
     LambdaService,
     LambdaServiceReleaseInputs,
+    _dependency_cache_key,
+    _zip_source,
 )
 from launchflow.config import config
 from launchflow.models.flow_state import AWSEnvironmentConfig
@@ -123,8 +129,127 @@ class LambdaServiceTest(unittest.IsolatedAsyncioTestCase):
             python_version="3.11",
             requirements_txt_path=None,
             build_logs=mock.ANY,
+            compresslevel=config.env.build_compression_level,
+            # No runtime manifest is staged since the build is called directly
+            extra_files={},
         )
 
+    @mock.patch("launchflow.aws.lambda_service.subprocess.check_call")
+    async def test_zip_source_reuses_installed_dependencies(
+        self, check_call_mock: mock.MagicMock
+    ):
+        def fake_pip_install(args, **kwargs):
+            target_dir = next(
+                arg.split("=", 1)[1] for arg in args if arg.startswith("--target=")
+            )
+            with open(os.path.join(target_dir, "dep.py"), "w") as f:
+                f.write("dependency")
+
+        check_call_mock.side_effect = fake_pip_install
+
+        build_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, build_dir)
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        with open(os.path.join(build_dir, "app.py"), "w") as f:
+            f.write("def handler(): pass")
+        requirements_txt_path = os.path.join(build_dir, "requirements.txt")
+        with open(requirements_txt_path, "w") as f:
+            f.write("requests==2.32.3\n")
+
+        def zip_source():
+            return _zip_source(
+                build_directory=build_dir,
+                build_ignore=["requirements.txt"],
+                python_version="3.11",
+                requirements_txt_path=requirements_txt_path,
+                build_logs=io.StringIO(),
+            )
+
+        with mock.patch(
+            "launchflow.aws.lambda_service._build_dependency_cache_dir",
+            return_value=cache_dir,
+        ):
+            first_zip = zip_source()
+            second_zip = zip_source()
+            self.assertEqual(check_call_mock.call_count, 1)
+
+            # Changing the requirements installs them again
+            with open(requirements_txt_path, "w") as f:
+                f.write("requests==2.32.4\n")
+            zip_source()
+            self.assertEqual(check_call_mock.call_count, 2)
+
+        for zip_bytes in [first_zip, second_zip]:
+            with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zipf:
+                self.assertEqual(sorted(zipf.namelist()), ["app.py", "dep.py"])
+
+    @mock.patch("launchflow.aws.lambda_service.subprocess.check_call")
+    async def test_zip_source_installs_unpinned_dependencies_every_build(
+        self, check_call_mock: mock.MagicMock
+    ):
+        def fake_pip_install(args, **kwargs):
+            target_dir = next(
+                arg.split("=", 1)[1] for arg in args if arg.startswith("--target=")
+            )
+            with open(os.path.join(target_dir, "dep.py"), "w") as f:
+                f.write("dependency")
+
+        check_call_mock.side_effect = fake_pip_install
+
+        build_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, build_dir)
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        requirements_txt_path = os.path.join(build_dir, "requirements.txt")
+        with open(requirements_txt_path, "w") as f:
+            f.write("requests\n")
+
+        with mock.patch(
+            "launchflow.aws.lambda_service._build_dependency_cache_dir",
+            return_value=cache_dir,
+        ):
+            for _ in range(2):
+                zip_bytes = _zip_source(
+                    build_directory=build_dir,
+                    build_ignore=["requirements.txt"],
+                    python_version="3.11",
+                    requirements_txt_path=requirements_txt_path,
+                    build_logs=io.StringIO(),
+                )
+                with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zipf:
+                    self.assertEqual(zipf.namelist(), ["dep.py"])
+
+        self.assertEqual(check_call_mock.call_count, 2)
+        # Installs that aren't cached are removed once the zip is built
+        self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_dependency_cache_key_requires_pinned_requirements(self):
+        build_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, build_dir)
+        requirements_txt_path = os.path.join(build_dir, "requirements.txt")
+        with open(os.path.join(build_dir, "constraints.txt"), "w") as f:
+            f.write("urllib3<3\n")
+
+        for requirements, cached in [
+            ("requests==2.32.3\n", True),
+            (
+                "--index-url https://pypi.org/simple\n"
+                "# Pinned with hashes\n"
+                "requests[socks]==2.32.3 \\\n    --hash=sha256:abc\n"
+                "-c constraints.txt\n",
+                True,
+            ),
+            ("requests\n", False),
+            ("requests>=2.32\n", False),
+            ("mylib @ git+https://github.com/org/mylib@main\n", False),
+            ("-e ./lib\n", False),
+        ]:
+            with open(requirements_txt_path, "w") as f:
+                f.write(requirements)
+            key = _dependency_cache_key(requirements_txt_path, "3.11")
+            self.assertEqual(key is not None, cached, requirements)
+
     @mock.patch("launchflow.aws.lambda_service.requests")
     async def test_promote_lambda(self, requests_mock: mock.MagicMock):
         service_name = "my-lambda-service"
@@ -0,0 +1,136 @@
+import gc
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from launchflow.aws.s3 import (
+    MIN_MULTIPART_CHUNK_SIZE,
+    S3Bucket,
+    S3BucketOutputs,
+    S3ObjectWriter,
+)
+
+
+class S3BucketTransferTest(unittest.TestCase):
+    def setUp(self):
+        self.bucket = S3Bucket("my-bucket")
+        patcher = mock.patch.object(
+            S3Bucket, "outputs", return_value=S3BucketOutputs(bucket_name="my-bucket")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = mock.MagicMock()
+        self.client.create_multipart_upload.return_value = {"UploadId": "upload"}
+        self.client.upload_part.side_effect = lambda **kwargs: {
+            "ETag": f"etag-{kwargs['PartNumber']}"
+        }
+        patcher = mock.patch(
+            "launchflow.aws.s3.get_boto_client", return_value=self.client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_open_write_small_object(self):
+        with self.bucket.open("file.txt", "wb") as f:
+            f.write(b"hello ")
+            f.write(b"world")
+
+        self.client.put_object.assert_called_once_with(
+            Bucket="my-bucket", Key="file.txt", Body=b"hello world"
+        )
+        self.client.create_multipart_upload.assert_not_called()
+
+    def test_open_write_multipart(self):
+        chunk_size = MIN_MULTIPART_CHUNK_SIZE
+        with self.bucket.open("file.bin", "wb", chunk_size=chunk_size) as f:
+            f.write(b"a" * (chunk_size + 10))
+            f.write(b"b" * chunk_size)
+
+        parts = [call.kwargs["Body"] for call in self.client.upload_part.call_args_list]
+        self.assertEqual([len(part) for part in parts], [chunk_size, chunk_size, 10])
+        self.client.complete_multipart_upload.assert_called_once_with(
+            Bucket="my-bucket",
+            Key="file.bin",
+            UploadId="upload",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "etag-1", "PartNumber": 1},
+                    {"ETag": "etag-2", "PartNumber": 2},
+                    {"ETag": "etag-3", "PartNumber": 3},
+                ]
+            },
+        )
+        self.client.put_object.assert_not_called()
+
+    def test_open_write_aborts_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.bucket.open("file.bin", "wb") as f:
+                f.write(b"a" * (32 * 1024 * 1024))
+                raise RuntimeError("failed")
+
+        self.client.abort_multipart_upload.assert_called_once_with(
+            Bucket="my-bucket", Key="file.bin", UploadId="upload"
+        )
+        self.client.complete_multipart_upload.assert_not_called()
+
+    def test_unclosed_writer_aborts_when_garbage_collected(self):
+        chunk_size = MIN_MULTIPART_CHUNK_SIZE
+        f = S3ObjectWriter(self.client, "my-bucket", "file.bin", chunk_size=chunk_size)
+        f.write(b"a" * (chunk_size + 10))
+
+        del f
+        gc.collect()
+
+        self.client.abort_multipart_upload.assert_called_once_with(
+            Bucket="my-bucket", Key="file.bin", UploadId="upload"
+        )
+        self.client.complete_multipart_upload.assert_not_called()
+        self.client.put_object.assert_not_called()
+
+    def test_upload_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "css"))
+            for path in ["index.html", os.path.join("css", "main.css")]:
+                with open(os.path.join(directory, path), "w") as f:
+                    f.write(path)
+
+            got = self.bucket.upload_directory(directory, prefix="static/")
+
+        self.assertEqual(sorted(got), ["static/css/main.css", "static/index.html"])
+        uploaded = sorted(
+            call.args[2] for call in self.client.upload_file.call_args_list
+        )
+        self.assertEqual(uploaded, ["static/css/main.css", "static/index.html"])
+
+    def test_download_prefix(self):
+        self.client.get_paginator.return_value.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "static/index.html"},
+                    {"Key": "static/css/"},
+                    {"Key": "static/css/main.css"},
+                    {"Key": "static/../../escape.txt"},
+                ]
+            }
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            got = self.bucket.download_prefix("static/", directory)
+
+            self.assertEqual(
+                sorted(got),
+                [
+                    os.path.join(directory, "css/main.css"),
+                    os.path.join(directory, "index.html"),
+                ],
+            )
+            self.assertTrue(os.path.isdir(os.path.join(directory, "css")))
+        downloaded = sorted(
+            call.args[1] for call in self.client.download_file.call_args_list
+        )
+        self.assertEqual(downloaded, ["static/css/main.css", "static/index.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
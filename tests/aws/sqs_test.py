@@ -0,0 +1,171 @@
+import unittest
+from unittest import mock
+
+from launchflow import exceptions
+from launchflow.aws.sqs import SQSQueue, SQSQueueOutputs
+
+
+class SQSQueueBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.queue = SQSQueue("my-queue")
+        self.outputs = SQSQueueOutputs(url="https://sqs.test/my-queue")
+        patcher = mock.patch.object(SQSQueue, "outputs", return_value=self.outputs)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = mock.MagicMock()
+        patcher = mock.patch(
+            "launchflow.aws.sqs.get_boto_client", return_value=self.client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("launchflow.aws.sqs.time.sleep")
+        self.sleep_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _send_batch_response(successful=(), failed=()):
+        return {
+            "Successful": [{"Id": i, "MessageId": f"m-{i}"} for i in successful],
+            "Failed": list(failed),
+        }
+
+    def test_send_messages_chunks_batches(self):
+        self.client.send_message_batch.side_effect = lambda QueueUrl, Entries: (
+            self._send_batch_response(successful=[e["Id"] for e in Entries])
+        )
+        messages = [f"message-{i}" for i in range(25)]
+        messages[3] = {"MessageBody": "message-3", "MessageGroupId": "group"}
+
+        got = self.queue.send_messages(messages)
+
+        self.assertEqual([r["MessageId"] for r in got], [f"m-{i}" for i in range(25)])
+        batches = [
+            call.kwargs["Entries"]
+            for call in self.client.send_message_batch.call_args_list
+        ]
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 5])
+        self.assertEqual(
+            batches[0][3],
+            {"MessageBody": "message-3", "MessageGroupId": "group", "Id": "3"},
+        )
+        self.sleep_mock.assert_not_called()
+
+    def test_send_messages_retries_partial_failures(self):
+        self.client.send_message_batch.side_effect = [
+            self._send_batch_response(
+                successful=["0"],
+                failed=[{"Id": "1", "SenderFault": False, "Code": "Throttled"}],
+            ),
+            self._send_batch_response(successful=["1"]),
+        ]
+
+        got = self.queue.send_messages(["a", "b"])
+
+        self.assertEqual([r["MessageId"] for r in got], ["m-0", "m-1"])
+        retry_entries = self.client.send_message_batch.call_args_list[1].kwargs[
+            "Entries"
+        ]
+        self.assertEqual(retry_entries, [{"MessageBody": "b", "Id": "1"}])
+
+    def test_send_messages_does_not_retry_sender_faults(self):
+        self.client.send_message_batch.return_value = self._send_batch_response(
+            failed=[
+                {
+                    "Id": "0",
+                    "SenderFault": True,
+                    "Code": "InvalidMessageContents",
+                    "Message": "bad message",
+                }
+            ],
+        )
+
+        with self.assertRaises(exceptions.SQSSendMessagesFailed) as e:
+            self.queue.send_messages(["a"])
+
+        self.assertEqual(e.exception.failed[0]["Id"], "0")
+        self.client.send_message_batch.assert_called_once()
+
+    def test_consume_deletes_processed_messages(self):
+        messages = [
+            {"MessageId": str(i), "ReceiptHandle": f"r-{i}", "Body": str(i)}
+            for i in range(12)
+        ]
+        self.client.receive_message.side_effect = [
+            {"Messages": messages[:10]},
+            {"Messages": messages[10:]},
+            {},
+        ]
+        self.client.delete_message_batch.return_value = {"Failed": []}
+
+        got = [message["Body"] for message in self.queue.consume(stop_when_empty=True)]
+
+        self.assertEqual(got, [str(i) for i in range(12)])
+        deleted = [
+            [entry["ReceiptHandle"] for entry in call.kwargs["Entries"]]
+            for call in self.client.delete_message_batch.call_args_list
+        ]
+        self.assertEqual(deleted, [[f"r-{i}" for i in range(10)], ["r-10", "r-11"]])
+        self.assertEqual(
+            self.client.receive_message.call_args.kwargs["WaitTimeSeconds"], 20
+        )
+
+    def test_consume_deletes_messages_before_each_poll(self):
+        self.client.receive_message.side_effect = [
+            {"Messages": [{"MessageId": "0", "ReceiptHandle": "r-0", "Body": "0"}]},
+            {
+                "Messages": [
+                    {"MessageId": str(i), "ReceiptHandle": f"r-{i}", "Body": str(i)}
+                    for i in (1, 2)
+                ]
+            },
+            {},
+        ]
+        self.client.delete_message_batch.return_value = {"Failed": []}
+
+        list(self.queue.consume(stop_when_empty=True))
+
+        calls = [
+            (name, kwargs.get("Entries"))
+            for name, _, kwargs in self.client.mock_calls
+            if name in ("receive_message", "delete_message_batch")
+        ]
+        self.assertEqual(
+            calls,
+            [
+                ("receive_message", None),
+                ("delete_message_batch", [{"Id": "0", "ReceiptHandle": "r-0"}]),
+                ("receive_message", None),
+                (
+                    "delete_message_batch",
+                    [
+                        {"Id": "0", "ReceiptHandle": "r-1"},
+                        {"Id": "1", "ReceiptHandle": "r-2"},
+                    ],
+                ),
+                ("receive_message", None),
+            ],
+        )
+
+    def test_consume_does_not_delete_failed_message(self):
+        self.client.receive_message.return_value = {
+            "Messages": [
+                {"MessageId": str(i), "ReceiptHandle": f"r-{i}", "Body": str(i)}
+                for i in range(3)
+            ]
+        }
+        self.client.delete_message_batch.return_value = {"Failed": []}
+
+        consumer = self.queue.consume()
+        with self.assertRaises(ValueError):
+            for message in consumer:
+                if message["Body"] == "1":
+                    raise ValueError("processing failed")
+        consumer.close()
+
+        self.client.delete_message_batch.assert_called_once_with(
+            QueueUrl=self.outputs.url, Entries=[{"Id": "0", "ReceiptHandle": "r-0"}]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,11 +3,13 @@ import unittest
 from unittest import mock
 from unittest.mock import patch
 
+from botocore.exceptions import ClientError
 from docker.errors import BuildError
 
 from launchflow.builds.ecr_builder import ECRDockerBuilder
 from launchflow.exceptions import NixPacksBuildFailed
 from launchflow.models.flow_state import AWSEnvironmentConfig
+from launchflow.workflows.utils import source_image_tag
 
 
 class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
@@ -128,10 +130,12 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
             cwd=self.build_directory,
         )
 
+    @patch("launchflow.builds.ecr_builder.source_digest", return_value="mock_digest")
     @patch("boto3.client")
-    @patch("boto3.resource")
     async def test_build_with_nixpacks_remote_success(
-        self, mock_boto3_resource: mock.MagicMock, mock_boto3_client: mock.MagicMock
+        self,
+        mock_boto3_client: mock.MagicMock,
+        mock_source_digest: mock.MagicMock,
     ):
         # Setup mock for AWS boto3 client
         mock_codebuild = mock.MagicMock()
@@ -140,10 +144,15 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
             "builds": [{"buildStatus": "SUCCEEDED"}]
         }
         mock_s3 = mock.MagicMock()
-        mock_bucket = mock.MagicMock()
-        mock_s3.Bucket.return_value = mock_bucket
-        mock_boto3_client.return_value = mock_codebuild
-        mock_boto3_resource.return_value = mock_s3
+        mock_s3.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+        mock_ecr = mock.MagicMock()
+        mock_ecr.describe_images.return_value = {"imageDetails": []}
+        mock_boto3_client.side_effect = lambda service, **kwargs: {
+            "s3": mock_s3,
+            "ecr": mock_ecr,
+        }.get(service, mock_codebuild)
 
         builder = ECRDockerBuilder(
             build_directory=self.build_directory,
@@ -170,7 +179,7 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
         mock_codebuild.start_build.assert_called_once_with(
             projectName="test-codebuild-project-name",
             sourceTypeOverride="S3",
-            sourceLocationOverride="mock_bucket/builds/mock_project/mock_environment/services/mock_service/",
+            sourceLocationOverride="mock_bucket/builds/mock_project/mock_environment/services/mock_service/sources/mock_digest/",
             environmentVariablesOverride=[
                 {
                     "name": "IMAGE_TAG",
@@ -179,14 +188,21 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
                 },
                 {"name": "BUILD_TYPE", "value": "nixpacks", "type": "PLAINTEXT"},
                 {"name": "BUILD_MODE", "value": "build", "type": "PLAINTEXT"},
+                {
+                    "name": "SOURCE_IMAGE_TAG",
+                    "value": source_image_tag("mock_digest", "nixpacks", None),
+                    "type": "PLAINTEXT",
+                },
             ],
         )
-        mock_bucket.upload_fileobj.assert_called_once()
+        mock_s3.put_object.assert_called_once()
 
+    @patch("launchflow.builds.ecr_builder.source_digest", return_value="mock_digest")
     @patch("boto3.client")
-    @patch("boto3.resource")
     async def test_build_with_nixpacks_remote_failure(
-        self, mock_boto3_resource: mock.MagicMock, mock_boto3_client: mock.MagicMock
+        self,
+        mock_boto3_client: mock.MagicMock,
+        mock_source_digest: mock.MagicMock,
     ):
         # Setup mock for AWS boto3 client
         mock_codebuild = mock.MagicMock()
@@ -195,10 +211,15 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
             "builds": [{"buildStatus": "FAILED"}]
         }
         mock_s3 = mock.MagicMock()
-        mock_bucket = mock.MagicMock()
-        mock_s3.Bucket.return_value = mock_bucket
-        mock_boto3_client.return_value = mock_codebuild
-        mock_boto3_resource.return_value = mock_s3
+        mock_s3.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+        mock_ecr = mock.MagicMock()
+        mock_ecr.describe_images.return_value = {"imageDetails": []}
+        mock_boto3_client.side_effect = lambda service, **kwargs: {
+            "s3": mock_s3,
+            "ecr": mock_ecr,
+        }.get(service, mock_codebuild)
 
         builder = ECRDockerBuilder(
             build_directory=self.build_directory,
@@ -303,10 +324,12 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
             platform="linux/amd64",
         )
 
+    @patch("launchflow.builds.ecr_builder.source_digest", return_value="mock_digest")
     @patch("boto3.client")
-    @patch("boto3.resource")
     async def test_build_with_docker_remote_success(
-        self, mock_boto3_resource: mock.MagicMock, mock_boto3_client: mock.MagicMock
+        self,
+        mock_boto3_client: mock.MagicMock,
+        mock_source_digest: mock.MagicMock,
     ):
         # Setup mock for AWS boto3 client
         mock_codebuild = mock.MagicMock()
@@ -317,10 +340,15 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
             "builds": [{"buildStatus": "SUCCEEDED"}]
         }
         mock_s3 = mock.MagicMock()
-        mock_bucket = mock.MagicMock()
-        mock_s3.Bucket.return_value = mock_bucket
-        mock_boto3_client.return_value = mock_codebuild
-        mock_boto3_resource.return_value = mock_s3
+        mock_s3.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+        mock_ecr = mock.MagicMock()
+        mock_ecr.describe_images.return_value = {"imageDetails": []}
+        mock_boto3_client.side_effect = lambda service, **kwargs: {
+            "s3": mock_s3,
+            "ecr": mock_ecr,
+        }.get(service, mock_codebuild)
 
         builder = ECRDockerBuilder(
             build_directory=self.build_directory,
@@ -349,7 +377,7 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
         mock_codebuild.start_build.assert_called_once_with(
             projectName="test-docker-codebuild-project-name",
             sourceTypeOverride="S3",
-            sourceLocationOverride="mock_bucket/builds/mock_project/mock_environment/services/mock_service/",
+            sourceLocationOverride="mock_bucket/builds/mock_project/mock_environment/services/mock_service/sources/mock_digest/",
             environmentVariablesOverride=[
                 {
                     "name": "IMAGE_TAG",
@@ -358,15 +386,22 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
                 },
                 {"name": "BUILD_TYPE", "value": "docker", "type": "PLAINTEXT"},
                 {"name": "BUILD_MODE", "value": "build", "type": "PLAINTEXT"},
+                {
+                    "name": "SOURCE_IMAGE_TAG",
+                    "value": source_image_tag("mock_digest", "docker", "Dockerfile"),
+                    "type": "PLAINTEXT",
+                },
                 {"name": "DOCKERFILE_PATH", "value": "Dockerfile"},
             ],
         )
-        mock_bucket.upload_fileobj.assert_called_once()
+        mock_s3.put_object.assert_called_once()
 
+    @patch("launchflow.builds.ecr_builder.source_digest", return_value="mock_digest")
     @patch("boto3.client")
-    @patch("boto3.resource")
     async def test_build_with_docker_remote_failure(
-        self, mock_boto3_resource: mock.MagicMock, mock_boto3_client: mock.MagicMock
+        self,
+        mock_boto3_client: mock.MagicMock,
+        mock_source_digest: mock.MagicMock,
     ):
         # Setup mock for AWS boto3 client
         mock_codebuild = mock.MagicMock()
@@ -377,10 +412,15 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
             "builds": [{"buildStatus": "FAILED"}]
         }
         mock_s3 = mock.MagicMock()
-        mock_bucket = mock.MagicMock()
-        mock_s3.Bucket.return_value = mock_bucket
-        mock_boto3_client.return_value = mock_codebuild
-        mock_boto3_resource.return_value = mock_s3
+        mock_s3.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404"}}, "HeadObject"
+        )
+        mock_ecr = mock.MagicMock()
+        mock_ecr.describe_images.return_value = {"imageDetails": []}
+        mock_boto3_client.side_effect = lambda service, **kwargs: {
+            "s3": mock_s3,
+            "ecr": mock_ecr,
+        }.get(service, mock_codebuild)
 
         builder = ECRDockerBuilder(
             build_directory=self.build_directory,
@@ -399,6 +439,46 @@ class ECRBuilderTest(unittest.IsolatedAsyncioTestCase):
                 "Dockerfile", "test-docker-codebuild-project-failure"
             )
 
+    @patch("launchflow.builds.ecr_builder.source_digest", return_value="mock_digest")
+    @patch("boto3.client")
+    async def test_build_with_docker_remote_reuses_image_for_same_source(
+        self,
+        mock_boto3_client: mock.MagicMock,
+        mock_source_digest: mock.MagicMock,
+    ):
+        mock_codebuild = mock.MagicMock()
+        mock_s3 = mock.MagicMock()
+        mock_ecr = mock.MagicMock()
+        mock_ecr.describe_images.return_value = {"imageDetails": [{"imageTags": []}]}
+        mock_boto3_client.side_effect = lambda service, **kwargs: {
+            "s3": mock_s3,
+            "ecr": mock_ecr,
+        }.get(service, mock_codebuild)
+
+        builder = ECRDockerBuilder(
+            build_directory=self.build_directory,
+            build_ignore=self.build_ignore,
+            build_log_file=self.temp_output_handler,
+            ecr_repository=self.ecr_repository,
+            launchflow_project_name=self.launchflow_project_name,
+            launchflow_environment_name=self.launchflow_environment_name,
+            launchflow_service_name=self.launchflow_service_name,
+            launchflow_deployment_id=self.launchflow_deployment_id,
+            aws_environment_config=self.aws_environment_config,
+        )
+
+        result = await builder.build_with_docker_remote(
+            "Dockerfile", "test-docker-codebuild-project"
+        )
+
+        image_tag = source_image_tag("mock_digest", "docker", "Dockerfile")
+        self.assertEqual(f"{self.ecr_repository}:{image_tag}", result)
+        mock_ecr.describe_images.assert_called_once_with(
+            repositoryName=self.ecr_repository, imageIds=[{"imageTag": image_tag}]
+        )
+        mock_s3.put_object.assert_not_called()
+        mock_codebuild.start_build.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
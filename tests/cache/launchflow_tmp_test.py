@@ -0,0 +1,196 @@
+import base64
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import toml
+import yaml
+
+from launchflow.cache import runtime_manifest
+from launchflow.cache.launchflow_tmp import (
+    RUN_CACHE_FILE_PREFIX,
+    LaunchFlowCache,
+    decode_resource_outputs_cache,
+    encode_resource_outputs_cache,
+    write_resource_outputs_cache_file,
+)
+from launchflow.config import config
+
+
+def _encode_legacy_resource_outputs_cache(resource_outputs):
+    # The format written by older versions of LaunchFlow
+    encoded_dict = {
+        key: base64.b64encode(yaml.dump(value).encode("utf-8")).decode("utf-8")
+        for key, value in resource_outputs.items()
+    }
+    return base64.b64encode(json.dumps(encoded_dict).encode("utf-8")).decode("utf-8")
+
+
+class RunCacheEncodingTest(unittest.TestCase):
+    def setUp(self):
+        self.resource_outputs = {
+            f"project:dev:gcp_cloud_sql_postgres:db-{i}": {
+                "connection_name": f"project:us-central1:db-{i}",
+                "user": "postgres",
+                "password": "password",
+                "public_ip_address": f"10.0.0.{i}",
+            }
+            for i in range(50)
+        }
+
+    def test_round_trip(self):
+        encoded = encode_resource_outputs_cache(self.resource_outputs)
+
+        self.assertEqual(decode_resource_outputs_cache(encoded), self.resource_outputs)
+        self.assertLess(
+            len(encoded),
+            len(_encode_legacy_resource_outputs_cache(self.resource_outputs)) / 4,
+        )
+
+    def test_decode_legacy_format(self):
+        encoded = _encode_legacy_resource_outputs_cache(self.resource_outputs)
+
+        self.assertEqual(decode_resource_outputs_cache(encoded), self.resource_outputs)
+
+    def test_decode_from_file(self):
+        path = write_resource_outputs_cache_file(
+            encode_resource_outputs_cache(self.resource_outputs)
+        )
+        self.addCleanup(os.remove, path)
+
+        self.assertEqual(
+            decode_resource_outputs_cache(f"{RUN_CACHE_FILE_PREFIX}{path}"),
+            self.resource_outputs,
+        )
+
+    def test_load_invalid_run_cache(self):
+        with (
+            tempfile.TemporaryDirectory() as tempdir,
+            mock.patch.object(
+                config.env, "run_cache", f"{RUN_CACHE_FILE_PREFIX}/does/not/exist"
+            ),
+        ):
+            cache = LaunchFlowCache.load_from_file(os.path.join(tempdir, "cache.toml"))
+
+        self.assertEqual(len(cache.resource_connection_info), 0)
+
+    def test_seed_from_runtime_manifest(self):
+        key = "project:dev:gcp_storage_bucket:bucket"
+        outputs = {"bucket_name": "b"}
+        with tempfile.TemporaryDirectory() as tempdir:
+            with mock.patch.object(
+                runtime_manifest,
+                "build_runtime_manifest_staging_dir",
+                return_value=tempdir,
+            ):
+                manifest_path = runtime_manifest.stage_runtime_manifest(
+                    tempdir, "123", {key: outputs}
+                )
+            with (
+                mock.patch.object(config.env, "deployment_id", "123"),
+                mock.patch.object(config.env, "runtime_manifest_path", manifest_path),
+                mock.patch.object(config.env, "outputs_cache_ttl", 300),
+            ):
+                cache = LaunchFlowCache.load_from_file(
+                    os.path.join(tempdir, "cache.toml")
+                )
+
+        cached = cache.resource_connection_info.get(key)
+        self.assertEqual(cached.outputs, outputs)
+        self.assertFalse(cached.stale)
+        # Manifest entries expire like any other cached outputs, so they are
+        # refreshed once the TTL passes
+        now = time.monotonic()
+        with mock.patch(
+            "launchflow.cache.outputs_cache.time.monotonic", return_value=now + 301
+        ):
+            self.assertTrue(cache.resource_connection_info.get(key).stale)
+
+
+class LaunchFlowCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.cache_path = os.path.join(self.cache_dir.name, "lf", "cache.toml")
+        # Changes are only written when the tests flush them
+        patcher = mock.patch("launchflow.cache.launchflow_tmp.threading.Timer")
+        self.timer_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _read_cache_file(self):
+        with open(self.cache_path) as f:
+            return toml.load(f)
+
+    def test_changes_are_batched(self):
+        cache = LaunchFlowCache.load_from_file(self.cache_path)
+        cache.set_gcp_service_account_email("project", "dev", "dev@sa.com")
+        cache.set_gcp_service_account_email("project", "prod", "prod@sa.com")
+
+        self.assertFalse(os.path.exists(self.cache_path))
+        # A single flush is scheduled for both changes
+        self.timer_mock.assert_called_once()
+        self.timer_mock.return_value.start.assert_called_once()
+
+        cache.save_permanent_cache_to_disk()
+
+        self.assertEqual(
+            self._read_cache_file()["gcp_service_account_emails"],
+            {"project:dev": "dev@sa.com", "project:prod": "prod@sa.com"},
+        )
+        self.timer_mock.return_value.cancel.assert_called_once()
+
+    def test_concurrent_writers_are_merged(self):
+        # Two caches loaded from the same file, like two processes would
+        first = LaunchFlowCache.load_from_file(self.cache_path)
+        second = LaunchFlowCache.load_from_file(self.cache_path)
+
+        first.set_gcp_service_account_email("project", "dev", "dev@sa.com")
+        first.save_permanent_cache_to_disk()
+        second.set_resource_connection_bucket_path(
+            "project", "dev", "product", "bucket", "gs://artifacts/bucket.yaml"
+        )
+        second.save_permanent_cache_to_disk()
+
+        data = self._read_cache_file()
+        self.assertEqual(
+            data["gcp_service_account_emails"], {"project:dev": "dev@sa.com"}
+        )
+        self.assertEqual(
+            data["resource_connection_bucket_paths"],
+            {"project:dev:product:bucket": "gs://artifacts/bucket.yaml"},
+        )
+        # No temporary files are left behind
+        self.assertEqual(
+            sorted(os.listdir(os.path.dirname(self.cache_path))),
+            ["cache.toml", "cache.toml.lock"],
+        )
+
+    def test_deletes_are_written(self):
+        cache = LaunchFlowCache.load_from_file(self.cache_path)
+        cache.set_gcp_service_account_email("project", "dev", "dev@sa.com")
+        cache.save_permanent_cache_to_disk()
+
+        cache = LaunchFlowCache.load_from_file(self.cache_path)
+        self.assertEqual(
+            cache.get_gcp_service_account_email("project", "dev"), "dev@sa.com"
+        )
+        cache.delete_gcp_service_account_email("project", "dev")
+        cache.save_permanent_cache_to_disk()
+
+        self.assertEqual(self._read_cache_file()["gcp_service_account_emails"], {})
+
+    def test_load_corrupted_file(self):
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, "w") as f:
+            f.write("not [valid toml")
+
+        cache = LaunchFlowCache.load_from_file(self.cache_path)
+
+        self.assertEqual(cache.gcp_service_account_emails, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
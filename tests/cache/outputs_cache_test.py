@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+
+from launchflow.cache.outputs_cache import OutputsCacheStats, ResourceOutputsCache
+
+
+class ResourceOutputsCacheTest(unittest.TestCase):
+    @mock.patch("launchflow.cache.outputs_cache.time.monotonic")
+    def test_entries_go_stale_after_ttl(self, monotonic_mock: mock.MagicMock):
+        monotonic_mock.return_value = 100
+        outputs_cache = ResourceOutputsCache(ttl_seconds=10)
+        outputs_cache.set("key", {"host": "a"})
+
+        monotonic_mock.return_value = 109
+        self.assertFalse(outputs_cache.get("key").stale)
+
+        monotonic_mock.return_value = 110
+        cached = outputs_cache.get("key")
+        self.assertTrue(cached.stale)
+        self.assertEqual(cached.outputs, {"host": "a"})
+
+        # Setting the entry again makes it fresh
+        outputs_cache.set("key", {"host": "b"})
+        self.assertFalse(outputs_cache.get("key").stale)
+
+    def test_entries_without_ttl_never_go_stale(self):
+        outputs_cache = ResourceOutputsCache(ttl_seconds=None)
+        outputs_cache.set("key", {"host": "a"})
+
+        self.assertFalse(outputs_cache.get("key").stale)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        outputs_cache = ResourceOutputsCache(max_entries=2)
+        outputs_cache.set("a", {})
+        outputs_cache.set("b", {})
+        # Reading a makes b the least recently used entry
+        outputs_cache.get("a")
+        outputs_cache.set("c", {})
+
+        self.assertIn("a", outputs_cache)
+        self.assertNotIn("b", outputs_cache)
+        self.assertIn("c", outputs_cache)
+        self.assertEqual(outputs_cache.stats().evictions, 1)
+
+    def test_only_one_refresh_at_a_time(self):
+        outputs_cache = ResourceOutputsCache()
+
+        self.assertTrue(outputs_cache.start_refresh("key"))
+        self.assertFalse(outputs_cache.start_refresh("key"))
+        outputs_cache.finish_refresh("key", success=False)
+        self.assertTrue(outputs_cache.start_refresh("key"))
+        outputs_cache.finish_refresh("key", success=True)
+
+        stats = outputs_cache.stats()
+        self.assertEqual(stats.refreshes, 1)
+        self.assertEqual(stats.refresh_failures, 1)
+
+    def test_stats(self):
+        outputs_cache = ResourceOutputsCache(ttl_seconds=0)
+        outputs_cache.get("key")
+        outputs_cache.set("key", {})
+        outputs_cache.get("key")
+        outputs_cache.set("key", {}, ttl_seconds=None)
+        outputs_cache.get("key")
+
+        self.assertEqual(
+            outputs_cache.stats(),
+            OutputsCacheStats(hits=1, stale_hits=1, misses=1, size=1),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from launchflow.cache import runtime_manifest
+from launchflow.config import config
+
+
+class RuntimeManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.build_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.build_dir.cleanup)
+        self.staging_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.staging_dir.cleanup)
+        self.outputs = {"project:dev:gcp_storage_bucket:bucket": {"bucket_name": "b"}}
+
+        for name, value in [
+            ("deployment_id", "123"),
+            ("runtime_manifest", True),
+            ("runtime_manifest_path", None),
+        ]:
+            patcher = mock.patch.object(config.env, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(
+            runtime_manifest,
+            "build_runtime_manifest_staging_dir",
+            return_value=self.staging_dir.name,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stage_and_load(self):
+        path = runtime_manifest.stage_runtime_manifest(
+            self.build_dir.name, "123", self.outputs
+        )
+        config.env.runtime_manifest_path = path
+
+        self.assertEqual(runtime_manifest.load_runtime_manifest(), self.outputs)
+
+    def test_stage_outside_of_build_directory(self):
+        path = runtime_manifest.stage_runtime_manifest(
+            self.build_dir.name, "123", self.outputs
+        )
+
+        self.assertTrue(path.startswith(self.staging_dir.name))
+        self.assertEqual(os.listdir(self.build_dir.name), [])
+        self.assertEqual(
+            runtime_manifest.runtime_manifest_files(self.build_dir.name, "123"),
+            {runtime_manifest.RUNTIME_MANIFEST_PATH: path},
+        )
+
+        runtime_manifest.remove_staged_runtime_manifest(self.build_dir.name, "123")
+
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(
+            runtime_manifest.runtime_manifest_files(self.build_dir.name, "123"), {}
+        )
+
+    def test_stage_is_independent_of_deployment(self):
+        first = runtime_manifest.stage_runtime_manifest(
+            self.build_dir.name, "122", self.outputs
+        )
+        second = runtime_manifest.stage_runtime_manifest(
+            self.build_dir.name, "123", self.outputs
+        )
+
+        with open(first) as f, open(second) as g:
+            self.assertEqual(f.read(), g.read())
+
+    def test_load_from_working_directory(self):
+        path = runtime_manifest.stage_runtime_manifest(
+            self.build_dir.name, "123", self.outputs
+        )
+        package_dir = os.path.join(self.build_dir.name, "package")
+        os.makedirs(os.path.join(package_dir, ".launchflow"))
+        os.rename(
+            path, os.path.join(package_dir, runtime_manifest.RUNTIME_MANIFEST_PATH)
+        )
+
+        with mock.patch("os.getcwd", return_value=package_dir):
+            self.assertEqual(runtime_manifest.load_runtime_manifest(), self.outputs)
+
+    def test_load_missing_manifest(self):
+        config.env.runtime_manifest_path = os.path.join(self.build_dir.name, "missing")
+
+        self.assertIsNone(runtime_manifest.load_runtime_manifest())
+
+    def test_load_outside_of_deployment(self):
+        config.env.deployment_id = None
+        config.env.runtime_manifest_path = runtime_manifest.stage_runtime_manifest(
+            self.build_dir.name, "123", self.outputs
+        )
+
+        self.assertIsNone(runtime_manifest.load_runtime_manifest())
+
+    def test_contains_secret_outputs(self):
+        self.assertFalse(runtime_manifest.contains_secret_outputs({"bucket_name": "b"}))
+        self.assertTrue(
+            runtime_manifest.contains_secret_outputs({"user": "u", "password": "p"})
+        )
+        self.assertTrue(
+            runtime_manifest.contains_secret_outputs(
+                {"public_ip": "1.2.3.4", "additional_outputs": {"password": "p"}}
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
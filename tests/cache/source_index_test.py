@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from launchflow.cache import source_index
+
+
+class SourceIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.build_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.build_dir.cleanup)
+        self.index_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.index_dir.cleanup)
+        patcher = mock.patch.object(
+            source_index, "build_source_index_dir", return_value=self.index_dir.name
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self._write("main.py", "print('hello')")
+        self._write("lib.py", "x = 1")
+
+    def _write(self, relative_path: str, contents: str):
+        with open(os.path.join(self.build_dir.name, relative_path), "w") as f:
+            f.write(contents)
+
+    def test_digest_only_changes_with_contents(self):
+        digest = source_index.compute_source_digest(
+            self.build_dir.name, ["lib.py", "main.py"]
+        )
+        self.assertEqual(
+            source_index.compute_source_digest(
+                self.build_dir.name, ["lib.py", "main.py"]
+            ),
+            digest,
+        )
+
+        self._write("lib.py", "x = 2")
+        changed_digest = source_index.compute_source_digest(
+            self.build_dir.name, ["lib.py", "main.py"]
+        )
+        self.assertNotEqual(changed_digest, digest)
+
+        # Excluding a file changes the digest as well
+        self.assertNotEqual(
+            source_index.compute_source_digest(self.build_dir.name, ["main.py"]),
+            changed_digest,
+        )
+
+    def test_unchanged_files_are_not_rehashed(self):
+        source_index.compute_source_digest(self.build_dir.name, ["lib.py", "main.py"])
+
+        with mock.patch.object(
+            source_index, "hash_file", wraps=source_index.hash_file
+        ) as hash_file_mock:
+            source_index.compute_source_digest(
+                self.build_dir.name, ["lib.py", "main.py"]
+            )
+            hash_file_mock.assert_not_called()
+
+            self._write("main.py", "print('goodbye')")
+            source_index.compute_source_digest(
+                self.build_dir.name, ["lib.py", "main.py"]
+            )
+            hash_file_mock.assert_called_once_with(
+                os.path.join(self.build_dir.name, "main.py")
+            )
+
+    def test_unreadable_index_is_ignored(self):
+        digest = source_index.compute_source_digest(self.build_dir.name, ["lib.py"])
+        with open(source_index._index_path(self.build_dir.name), "w") as f:
+            f.write("not json")
+
+        self.assertEqual(
+            source_index.compute_source_digest(self.build_dir.name, ["lib.py"]), digest
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import asyncio
+import os
+import threading
+import unittest
+from unittest import mock
+
+from launchflow.client_registry import ClientRegistry
+
+
+class ClientRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = ClientRegistry()
+
+    def test_get_reuses_client(self):
+        factory = mock.MagicMock(side_effect=lambda: object())
+
+        first = self.registry.get("sqs", factory)
+        second = self.registry.get("sqs", factory)
+        other = self.registry.get("s3", factory)
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(factory.call_count, 2)
+
+    def test_get_creates_client_once_across_threads(self):
+        barrier = threading.Barrier(8)
+        factory = mock.MagicMock(side_effect=lambda: object())
+        got = []
+
+        def get_client():
+            barrier.wait()
+            got.append(self.registry.get("pubsub", factory))
+
+        threads = [threading.Thread(target=get_client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        factory.assert_called_once_with()
+        self.assertEqual(len({id(client) for client in got}), 1)
+
+    def test_get_async_keeps_client_per_event_loop(self):
+        factory = mock.MagicMock(side_effect=lambda: object())
+
+        async def get_clients():
+            return (
+                self.registry.get_async("tasks", factory),
+                self.registry.get_async("tasks", factory),
+            )
+
+        first, second = asyncio.run(get_clients())
+        third, _ = asyncio.run(get_clients())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(factory.call_count, 2)
+
+    def test_clear(self):
+        factory = mock.MagicMock(side_effect=lambda: object())
+        first = self.registry.get("secretmanager", factory)
+
+        self.registry.clear()
+
+        self.assertIsNot(self.registry.get("secretmanager", factory), first)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_clients_are_not_shared_with_forked_children(self):
+        from launchflow.client_registry import client_registry
+
+        client = client_registry.get("fork-test", object)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            is_shared = client_registry.get("fork-test", object) is client
+            os.write(write_fd, b"1" if is_shared else b"0")
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as f:
+            got = f.read()
+        os.waitpid(pid, 0)
+
+        self.assertEqual(got, b"0")
+        self.assertIs(client_registry.get("fork-test", object), client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import asyncio
+import unittest
+from dataclasses import dataclass, field
+from typing import List
+from unittest import mock
+
+from rich.tree import Tree
+
+from launchflow import exceptions
+from launchflow.flows.plan import Result, execute_plans
+from launchflow.flows.plan_dag import PlanDAG
+from launchflow.flows.plan_scheduler import PlanScheduler
+from launchflow.models.enums import CloudProvider
+
+
+@dataclass
+class _FakeProduct:
+    name: str
+    product: str = "gcp_storage_bucket"
+
+    def cloud_provider(self):
+        return CloudProvider.GCP
+
+
+@dataclass
+class _FakePlan:
+    name: str
+    depends_on: List["_FakePlan"] = field(default_factory=list)
+    duration: float = 1
+    children: List["_FakePlan"] = field(default_factory=list)
+    executed: List[str] = field(default_factory=list)
+    operation_type: str = "create"
+
+    @property
+    def id(self):
+        return f"create-{self.name}"
+
+    @property
+    def resource_or_service(self):
+        return _FakeProduct(self.name)
+
+    def __str__(self):
+        return self.name
+
+    def child_plans(self):
+        return self.children
+
+    def pending_message(self):
+        return f"{self} is pending"
+
+    def task_message(self):
+        return f"Executing {self}"
+
+    def success_message(self):
+        return f"{self} succeeded"
+
+    async def abandon_plan(self, reason: str):
+        return Result(plan=self, success=False)
+
+    async def execute_plan(self, tree, dependency_results):
+        self.executed.append(self.name)
+        if self.children:
+            results = await execute_plans(self.children, tree)
+            return Result(plan=self, success=all(r.success for r in results))
+        await asyncio.sleep(0)
+        return Result(plan=self, success=True)
+
+
+@dataclass
+class _SlowParentPlan(_FakePlan):
+    async def execute_plan(self, tree, dependency_results):
+        result = await super().execute_plan(tree, dependency_results)
+        # Give plans waiting on the wrong node a chance to run first
+        await asyncio.sleep(0.05)
+        self.executed.append(f"{self.name} done")
+        return result
+
+
+def _duration(plan) -> float:
+    return plan.duration
+
+
+class PlanDAGTest(unittest.TestCase):
+    def test_levels_and_waves(self):
+        a = _FakePlan("a")
+        b = _FakePlan("b", depends_on=[a])
+        c = _FakePlan("c", depends_on=[a, b])
+        d = _FakePlan("d")
+
+        dag = PlanDAG.build([c, b, a, d], estimate_duration=_duration)
+
+        self.assertEqual(dag.levels, {a.id: 0, d.id: 0, b.id: 1, c.id: 2})
+        self.assertEqual(
+            [[p.name for p in wave] for wave in dag.waves()],
+            [["a", "d"], ["b"], ["c"]],
+        )
+
+    def test_longest_path_runs_first(self):
+        quick = _FakePlan("quick", duration=1)
+        database = _FakePlan("database", duration=600)
+        user = _FakePlan("user", depends_on=[database], duration=10)
+
+        dag = PlanDAG.build([quick, user, database], estimate_duration=_duration)
+
+        self.assertEqual(dag.remaining_seconds[database.id], 610)
+        self.assertEqual(dag.plans[0].name, "database")
+        self.assertEqual([p.name for p in dag.critical_path()], ["database", "user"])
+
+    def test_cycle_detection(self):
+        a = _FakePlan("a")
+        b = _FakePlan("b", depends_on=[a])
+        a.depends_on.append(b)
+
+        with self.assertRaises(exceptions.PlanDependencyCycle):
+            PlanDAG.build([a, b, _FakePlan("c")], estimate_duration=_duration)
+
+    def test_dependencies_outside_of_graph_are_ignored(self):
+        outside = _FakePlan("outside")
+        inside = _FakePlan("inside", depends_on=[outside])
+
+        dag = PlanDAG.build([inside], estimate_duration=_duration)
+
+        self.assertEqual(dag.levels, {inside.id: 0})
+
+
+@mock.patch("launchflow.flows.plan.load_launchflow_cache")
+class ExecutePlansTest(unittest.IsolatedAsyncioTestCase):
+    async def test_child_plans_can_depend_on_parent_flow_plans(
+        self, cache_mock: mock.MagicMock
+    ):
+        executed: List[str] = []
+        database = _FakePlan("database", executed=executed)
+        child = _FakePlan("child", depends_on=[database], executed=executed)
+        service = _FakePlan("service", children=[child], executed=executed)
+
+        results = await execute_plans(
+            [service, database], Tree("test"), scheduler=PlanScheduler(2, {})
+        )
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertLess(executed.index("database"), executed.index("child"))
+
+    async def test_child_plan_with_same_id_as_parent(self, cache_mock: mock.MagicMock):
+        # e.g. a GKE service and its container resource share a name
+        child = _FakePlan("service")
+        service = _FakePlan("service", children=[child])
+
+        results = await asyncio.wait_for(
+            execute_plans([service], Tree("test"), scheduler=PlanScheduler(2, {})),
+            timeout=5,
+        )
+
+        self.assertTrue(results[0].success)
+        self.assertEqual(child.executed, ["service"])
+
+    async def test_dependent_waits_for_parent_with_same_id_as_child(
+        self, cache_mock: mock.MagicMock
+    ):
+        executed: List[str] = []
+        child = _FakePlan("service", executed=executed)
+        service = _SlowParentPlan("service", children=[child], executed=executed)
+        dependent = _FakePlan("dependent", depends_on=[service], executed=executed)
+
+        results = await asyncio.wait_for(
+            execute_plans(
+                [service, dependent], Tree("test"), scheduler=PlanScheduler(2, {})
+            ),
+            timeout=5,
+        )
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(executed, ["service", "service", "service done", "dependent"])
+
+    async def test_plans_do_not_leak_between_flows(self, cache_mock: mock.MagicMock):
+        dependency = _FakePlan("dependency")
+        await execute_plans([dependency], Tree("test"))
+
+        plan = _FakePlan("plan", depends_on=[dependency])
+        results = await execute_plans([plan], Tree("test"))
+
+        self.assertFalse(results[0].success)
+        cache_mock().record_plan_durations.assert_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from launchflow.flows.plan_scheduler import PlanScheduler, PrioritySemaphore
+
+
+def _plan(product: str, cloud_provider: str = "gcp"):
+    plan = mock.MagicMock()
+    plan.resource_or_service.product = product
+    plan.resource_or_service.cloud_provider().value = cloud_provider
+    return plan
+
+
+class PrioritySemaphoreTest(unittest.IsolatedAsyncioTestCase):
+    async def test_highest_priority_waiter_goes_first(self):
+        semaphore = PrioritySemaphore(1)
+        await semaphore.acquire()
+        order = []
+
+        async def waiter(name: str, priority: int):
+            await semaphore.acquire(priority)
+            order.append(name)
+            semaphore.release()
+
+        tasks = [
+            asyncio.create_task(waiter("low", 1)),
+            asyncio.create_task(waiter("high", 5)),
+            asyncio.create_task(waiter("mid", 3)),
+        ]
+        # Let all waiters queue up before releasing the held slot
+        await asyncio.sleep(0)
+        semaphore.release()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(order, ["high", "mid", "low"])
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        semaphore = PrioritySemaphore(1)
+        await semaphore.acquire()
+        waiter = asyncio.create_task(semaphore.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        semaphore.release()
+
+        self.assertFalse(semaphore.locked())
+
+
+class PlanSchedulerTest(unittest.IsolatedAsyncioTestCase):
+    async def _max_concurrency(self, scheduler: PlanScheduler, plans) -> int:
+        running = 0
+        max_running = 0
+
+        async def run(plan):
+            nonlocal running, max_running
+            async with scheduler.slot(plan):
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*[run(plan) for plan in plans])
+        return max_running
+
+    async def test_global_limit(self):
+        scheduler = PlanScheduler(max_parallelism=3, provider_limits={})
+        plans = [_plan("gcp_storage_bucket") for _ in range(10)]
+
+        self.assertEqual(await self._max_concurrency(scheduler, plans), 3)
+
+    async def test_provider_limit(self):
+        scheduler = PlanScheduler(max_parallelism=10, provider_limits={"aws": 2})
+        plans = [_plan("aws_s3_bucket", "aws") for _ in range(10)]
+
+        self.assertEqual(await self._max_concurrency(scheduler, plans), 2)
+
+    async def test_kubernetes_plans_use_kubernetes_limit(self):
+        scheduler = PlanScheduler(
+            max_parallelism=10, provider_limits={"gcp": 10, "kubernetes": 1}
+        )
+        plans = [_plan("kubernetes_service_container") for _ in range(5)]
+
+        self.assertEqual(await self._max_concurrency(scheduler, plans), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,6 +17,7 @@ from launchflow.kubernetes.service import ServiceContainerOutputs
 from launchflow.locks import LockOperation, OperationType
 from launchflow.managers.docker_resource_manager import dict_to_base64
 from launchflow.managers.environment_manager import EnvironmentManager
+from launchflow.managers.resource_manager import ResourceManager
 from launchflow.models.enums import (
     CloudProvider,
     EnvironmentStatus,
@@ -245,6 +246,43 @@ class ResourceFlowTest(unittest.IsolatedAsyncioTestCase):
 
         mock_create_resource.assert_not_called()
 
+    @mock.patch("datetime.datetime", MockDateTime)
+    @mock.patch("launchflow.flows.create_flows.create_tofu_resource")
+    async def test_plan_loads_environment_snapshot_once(
+        self, mock_create_resource: mock.AsyncMock
+    ):
+        """Test planning serves all state lookups from one environment snapshot."""
+        mock_create_resource.return_value = ApplyResourceTofuOutputs(
+            gcp_id="bucket", aws_arn=None
+        )
+        resource1 = GCSBucket("test-storage-bucket1")
+        resource2 = GCSBucket("test-storage-bucket2")
+        resource2.depends_on(resource1)
+
+        with (
+            mock.patch.object(
+                EnvironmentManager,
+                "load_snapshot",
+                autospec=True,
+                side_effect=EnvironmentManager.load_snapshot,
+            ) as mock_load_snapshot,
+            mock.patch.object(
+                ResourceManager,
+                "load_resource",
+                autospec=True,
+                side_effect=ResourceManager.load_resource,
+            ) as mock_load_resource,
+        ):
+            await create_flows.create(
+                resource1, resource2, environment="dev", prompt=False
+            )
+
+        mock_load_snapshot.assert_called_once()
+        # Resources are only loaded individually to verify their state after
+        # they are locked
+        self.assertEqual(mock_load_resource.call_count, 2)
+        self.assertEqual(mock_create_resource.call_count, 2)
+
     @mock.patch("datetime.datetime", MockDateTime)
     @mock.patch("launchflow.flows.create_flows.create_tofu_resource")
     async def test_create_mock_update_bucket(
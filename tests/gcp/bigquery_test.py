@@ -0,0 +1,157 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from google.cloud import bigquery
+
+from launchflow import exceptions
+from launchflow.gcp.bigquery import BigQueryDataset, BigQueryDatasetOutputs
+
+
+class BigQueryDatasetIngestionTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.dataset = BigQueryDataset("my_dataset")
+        outputs = BigQueryDatasetOutputs(
+            gcp_project_id="my-project", dataset_name="my_dataset"
+        )
+        patcher = mock.patch.object(BigQueryDataset, "outputs", return_value=outputs)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(
+            BigQueryDataset, "outputs_async", mock.AsyncMock(return_value=outputs)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = mock.MagicMock()
+        patcher = mock.patch.object(BigQueryDataset, "client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("launchflow.gcp.bigquery.time.sleep")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stream_table_data_chunks_rows(self):
+        self.client.insert_rows_json.return_value = []
+        rows = ({"id": i} for i in range(1050))
+
+        self.dataset.stream_table_data("table", rows, chunk_size=500, max_workers=2)
+
+        inserted = sorted(
+            row["id"]
+            for call in self.client.insert_rows_json.call_args_list
+            for row in call.args[1]
+        )
+        self.assertEqual(inserted, list(range(1050)))
+        self.assertEqual(
+            sorted(
+                len(call.args[1])
+                for call in self.client.insert_rows_json.call_args_list
+            ),
+            [50, 500, 500],
+        )
+        self.assertEqual(
+            self.client.insert_rows_json.call_args.args[0],
+            "my-project.my_dataset.table",
+        )
+
+    def test_stream_table_data_retries_transient_errors(self):
+        self.client.insert_rows_json.side_effect = [
+            [
+                {"index": 1, "errors": [{"reason": "backendError"}]},
+                {"index": 2, "errors": [{"reason": "stopped"}]},
+            ],
+            [],
+        ]
+
+        self.dataset.stream_table_data("table", [{"id": i} for i in range(3)])
+
+        first, retry = self.client.insert_rows_json.call_args_list
+        self.assertEqual(retry.args[1], [{"id": 1}, {"id": 2}])
+        # The same row ids are used so retried rows can be deduplicated
+        self.assertEqual(retry.kwargs["row_ids"], first.kwargs["row_ids"][1:])
+
+    def test_stream_table_data_raises_invalid_rows(self):
+        self.client.insert_rows_json.side_effect = [
+            [
+                {"index": 0, "errors": [{"reason": "invalid", "message": "bad row"}]},
+                {"index": 1, "errors": [{"reason": "stopped"}]},
+            ],
+            [],
+        ]
+
+        with self.assertRaises(exceptions.BigQueryInsertFailed) as e:
+            self.dataset.stream_table_data("table", [{"id": 0}, {"id": 1}])
+
+        self.assertEqual([error["row"] for error in e.exception.errors], [{"id": 0}])
+        # Rows that were only stopped by the invalid row are retried on their own
+        first, retry = self.client.insert_rows_json.call_args_list
+        self.assertEqual(retry.args[1], [{"id": 1}])
+        self.assertEqual(retry.kwargs["row_ids"], first.kwargs["row_ids"][1:])
+
+    def test_stream_table_data_raises_after_max_retries(self):
+        self.client.insert_rows_json.return_value = [
+            {"index": 0, "errors": [{"reason": "backendError"}]},
+        ]
+
+        with self.assertRaises(exceptions.BigQueryInsertFailed) as e:
+            self.dataset.stream_table_data("table", [{"id": 0}], max_retries=2)
+
+        self.assertEqual([error["row"] for error in e.exception.errors], [{"id": 0}])
+        self.assertEqual(self.client.insert_rows_json.call_count, 3)
+
+    async def test_stream_table_data_async(self):
+        self.client.insert_rows_json.return_value = []
+
+        await self.dataset.stream_table_data_async("table", [{"id": 0}])
+
+        self.client.insert_rows_json.assert_called_once()
+
+    def test_load_table_data_infers_format(self):
+        for extension, want in [
+            (".parquet", bigquery.SourceFormat.PARQUET),
+            (".ndjson", bigquery.SourceFormat.NEWLINE_DELIMITED_JSON),
+            (".avro", bigquery.SourceFormat.AVRO),
+        ]:
+            with tempfile.NamedTemporaryFile(suffix=extension) as f:
+                self.dataset.load_table_data("table", f.name)
+
+            job_config = self.client.load_table_from_file.call_args.kwargs["job_config"]
+            self.assertEqual(job_config.source_format, want)
+            self.assertEqual(job_config.write_disposition, "WRITE_APPEND")
+        self.client.load_table_from_file.return_value.result.assert_called_with()
+
+    def test_load_table_data_csv_options(self):
+        with tempfile.NamedTemporaryFile(suffix=".csv") as f:
+            self.dataset.load_table_data("table", f.name)
+            job_config = self.client.load_table_from_file.call_args.kwargs["job_config"]
+            self.assertEqual(job_config.skip_leading_rows, 1)
+            self.assertIsNone(job_config.autodetect)
+
+            self.dataset.load_table_data(
+                "table", f.name, csv_header=False, autodetect=True
+            )
+            job_config = self.client.load_table_from_file.call_args.kwargs["job_config"]
+            self.assertIsNone(job_config.skip_leading_rows)
+            self.assertTrue(job_config.autodetect)
+
+    def test_load_table_data_unknown_format(self):
+        with tempfile.NamedTemporaryFile(suffix=".bin") as f:
+            with self.assertRaises(ValueError):
+                self.dataset.load_table_data("table", f.name)
+
+    async def test_load_table_data_async(self):
+        job = self.client.load_table_from_file.return_value
+        job.done.side_effect = [False, True]
+
+        with tempfile.NamedTemporaryFile(suffix=".parquet") as f:
+            got = await self.dataset.load_table_data_async(
+                "table", f.name, poll_interval=0
+            )
+
+        self.assertIs(got, job)
+        self.assertEqual(job.done.call_count, 2)
+        job.result.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from launchflow.gcp import cloud_tasks
+from launchflow.gcp.cloud_tasks import (
+    CloudTasksQueue,
+    CloudTasksQueueOutputs,
+    EnqueueRequest,
+)
+
+
+class CloudTasksQueueEnqueueManyTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.queue = CloudTasksQueue("my-queue")
+        self.outputs = CloudTasksQueueOutputs(queue_id="projects/p/queues/my-queue")
+        patcher = mock.patch.object(cloud_tasks, "tasks", mock.MagicMock())
+        self.tasks_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+        # Tasks are built from the request url so results can be checked
+        self.tasks_mock.HttpRequest.side_effect = lambda **kwargs: kwargs["url"]
+        self.tasks_mock.Task.side_effect = lambda **kwargs: kwargs["http_request"]
+
+    def test_enqueue_many(self):
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def create_task(parent, task):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.001)
+            with lock:
+                in_flight -= 1
+            if task == "https://example.com/3":
+                raise RuntimeError("create failed")
+            return f"{parent}/tasks/{task}"
+
+        client = mock.MagicMock()
+        client.create_task.side_effect = create_task
+        requests = [EnqueueRequest(f"https://example.com/{i}") for i in range(50)]
+
+        with (
+            mock.patch.object(CloudTasksQueue, "outputs", return_value=self.outputs),
+            mock.patch.object(
+                cloud_tasks, "get_cloud_tasks_client", return_value=client
+            ),
+        ):
+            got = self.queue.enqueue_many(iter(requests), max_concurrency=4)
+
+        self.assertEqual([result.request for result in got], requests)
+        self.assertEqual(
+            got[0].task, "projects/p/queues/my-queue/tasks/https://example.com/0"
+        )
+        self.assertIsInstance(got[3].error, RuntimeError)
+        self.assertIsNone(got[3].task)
+        self.assertEqual(sum(result.error is not None for result in got), 1)
+        self.assertLessEqual(max_in_flight, 4)
+
+    async def test_enqueue_many_async(self):
+        in_flight = 0
+        max_in_flight = 0
+        read = 0
+        completed = 0
+
+        def requests():
+            nonlocal read
+            for i in range(50):
+                read += 1
+                yield EnqueueRequest(f"https://example.com/{i}")
+
+        async def create_task(parent, task):
+            nonlocal in_flight, max_in_flight, completed
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Requests are only read as earlier ones complete
+            self.assertLessEqual(read, completed + 4)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            completed += 1
+            if task == "https://example.com/3":
+                raise RuntimeError("create failed")
+            return task
+
+        client = mock.MagicMock()
+        client.create_task = mock.AsyncMock(side_effect=create_task)
+
+        with (
+            mock.patch.object(
+                CloudTasksQueue,
+                "outputs_async",
+                mock.AsyncMock(return_value=self.outputs),
+            ),
+            mock.patch.object(
+                cloud_tasks, "get_cloud_tasks_async_client", return_value=client
+            ),
+        ):
+            got = await self.queue.enqueue_many_async(requests(), max_concurrency=4)
+
+        self.assertEqual(
+            [result.request.url for result in got],
+            [f"https://example.com/{i}" for i in range(50)],
+        )
+        self.assertIsInstance(got[3].error, RuntimeError)
+        self.assertEqual(got[4].task, "https://example.com/4")
+        self.assertEqual(max_in_flight, 4)
+
+    def test_enqueue_request_body_and_json(self):
+        with self.assertRaises(ValueError):
+            EnqueueRequest("https://example.com", body=b"body", json={}).to_task()
+
+
+if __name__ == "__main__":
+    unittest.main()
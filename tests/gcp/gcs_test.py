@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from google.cloud.storage import transfer_manager
+
+from launchflow.gcp.gcs import GCSBucket, GCSBucketOutputs
+
+
+class GCSBucketTransferTest(unittest.TestCase):
+    def setUp(self):
+        self.bucket = GCSBucket("my-bucket")
+        patcher = mock.patch.object(
+            GCSBucket,
+            "outputs",
+            return_value=GCSBucketOutputs(bucket_name="my-bucket"),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch("launchflow.gcp.gcs.get_storage_client")
+        self.bucket_mock = patcher.start().return_value.bucket.return_value
+        self.addCleanup(patcher.stop)
+
+    def test_iter_download(self):
+        reader = self.bucket_mock.blob.return_value.open.return_value.__enter__
+        reader.return_value.read.side_effect = [b"ab", b"c", b""]
+
+        got = list(self.bucket.iter_download("file.bin", chunk_size=2))
+
+        self.assertEqual(got, [b"ab", b"c"])
+        self.bucket_mock.blob.assert_called_once_with("file.bin")
+        self.bucket_mock.blob.return_value.open.assert_called_once_with(
+            "rb", chunk_size=2
+        )
+
+    @mock.patch.object(transfer_manager, "upload_many_from_filenames")
+    def test_upload_directory(self, upload_mock: mock.MagicMock):
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "css"))
+            for path in ["index.html", os.path.join("css", "main.css")]:
+                with open(os.path.join(directory, path), "w") as f:
+                    f.write(path)
+
+            got = self.bucket.upload_directory(
+                directory, prefix="static/", max_workers=4
+            )
+
+        self.assertEqual(sorted(got), ["static/css/main.css", "static/index.html"])
+        args, kwargs = upload_mock.call_args
+        self.assertEqual(sorted(args[1]), ["css/main.css", "index.html"])
+        self.assertEqual(kwargs["source_directory"], directory)
+        self.assertEqual(kwargs["blob_name_prefix"], "static/")
+        self.assertEqual(kwargs["worker_type"], transfer_manager.THREAD)
+        self.assertEqual(kwargs["max_workers"], 4)
+        self.assertTrue(kwargs["raise_exception"])
+
+    @mock.patch.object(transfer_manager, "download_many_to_path")
+    def test_download_prefix(self, download_mock: mock.MagicMock):
+        blobs = []
+        for name in [
+            "static/index.html",
+            "static/css/",
+            "static/css/main.css",
+            "static/../../escape.txt",
+        ]:
+            blob = mock.MagicMock()
+            blob.name = name
+            blobs.append(blob)
+        self.bucket_mock.list_blobs.return_value = blobs
+
+        got = self.bucket.download_prefix("static/", "dist")
+
+        self.assertEqual(
+            got,
+            [os.path.join("dist", "index.html"), os.path.join("dist", "css/main.css")],
+        )
+        args, kwargs = download_mock.call_args
+        self.assertEqual(args[1], ["index.html", "css/main.css"])
+        self.assertEqual(kwargs["destination_directory"], "dist")
+        self.assertEqual(kwargs["blob_name_prefix"], "static/")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from unittest import mock
+
+from launchflow.client_registry import ClientRegistry
+from launchflow.gcp import pubsub
+from launchflow.gcp.pubsub import PubsubTopic, PubsubTopicOutputs, _chunk_messages
+
+
+class ChunkMessagesTest(unittest.TestCase):
+    def test_chunk_by_count(self):
+        messages = [b"a"] * 5
+
+        got = list(_chunk_messages(messages, max_messages=2, max_bytes=100))
+
+        self.assertEqual([len(chunk) for chunk in got], [2, 2, 1])
+
+    def test_chunk_by_size(self):
+        messages = [b"a" * 4, b"b" * 4, b"c" * 12, b"d"]
+
+        got = list(_chunk_messages(messages, max_messages=100, max_bytes=10))
+
+        # Messages larger than the limit are still sent on their own
+        self.assertEqual(got, [[b"a" * 4, b"b" * 4], [b"c" * 12], [b"d"]])
+
+    def test_chunk_empty(self):
+        self.assertEqual(list(_chunk_messages([])), [])
+
+
+class PubsubTopicBatchPublishTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.topic = PubsubTopic("my-topic")
+        self.outputs = PubsubTopicOutputs(topic_id="projects/p/topics/my-topic")
+        for name, value in [
+            ("client_registry", ClientRegistry()),
+            ("PublisherClient", mock.MagicMock()),
+            ("pubsub_types", mock.MagicMock()),
+            ("PublisherAsyncClient", mock.MagicMock()),
+            ("PubsubMessage", mock.MagicMock(side_effect=lambda **kw: kw)),
+        ]:
+            patcher = mock.patch.object(pubsub, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.publisher = pubsub.PublisherClient.return_value
+
+    def test_batch_publisher_is_shared(self):
+        first = self.topic.batch_publisher()
+        second = PubsubTopic("other-topic").batch_publisher()
+        self.topic.batch_publisher(max_messages=10)
+
+        self.assertIs(first, second)
+        self.assertEqual(pubsub.PublisherClient.call_count, 2)
+        pubsub.pubsub_types.PublisherOptions.assert_called_with(
+            enable_message_ordering=True
+        )
+
+    def test_publish_batch(self):
+        futures = [mock.MagicMock(), mock.MagicMock()]
+        futures[0].result.return_value = "1"
+        futures[1].result.return_value = "2"
+        self.publisher.publish.side_effect = futures
+
+        with mock.patch.object(PubsubTopic, "outputs", return_value=self.outputs):
+            got = self.topic.publish_batch([b"a", b"b"], ordering_key="key")
+
+        self.assertEqual(got, ["1", "2"])
+        self.publisher.publish.assert_has_calls(
+            [
+                mock.call(self.outputs.topic_id, b"a", ordering_key="key"),
+                mock.call(self.outputs.topic_id, b"b", ordering_key="key"),
+            ]
+        )
+
+    def test_publish_batch_failure_resumes_ordering_key(self):
+        future = mock.MagicMock()
+        future.result.side_effect = RuntimeError("publish failed")
+        self.publisher.publish.return_value = future
+
+        with mock.patch.object(PubsubTopic, "outputs", return_value=self.outputs):
+            with self.assertRaises(RuntimeError):
+                self.topic.publish_batch([b"a"], ordering_key="key")
+
+        self.publisher.resume_publish.assert_called_once_with(
+            self.outputs.topic_id, "key"
+        )
+
+    async def test_publish_batch_async(self):
+        client = mock.MagicMock()
+        client.publish = mock.AsyncMock(
+            side_effect=lambda messages, topic: mock.MagicMock(
+                message_ids=[m["data"].decode() for m in messages]
+            )
+        )
+        messages = [str(i).encode() for i in range(2500)]
+
+        with (
+            mock.patch.object(
+                PubsubTopic, "outputs_async", mock.AsyncMock(return_value=self.outputs)
+            ),
+            mock.patch.object(
+                pubsub, "get_publisher_async_client", return_value=client
+            ),
+        ):
+            got = await self.topic.publish_batch_async(messages, ordering_key="key")
+
+        self.assertEqual(got, [str(i) for i in range(2500)])
+        self.assertEqual(client.publish.await_count, 3)
+        first_request = client.publish.await_args_list[0].kwargs
+        self.assertEqual(len(first_request["messages"]), 1000)
+        self.assertEqual(first_request["messages"][0]["ordering_key"], "key")
+        self.assertEqual(first_request["topic"], self.outputs.topic_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
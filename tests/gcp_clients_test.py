@@ -0,0 +1,81 @@
+import tempfile
+import unittest
+from unittest import mock
+
+from google.api_core.exceptions import NotFound, NotModified
+from google.cloud import storage
+
+from launchflow import exceptions
+from launchflow.gcp_clients import read_from_gcs, write_to_gcs
+
+
+class GCSStateMirrorTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mirror_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.mirror_dir.cleanup)
+        patcher = mock.patch(
+            "launchflow.cache.state_mirror.build_state_mirror_dir",
+            return_value=self.mirror_dir.name,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch("launchflow.gcp_clients.get_storage_client")
+        mock_storage_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.blob_mock = mock.MagicMock(spec=storage.Blob)
+        self.blob_mock.name = "prefix/project/dev/flow.state"
+        mock_storage_client.return_value.bucket.return_value.blob.return_value = (
+            self.blob_mock
+        )
+
+    async def test_read_revalidates_mirrored_state(self):
+        self.blob_mock.generation = None
+
+        def download_as_bytes():
+            # Downloads set the generation from the response headers
+            self.blob_mock.generation = 5
+            return b"status: ready"
+
+        self.blob_mock.download_as_bytes.side_effect = download_as_bytes
+
+        got = await read_from_gcs("bucket", self.blob_mock.name, mirror=True)
+        self.assertEqual(got, "status: ready")
+        self.blob_mock.download_as_bytes.assert_called_once_with()
+
+        # The state is unchanged so only a conditional request is made
+        self.blob_mock.generation = None
+        self.blob_mock.download_as_bytes.side_effect = NotModified("not modified")
+        got = await read_from_gcs("bucket", self.blob_mock.name, mirror=True)
+        self.assertEqual(got, "status: ready")
+        self.blob_mock.download_as_bytes.assert_called_with(if_generation_not_match=5)
+
+    async def test_read_downloads_changed_state(self):
+        self.blob_mock.generation = 5
+        await write_to_gcs("bucket", self.blob_mock.name, "status: ready", mirror=True)
+
+        self.blob_mock.generation = 6
+        self.blob_mock.download_as_bytes.return_value = b"status: failed"
+        got = await read_from_gcs("bucket", self.blob_mock.name, mirror=True)
+
+        self.assertEqual(got, "status: failed")
+
+    async def test_read_deleted_state(self):
+        self.blob_mock.generation = 5
+        await write_to_gcs("bucket", self.blob_mock.name, "status: ready", mirror=True)
+
+        self.blob_mock.generation = None
+        self.blob_mock.download_as_bytes.side_effect = NotFound("not found")
+        with self.assertRaises(exceptions.GCSObjectNotFound):
+            await read_from_gcs("bucket", self.blob_mock.name, mirror=True)
+
+        # The mirrored copy is dropped so we don't keep revalidating it
+        self.blob_mock.generation = None
+        self.blob_mock.download_as_bytes.side_effect = None
+        self.blob_mock.download_as_bytes.return_value = b"status: ready"
+        await read_from_gcs("bucket", self.blob_mock.name, mirror=True)
+        self.blob_mock.download_as_bytes.assert_called_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
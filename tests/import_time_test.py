@@ -0,0 +1,72 @@
+import json
+import subprocess
+import sys
+import unittest
+
+# NOTE: This is intentionally generous so the test isn't flaky on slow CI
+# machines, importing every provider eagerly takes several seconds.
+_IMPORT_TIME_BUDGET_SECONDS = 0.5
+
+_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import launchflow
+import_seconds = time.perf_counter() - start
+
+print(json.dumps({"seconds": import_seconds, "modules": sorted(sys.modules)}))
+"""
+
+
+def _import_launchflow():
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_import_launchflow_is_lazy(self):
+        modules = _import_launchflow()["modules"]
+
+        for lazy_module in [
+            "launchflow.aws",
+            "launchflow.gcp",
+            "launchflow.docker",
+            "launchflow.kubernetes",
+            "launchflow.testing",
+            "launchflow.flows",
+            "launchflow.resource",
+            "rich",
+            "httpx",
+            "pydantic",
+            "boto3",
+            "google.cloud",
+        ]:
+            self.assertNotIn(lazy_module, modules)
+
+    def test_import_launchflow_budget(self):
+        # Take the best of a few runs to reduce noise from the machine
+        seconds = min(_import_launchflow()["seconds"] for _ in range(3))
+
+        self.assertLess(seconds, _IMPORT_TIME_BUDGET_SECONDS)
+
+    def test_lazy_attributes(self):
+        import launchflow as lf
+
+        self.assertIs(lf.gcp.CloudRun, lf.gcp.CloudRunService)
+        self.assertEqual(lf.gcp.GCSBucket.__module__, "launchflow.gcp.gcs")
+        self.assertEqual(lf.aws.S3Bucket.__module__, "launchflow.aws.s3")
+        self.assertEqual(lf.Resource.__module__, "launchflow.resource")
+        self.assertIn("GCSBucket", dir(lf.gcp))
+        with self.assertRaises(AttributeError):
+            lf.gcp.NotAResource
+
+
+if __name__ == "__main__":
+    unittest.main()
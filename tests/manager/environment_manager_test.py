@@ -26,6 +26,7 @@ from launchflow.managers.environment_manager import EnvironmentManager
 from launchflow.managers.resource_manager import ResourceManager
 from launchflow.models.enums import CloudProvider, ResourceProduct, ResourceStatus
 from launchflow.models.flow_state import EnvironmentState, ResourceState
+from launchflow.state_codec import encode_state
 
 
 @pytest.mark.usefixtures("launchflow_yaml_remote_backend_fixture")
@@ -191,9 +192,7 @@ class EnvironmentManagerTest(unittest.IsolatedAsyncioTestCase):
 
         client_mock.bucket.assert_called_with("bucket")
         bucket_mock.blob.assert_called_with("prefix/project/dev/flow.state")
-        blob_mock.upload_from_string.assert_called_with(
-            yaml.dump(env.to_dict(), sort_keys=False)
-        )
+        blob_mock.upload_from_string.assert_called_with(encode_state(env.to_dict()))
 
     @mock.patch("launchflow.gcp_clients.get_storage_client")
     async def test_gcs_environment_load_success(self, mock_storage_client):
@@ -293,6 +292,48 @@ class EnvironmentManagerTest(unittest.IsolatedAsyncioTestCase):
         resource_write_prefix = mock_write_to_gcs.call_args.args[1]
         self.assertIn(environment_delete_prefix, resource_write_prefix)
 
+    @mock.patch("launchflow.managers.environment_manager.get_storage_client")
+    async def test_gcs_list_resources(self, mock_storage_client):
+        client_mock = mock.MagicMock()
+        bucket_mock = mock.MagicMock(spec=storage.Bucket)
+        mock_storage_client.return_value = client_mock
+        client_mock.bucket.return_value = bucket_mock
+
+        blobs = []
+        for i in range(50):
+            resource = ResourceState(
+                created_at=datetime.datetime(2021, 1, 1),
+                updated_at=datetime.datetime(2021, 1, 1),
+                name=f"resource-{i}",
+                cloud_provider=CloudProvider.GCP,
+                product=ResourceProduct.GCP_STORAGE_BUCKET.value,
+                status=ResourceStatus.READY,
+            )
+            blob = mock.MagicMock(spec=storage.Blob)
+            blob.name = f"prefix/project/dev/resources/resource-{i}/flow.state"
+            blob.download_as_bytes.return_value = yaml.dump(resource.to_dict()).encode(
+                "utf-8"
+            )
+            blobs.append(blob)
+        # Lock files and deleted resources should be skipped
+        lock_blob = mock.MagicMock(spec=storage.Blob)
+        lock_blob.name = "prefix/project/dev/resources/resource-0/flow.lock"
+        deleted_blob = mock.MagicMock(spec=storage.Blob)
+        deleted_blob.name = "prefix/project/dev/resources/deleted/flow.state"
+        deleted_blob.download_as_bytes.side_effect = NotFound("not found")
+        bucket_mock.list_blobs.return_value = blobs + [lock_blob, deleted_blob]
+
+        backend = GCSBackend("bucket", "prefix")
+        manager = EnvironmentManager("project", "dev", backend)
+        resources = await manager.list_resources()
+
+        bucket_mock.list_blobs.assert_called_once_with(
+            prefix="prefix/project/dev/resources"
+        )
+        self.assertEqual(len(resources), 50)
+        self.assertEqual(resources["resource-7"].name, "resource-7")
+        lock_blob.download_as_bytes.assert_not_called()
+
     @mock.patch("launchflow.locks.get_storage_client")
     async def test_gcs_environment_lock(self, mock_storage_client):
         client_mock = mock.MagicMock()
@@ -13,6 +13,7 @@ from launchflow import exceptions
 from launchflow.backend import GCSBackend, LaunchFlowBackend, LocalBackend
 from launchflow.managers.project_manager import ProjectManager
 from launchflow.models.flow_state import ProjectState
+from launchflow.state_codec import encode_state
 
 
 @pytest.mark.usefixtures("launchflow_yaml_remote_backend_fixture")
@@ -64,7 +65,7 @@ class ProjectStateManagerTest(unittest.IsolatedAsyncioTestCase):
         client_mock.bucket.assert_called_with("bucket")
         bucket_mock.blob.assert_called_with("prefix/project/flow.state")
         blob_mock.upload_from_string.assert_called_with(
-            yaml.dump(project_state.to_dict(), sort_keys=False)
+            encode_state(project_state.to_dict())
         )
 
     @mock.patch("launchflow.gcp_clients.get_storage_client")
@@ -24,6 +24,7 @@ from launchflow.locks import (
 from launchflow.managers.resource_manager import ResourceManager
 from launchflow.models.enums import ResourceProduct, ResourceStatus
 from launchflow.models.flow_state import ResourceState
+from launchflow.state_codec import encode_state
 
 
 @pytest.mark.usefixtures("launchflow_yaml_remote_backend_fixture")
@@ -116,7 +117,7 @@ class ResourceManagerTest(unittest.IsolatedAsyncioTestCase):
             "prefix/project/dev/resources/resource/flow.state"
         )
         blob_mock.upload_from_string.assert_called_with(
-            yaml.dump(resource.to_dict(), sort_keys=False)
+            encode_state(resource.to_dict())
         )
 
     @mock.patch("launchflow.gcp_clients.get_storage_client")
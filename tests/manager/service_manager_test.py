@@ -24,6 +24,7 @@ from launchflow.locks import (
 from launchflow.managers.service_manager import ServiceManager
 from launchflow.models.enums import ServiceProduct, ServiceStatus
 from launchflow.models.flow_state import ServiceState
+from launchflow.state_codec import encode_state
 
 
 @pytest.mark.usefixtures("launchflow_yaml_remote_backend_fixture")
@@ -115,9 +116,7 @@ class ServiceManagerTest(unittest.IsolatedAsyncioTestCase):
         bucket_mock.blob.assert_called_with(
             "prefix/project/dev/services/service/flow.state"
         )
-        blob_mock.upload_from_string.assert_called_with(
-            yaml.dump(service.to_dict(), sort_keys=False)
-        )
+        blob_mock.upload_from_string.assert_called_with(encode_state(service.to_dict()))
 
     @mock.patch("launchflow.gcp_clients.get_storage_client")
     async def test_gcs_service_load_success(self, mock_storage_client):
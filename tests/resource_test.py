@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import os
 import tempfile
@@ -9,7 +10,9 @@ from unittest import mock
 import pytest
 import yaml
 
-from launchflow.cache import cache
+from launchflow import resource
+from launchflow.cache import cache, runtime_manifest
+from launchflow.cache.launchflow_tmp import LaunchFlowCache, build_cache_key
 from launchflow.config import config
 from launchflow.managers.environment_manager import EnvironmentManager
 from launchflow.models.enums import (
@@ -130,6 +133,118 @@ class ResourceTest(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(got, want)
 
+    @mock.patch("launchflow.resource.read_file")
+    async def test_connect_stale_cache_refreshes_in_background(
+        self, read_file_mock: mock.MagicMock
+    ):
+        stale = FakeResourceOutputs(field="test-stale")
+        want = FakeResourceOutputs(field="test-refreshed")
+        read_file_mock.return_value = yaml.safe_dump(want.to_dict())
+        key = build_cache_key(
+            self.environment_manager.project_name,
+            self.environment_manager.environment_name,
+            self.gcp_resource.product,
+            self.gcp_resource.name,
+        )
+        cache.resource_connection_info.set(key, stale.to_dict(), ttl_seconds=0)
+
+        with (
+            mock.patch.object(config.env, "outputs_path", None),
+            mock.patch.object(config.env, "artifact_bucket", "gs://bucket"),
+        ):
+            # Stale outputs are served while they are refreshed
+            got = await self.gcp_resource.outputs_async()
+            self.assertEqual(got, stale)
+            await asyncio.gather(*resource._background_refreshes)
+
+            got = await self.gcp_resource.outputs_async()
+
+        self.assertEqual(got, want)
+        read_file_mock.assert_called_once_with(
+            "gs://bucket/resources/test-resource.yaml"
+        )
+
+    @mock.patch("launchflow.resource.read_file")
+    async def test_connect_async_coalesces_concurrent_lookups(
+        self, read_file_mock: mock.MagicMock
+    ):
+        want = FakeResourceOutputs(field="test-coalesced")
+        read_file_mock.return_value = yaml.safe_dump(want.to_dict())
+        load_environment_mock = mock.AsyncMock(
+            return_value=EnvironmentState(
+                created_at=datetime.datetime(2021, 1, 1),
+                updated_at=datetime.datetime(2021, 1, 1),
+                status=EnvironmentStatus.READY,
+                environment_type=EnvironmentType.DEVELOPMENT,
+                gcp_config=GCPEnvironmentConfig(
+                    project_id="test-project",
+                    default_region="us-central1",
+                    default_zone="us-central1-a",
+                    service_account_email="test-email",
+                    artifact_bucket="test-bucket",
+                ),
+            )
+        )
+        other_resource = FakeGCPResource(name="other-resource")
+
+        with (
+            mock.patch.object(config.env, "outputs_path", None),
+            mock.patch.object(config.env, "artifact_bucket", None),
+            mock.patch.object(
+                EnvironmentManager, "load_environment", load_environment_mock
+            ),
+        ):
+            got = await asyncio.gather(
+                self.gcp_resource.outputs_async(use_cache=False),
+                self.gcp_resource.outputs_async(use_cache=False),
+                other_resource.outputs_async(use_cache=False),
+            )
+
+        self.assertEqual(got, [want, want, want])
+        # The environment is loaded once and each resource is read once
+        load_environment_mock.assert_awaited_once()
+        self.assertEqual(
+            sorted(call.args[0] for call in read_file_mock.call_args_list),
+            [
+                "gs://test-bucket/resources/other-resource.yaml",
+                "gs://test-bucket/resources/test-resource.yaml",
+            ],
+        )
+
+    @mock.patch("launchflow.resource.read_file")
+    async def test_connect_runtime_manifest(self, read_file_mock: mock.MagicMock):
+        want = FakeResourceOutputs(field="test-manifest")
+        key = build_cache_key(
+            self.environment_manager.project_name,
+            self.environment_manager.environment_name,
+            self.gcp_resource.product,
+            self.gcp_resource.name,
+        )
+        with tempfile.TemporaryDirectory() as tempdir:
+            with mock.patch.object(
+                runtime_manifest,
+                "build_runtime_manifest_staging_dir",
+                return_value=tempdir,
+            ):
+                manifest_path = runtime_manifest.stage_runtime_manifest(
+                    tempdir, "123", {key: want.to_dict()}
+                )
+            with (
+                mock.patch.object(config.env, "deployment_id", "123"),
+                mock.patch.object(config.env, "runtime_manifest_path", manifest_path),
+            ):
+                # The manifest seeds the outputs cache when a deployed service starts
+                seeded_cache = LaunchFlowCache.load_from_file(
+                    os.path.join(tempdir, "cache.toml")
+                )
+            with mock.patch.object(resource, "cache", seeded_cache):
+                got = self.gcp_resource.outputs()
+                got_async = await self.gcp_resource.outputs_async()
+
+        self.assertEqual(got, want)
+        self.assertEqual(got_async, want)
+        read_file_mock.assert_not_called()
+
     @mock.patch("launchflow.resource.read_file")
     async def test_connect_sync_remote_bucket_aws(self, read_file_mock: mock.MagicMock):
         want = FakeResourceOutputs(field=f"test-{str(uuid.uuid4())}")
@@ -0,0 +1,62 @@
+import io
+import unittest
+from unittest import mock
+
+import yaml
+
+from launchflow import state_codec
+from launchflow.models.enums import ResourceProduct, ResourceStatus
+from launchflow.models.flow_state import ResourceState
+
+
+class StateCodecTest(unittest.TestCase):
+    def setUp(self):
+        self.state = ResourceState(
+            name="bucket",
+            product=ResourceProduct.GCP_STORAGE_BUCKET,
+            cloud_provider="gcp",
+            created_at="2021-01-01T00:00:00+00:00",
+            updated_at="2021-01-01T00:00:00+00:00",
+            status=ResourceStatus.READY,
+            inputs={"location": "US", "labels": {"team": "infra"}},
+        ).to_dict()
+
+    def test_json_round_trip(self):
+        encoded = state_codec.encode_state(self.state, state_codec.JSON_FORMAT)
+
+        self.assertEqual(state_codec.decode_state(encoded), self.state)
+        self.assertEqual(state_codec.decode_state(encoded.encode("utf-8")), self.state)
+        # Older versions read state files with a YAML loader
+        self.assertEqual(yaml.safe_load(encoded), self.state)
+
+    def test_json_round_trip_without_orjson(self):
+        with mock.patch.object(state_codec, "orjson", None):
+            encoded = state_codec.encode_state(self.state, state_codec.JSON_FORMAT)
+            self.assertEqual(state_codec.decode_state(encoded), self.state)
+
+    def test_decode_legacy_yaml(self):
+        self.assertEqual(
+            state_codec.decode_state(yaml.dump(self.state, sort_keys=False)),
+            self.state,
+        )
+        # A YAML flow mapping is not always valid JSON
+        self.assertEqual(state_codec.decode_state("{name: bucket}"), {"name": "bucket"})
+
+    def test_decode_stream(self):
+        encoded = state_codec.encode_state(self.state, state_codec.JSON_FORMAT)
+
+        self.assertEqual(state_codec.decode_state(io.StringIO(encoded)), self.state)
+
+    def test_yaml_format(self):
+        encoded = state_codec.encode_state(self.state, state_codec.YAML_FORMAT)
+
+        self.assertEqual(encoded, yaml.dump(self.state, sort_keys=False))
+        self.assertEqual(state_codec.decode_state(encoded), self.state)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            state_codec.encode_state(self.state, "toml")
+
+
+if __name__ == "__main__":
+    unittest.main()
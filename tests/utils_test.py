@@ -4,7 +4,11 @@ import sys
 import unittest
 import unittest.mock as mock
 
-from launchflow.utils import logging_output, redirect_stdout_stderr
+from launchflow.utils import (
+    is_relative_path,
+    logging_output,
+    redirect_stdout_stderr,
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -55,6 +59,13 @@ class TestUtils(unittest.TestCase):
 
         mock_fh.write.assert_has_calls(expected_calls, any_order=False)
 
+    def test_is_relative_path(self):
+        self.assertTrue(is_relative_path("a/b.txt"))
+        self.assertTrue(is_relative_path("a/../b.txt"))
+        self.assertFalse(is_relative_path("../b.txt"))
+        self.assertFalse(is_relative_path("a/../../b.txt"))
+        self.assertFalse(is_relative_path("/etc/passwd"))
+
 
 if __name__ == "__main__":
     unittest.main()
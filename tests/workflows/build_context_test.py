@@ -0,0 +1,114 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from pathspec import PathSpec
+
+from launchflow.workflows import build_context
+from launchflow.workflows.build_context import read_ignore_file, walk_build_context
+
+
+def _walk_and_match(directory, ignore_patterns):
+    # The per-file matching the walker replaces, used as a reference
+    pathspec = PathSpec.from_lines("gitwildmatch", ignore_patterns)
+    relative_paths = []
+    for root, _, files in os.walk(directory):
+        for file in files:
+            relative_path = os.path.relpath(os.path.join(root, file), directory)
+            if not pathspec.match_file(relative_path):
+                relative_paths.append(relative_path)
+    return sorted(relative_paths)
+
+
+class WalkBuildContextTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.directory = self.temp_dir.name
+
+    def _touch(self, *relative_paths: str):
+        for relative_path in relative_paths:
+            file_path = os.path.join(self.directory, relative_path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "w") as f:
+                f.write(relative_path)
+
+    def test_matches_per_file_matching(self):
+        rand = random.Random(0)
+        dir_names = ["a", "b", "build", "dist", "node_modules", "keep", "x.log"]
+        file_names = ["build", "keep", "x.log", "c.py", "index.js"]
+        for _ in range(300):
+            dirs = [rand.choice(dir_names) for _ in range(rand.randint(0, 3))]
+            try:
+                self._touch(os.path.join(*dirs, rand.choice(file_names)))
+            except OSError:
+                # The same name was already used for a file and a directory
+                pass
+
+        for ignore_patterns in [
+            [],
+            ["node_modules/", "*.log"],
+            ["build", "/dist", "a/**/b"],
+            ["node_modules/", "!node_modules/keep", "*.py"],
+            ["*", "!*.py", "!*/"],
+            ["a/", "!a/keep/", "a/keep/b/"],
+        ]:
+            self.assertEqual(
+                sorted(walk_build_context(self.directory, ignore_patterns)),
+                _walk_and_match(self.directory, ignore_patterns),
+                ignore_patterns,
+            )
+
+    def test_ignored_directories_are_not_scanned(self):
+        self._touch("main.py", "node_modules/pkg/index.js")
+
+        with mock.patch.object(
+            build_context.os, "scandir", wraps=os.scandir
+        ) as scandir_mock:
+            relative_paths = list(walk_build_context(self.directory, ["node_modules/"]))
+
+        self.assertEqual(relative_paths, ["main.py"])
+        scanned = [call.args[0] for call in scandir_mock.call_args_list]
+        self.assertNotIn(os.path.join(self.directory, "node_modules"), scanned)
+
+    def test_symlinked_directories_are_skipped(self):
+        self._touch("real/file.txt")
+        os.symlink(
+            os.path.join(self.directory, "real"), os.path.join(self.directory, "link")
+        )
+
+        self.assertEqual(list(walk_build_context(self.directory)), ["real/file.txt"])
+
+    def test_ignore_files(self):
+        self._touch("app.py", "secrets/key", "nested/secrets/key", "dist/out.js")
+        with open(os.path.join(self.directory, ".dockerignore"), "w") as f:
+            f.write("# comment\n\nsecrets\n./dist\n")
+        with open(os.path.join(self.directory, ".gitignore"), "w") as f:
+            f.write("*.js\n")
+
+        relative_paths = sorted(
+            walk_build_context(
+                self.directory, ignore_files=[".dockerignore", ".gitignore", ".none"]
+            )
+        )
+
+        # .dockerignore patterns only match from the root of the build context
+        self.assertEqual(
+            relative_paths,
+            [".dockerignore", ".gitignore", "app.py", "nested/secrets/key"],
+        )
+
+    def test_read_ignore_file_anchors_dockerignore(self):
+        ignore_file = os.path.join(self.directory, ".dockerignore")
+        with open(ignore_file, "w") as f:
+            f.write("foo\n/bar\n!baz\n**/*.pyc\n")
+
+        self.assertEqual(
+            read_ignore_file(ignore_file), ["/foo", "/bar", "!/baz", "**/*.pyc"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
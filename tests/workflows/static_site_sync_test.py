@@ -0,0 +1,175 @@
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+from launchflow.workflows.static_site_sync import (
+    CONTENT_MD5_METADATA_KEY,
+    cdn_invalidation_paths,
+    local_md5,
+    sync_static_site,
+)
+
+
+class _FakeBlob:
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+        self.md5_hash = None
+        self.cache_control = None
+        self.content_encoding = None
+        self.content_type = None
+        self.metadata = None
+        self.data = None
+
+    def _store(self, data, content_type):
+        self.data = data
+        self.content_type = content_type
+        self.bucket.objects[self.name] = self
+        self.bucket.uploads.append(self.name)
+
+    def upload_from_filename(self, filename, content_type=None):
+        with open(filename, "rb") as f:
+            self._store(f.read(), content_type)
+
+    def upload_from_string(self, data, content_type=None):
+        self._store(data, content_type)
+
+    def delete(self):
+        del self.bucket.objects[self.name]
+        self.bucket.deletes.append(self.name)
+
+
+class _FakeBucket:
+    def __init__(self):
+        self.objects = {}
+        self.uploads = []
+        self.deletes = []
+
+    def blob(self, name):
+        return _FakeBlob(self, name)
+
+    def list_blobs(self, fields=None):
+        return list(self.objects.values())
+
+
+class SyncStaticSiteTest(unittest.TestCase):
+    def setUp(self):
+        self.local_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.local_dir)
+        self.bucket = _FakeBucket()
+        self.write("index.html", "<html></html>")
+        self.write("assets/app.js", "console.log('hi')")
+        self.write("assets/logo.png", "png")
+
+    def write(self, relative_path, contents):
+        file_path = os.path.join(self.local_dir, relative_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(contents)
+
+    def sync(self, **kwargs):
+        relative_paths = sorted(
+            os.path.relpath(os.path.join(root, name), self.local_dir)
+            for root, _, names in os.walk(self.local_dir)
+            for name in names
+        )
+        self.bucket.uploads = []
+        self.bucket.deletes = []
+        return sync_static_site(self.bucket, self.local_dir, relative_paths, **kwargs)
+
+    def test_uploads_only_changed_files(self):
+        result = self.sync()
+        self.assertEqual(
+            sorted(result.uploaded), ["assets/app.js", "assets/logo.png", "index.html"]
+        )
+        # Pages are uploaded after the assets they reference
+        self.assertEqual(self.bucket.uploads[-1], "index.html")
+        self.assertIn(
+            self.bucket.objects["assets/app.js"].content_type,
+            ("text/javascript", "application/javascript"),
+        )
+
+        result = self.sync()
+        self.assertEqual(result.uploaded, [])
+        self.assertEqual(result.unchanged, 3)
+        self.assertEqual(self.bucket.uploads, [])
+
+        self.write("assets/app.js", "console.log('bye')")
+        result = self.sync()
+        self.assertEqual(result.uploaded, ["assets/app.js"])
+
+    def test_compares_md5_of_objects_without_metadata(self):
+        file_path = os.path.join(self.local_dir, "assets", "logo.png")
+        blob = self.bucket.blob("assets/logo.png")
+        blob.upload_from_filename(file_path)
+        blob.md5_hash = local_md5(file_path)
+
+        result = self.sync()
+
+        self.assertNotIn("assets/logo.png", result.uploaded)
+
+    def test_reuploads_when_cache_control_changes(self):
+        self.sync()
+
+        result = self.sync(cache_control="public, max-age=60")
+
+        self.assertEqual(len(result.uploaded), 3)
+        self.assertEqual(
+            self.bucket.objects["index.html"].cache_control, "public, max-age=60"
+        )
+
+    def test_gzips_text_files(self):
+        self.sync(gzip_files=True)
+
+        page = self.bucket.objects["index.html"]
+        self.assertEqual(page.content_encoding, "gzip")
+        self.assertEqual(page.content_type, "text/html")
+        self.assertEqual(gzip.decompress(page.data), b"<html></html>")
+        self.assertEqual(
+            page.metadata[CONTENT_MD5_METADATA_KEY],
+            local_md5(os.path.join(self.local_dir, "index.html")),
+        )
+        self.assertIsNone(self.bucket.objects["assets/logo.png"].content_encoding)
+
+        # The stored md5 of the uncompressed file is used to skip unchanged files
+        result = self.sync(gzip_files=True)
+        self.assertEqual(result.uploaded, [])
+
+    def test_deletes_stale_files(self):
+        self.sync()
+        os.remove(os.path.join(self.local_dir, "assets", "logo.png"))
+
+        result = self.sync()
+        self.assertEqual(result.deleted, [])
+        self.assertIn("assets/logo.png", self.bucket.objects)
+
+        result = self.sync(delete_stale_files=True)
+        self.assertEqual(result.deleted, ["assets/logo.png"])
+        self.assertEqual(result.changed, ["assets/logo.png"])
+        self.assertNotIn("assets/logo.png", self.bucket.objects)
+
+
+class CdnInvalidationPathsTest(unittest.TestCase):
+    def test_invalidates_changed_paths(self):
+        self.assertEqual(
+            cdn_invalidation_paths(["assets/app.js", "index.html", "docs/index.html"]),
+            [
+                "/assets/app.js",
+                "/index.html",
+                "/",
+                "/docs/index.html",
+                "/docs",
+                "/docs/",
+            ],
+        )
+
+    def test_falls_back_to_wildcard(self):
+        self.assertEqual(
+            cdn_invalidation_paths([f"{i}.js" for i in range(5)], max_paths=4), ["/*"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+import asyncio
+import contextlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from launchflow.backend import LaunchFlowBackend, LocalBackend
+from launchflow.config import config
+from launchflow.workflows.commands.tf_commands import TFApplyCommand
+from launchflow.workflows.commands.tf_workspaces import (
+    plugin_cache_lock,
+    tofu_working_dir,
+)
+
+
+class TofuWorkspaceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.env_patch = mock.patch.multiple(
+            config.env,
+            tofu_cache_dir=self.cache_dir.name,
+            reuse_tofu_workspaces=True,
+        )
+        self.env_patch.start()
+
+    def tearDown(self) -> None:
+        self.env_patch.stop()
+        self.cache_dir.cleanup()
+
+    def _command(self, backend=LocalBackend(path="."), prefix="resource/module"):
+        return TFApplyCommand(
+            tf_module_dir="resources/gcp_storage_bucket",
+            backend=backend,
+            tf_state_prefix=prefix,
+            tf_vars={},
+            logs_file=None,
+            launchflow_state_url=None,
+        )
+
+    def test_workspace_reused_after_init(self):
+        command = self._command()
+        with tofu_working_dir(command) as (working_dir, workspace):
+            self.assertIsNotNone(workspace)
+            self.assertFalse(workspace.is_initialized())
+            os.mkdir(os.path.join(working_dir, ".terraform"))
+            workspace.mark_initialized()
+            first_dir = working_dir
+
+        with tofu_working_dir(command) as (working_dir, workspace):
+            self.assertEqual(working_dir, first_dir)
+            self.assertTrue(workspace.is_initialized())
+
+    def test_workspace_reset_when_fingerprint_changes(self):
+        command = self._command()
+        with tofu_working_dir(command) as (working_dir, workspace):
+            os.mkdir(os.path.join(working_dir, ".terraform"))
+            workspace.mark_initialized()
+
+        with mock.patch.object(
+            TFApplyCommand, "init_fingerprint", return_value="changed"
+        ):
+            with tofu_working_dir(command) as (working_dir, workspace):
+                self.assertFalse(workspace.is_initialized())
+                self.assertFalse(
+                    os.path.exists(os.path.join(working_dir, ".terraform"))
+                )
+
+    def test_different_state_prefix_uses_different_workspace(self):
+        with tofu_working_dir(self._command(prefix="a")) as (dir_a, _):
+            pass
+        with tofu_working_dir(self._command(prefix="b")) as (dir_b, _):
+            pass
+        self.assertNotEqual(dir_a, dir_b)
+
+    def test_busy_workspace_falls_back_to_tempdir(self):
+        command = self._command()
+        with tofu_working_dir(command) as (outer_dir, outer_workspace):
+            with tofu_working_dir(command) as (inner_dir, inner_workspace):
+                self.assertIsNotNone(outer_workspace)
+                self.assertIsNone(inner_workspace)
+                self.assertNotEqual(outer_dir, inner_dir)
+
+    def test_launchflow_backend_uses_tempdir(self):
+        command = self._command(backend=LaunchFlowBackend())
+        with tofu_working_dir(command) as (working_dir, workspace):
+            self.assertIsNone(workspace)
+            self.assertFalse(working_dir.startswith(self.cache_dir.name))
+
+    def test_reuse_disabled_uses_tempdir(self):
+        with mock.patch.object(config.env, "reuse_tofu_workspaces", False):
+            with tofu_working_dir(self._command()) as (_, workspace):
+                self.assertIsNone(workspace)
+
+
+class PluginCacheLockTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.env_patch = mock.patch.object(
+            config.env, "tofu_cache_dir", self.cache_dir.name
+        )
+        self.env_patch.start()
+
+    def tearDown(self) -> None:
+        self.env_patch.stop()
+        self.cache_dir.cleanup()
+
+    async def test_lock_serializes_holders(self):
+        events = []
+
+        async def hold(name: str):
+            async with plugin_cache_lock():
+                events.append(f"{name} acquired")
+                await asyncio.sleep(0.05)
+                events.append(f"{name} released")
+
+        await asyncio.wait_for(asyncio.gather(hold("a"), hold("b")), timeout=5)
+
+        self.assertEqual(events[0][0], events[1][0])
+        self.assertEqual(events[2][0], events[3][0])
+        self.assertTrue(events[1].endswith("released"))
+
+
+class TofuInitTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        patcher = mock.patch.object(config.env, "tofu_cache_dir", self.cache_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.locked_inits = 0
+        patcher = mock.patch(
+            "launchflow.workflows.commands.tf_commands.plugin_cache_lock",
+            self._plugin_cache_lock,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch(
+            "launchflow.workflows.commands.tf_commands.asyncio.create_subprocess_shell",
+            side_effect=self._fake_tofu_init,
+        )
+        self.init_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @contextlib.asynccontextmanager
+    async def _plugin_cache_lock(self):
+        self.locked_inits += 1
+        yield
+
+    async def _fake_tofu_init(self, command, cwd, **kwargs):
+        lock_file = os.path.join(cwd, ".terraform.lock.hcl")
+        if not os.path.exists(lock_file):
+            with open(lock_file, "w") as f:
+                f.write(f"provider-{self.init_mock.call_count}")
+        proc = mock.MagicMock()
+        proc.wait = mock.AsyncMock(return_value=0)
+        return proc
+
+    async def test_only_first_init_of_module_locks_plugin_cache(self):
+        command = TFApplyCommand(
+            tf_module_dir="resources/gcp_storage_bucket",
+            backend=LocalBackend(path="."),
+            tf_state_prefix="resource/module",
+            tf_vars={},
+            logs_file=None,
+            launchflow_state_url=None,
+        )
+
+        for _ in range(2):
+            with tempfile.TemporaryDirectory() as working_dir:
+                await command._run_init(working_dir, None, workspace=None)
+                # The second init starts from the lock file of the first
+                with open(os.path.join(working_dir, ".terraform.lock.hcl")) as f:
+                    self.assertEqual(f.read(), "provider-1")
+
+        self.assertEqual(self.init_mock.call_count, 2)
+        # Only the first init can populate the plugin cache
+        self.assertEqual(self.locked_inits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
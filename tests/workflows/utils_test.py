@@ -0,0 +1,208 @@
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from launchflow.cache import runtime_manifest, source_index
+from launchflow.workflows.utils import (
+    list_source_files,
+    source_digest,
+    source_image_tag,
+    tar_source,
+    tar_source_in_memory,
+    zip_source,
+)
+
+
+class _WriteOnlyStream(io.RawIOBase):
+    """A non-seekable stream, like an upload, that records what is written."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+
+class TarSourceTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = self.temp_dir.name
+        os.makedirs(os.path.join(self.source_dir, "pkg", "__pycache__"))
+        with open(os.path.join(self.source_dir, "main.py"), "w") as f:
+            f.write("print('hello')")
+        with open(os.path.join(self.source_dir, "pkg", "lib.py"), "w") as f:
+            f.write("x = 1")
+        pyc_path = os.path.join(self.source_dir, "pkg", "__pycache__", "lib.pyc")
+        with open(pyc_path, "w") as f:
+            f.write("ignored")
+        with open(os.path.join(self.source_dir, "secret.txt"), "w") as f:
+            f.write("ignored")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_tar_source_streams_to_non_seekable_file(self):
+        stream = _WriteOnlyStream()
+
+        tar_source(self.source_dir, ["secret.txt"], stream, compresslevel=1)
+
+        with tarfile.open(fileobj=io.BytesIO(b"".join(stream.chunks))) as tar:
+            self.assertEqual(sorted(tar.getnames()), ["main.py", "pkg/lib.py"])
+            self.assertEqual(tar.extractfile("pkg/lib.py").read(), b"x = 1")
+
+    def test_tar_source_is_deterministic(self):
+        first = _WriteOnlyStream()
+        tar_source(self.source_dir, [], first)
+
+        # Touching a file and changing its owner shouldn't change the tarball
+        os.utime(os.path.join(self.source_dir, "main.py"), (0, 12345))
+        second = _WriteOnlyStream()
+        tar_source(self.source_dir, [], second)
+
+        self.assertEqual(b"".join(first.chunks), b"".join(second.chunks))
+        with tarfile.open(fileobj=io.BytesIO(b"".join(first.chunks))) as tar:
+            for member in tar.getmembers():
+                self.assertEqual(member.mtime, 0)
+                self.assertEqual(member.uid, 0)
+            self.assertEqual(tar.getnames(), ["main.py", "pkg/lib.py", "secret.txt"])
+
+    def test_tar_source_adds_extra_files_instead_of_launchflow_dir(self):
+        os.makedirs(os.path.join(self.source_dir, ".launchflow", "manifests"))
+        with open(
+            os.path.join(self.source_dir, ".launchflow", "manifests", "dep-1.json"), "w"
+        ) as f:
+            f.write("stale")
+        staged_path = self.temp_dir.name + "-manifest.json"
+        self.addCleanup(os.remove, staged_path)
+        with open(staged_path, "w") as f:
+            f.write("manifest")
+        stream = _WriteOnlyStream()
+
+        tar_source(
+            self.source_dir,
+            ["secret.txt"],
+            stream,
+            extra_files={".launchflow/manifest.json": staged_path},
+        )
+
+        with tarfile.open(fileobj=io.BytesIO(b"".join(stream.chunks))) as tar:
+            self.assertEqual(
+                tar.getnames(), ["main.py", "pkg/lib.py", ".launchflow/manifest.json"]
+            )
+            self.assertEqual(
+                tar.extractfile(".launchflow/manifest.json").read(), b"manifest"
+            )
+
+    def test_zip_source_adds_extra_files(self):
+        os.makedirs(os.path.join(self.source_dir, ".launchflow"))
+        with open(os.path.join(self.source_dir, ".launchflow", "state"), "w") as f:
+            f.write("local")
+        staged_path = self.temp_dir.name + "-manifest.json"
+        self.addCleanup(os.remove, staged_path)
+        with open(staged_path, "w") as f:
+            f.write("manifest")
+
+        zip_file = zip_source(
+            self.source_dir,
+            ["secret.txt"],
+            file=io.BytesIO(),
+            extra_files={".launchflow/manifest.json": staged_path},
+        )
+
+        with zipfile.ZipFile(zip_file) as zipf:
+            self.assertEqual(
+                sorted(zipf.namelist()),
+                [".launchflow/manifest.json", "main.py", "pkg/lib.py"],
+            )
+
+    def test_source_image_tag(self):
+        tag = source_image_tag("digest", "docker", "Dockerfile")
+
+        self.assertTrue(tag.startswith("src-"))
+        self.assertEqual(tag, source_image_tag("digest", "docker", "Dockerfile"))
+        self.assertNotEqual(tag, source_image_tag("digest", "docker", "Dockerfile.2"))
+
+    def test_tar_source_in_memory_spills_to_disk(self):
+        with open(os.path.join(self.source_dir, "data.bin"), "wb") as f:
+            f.write(os.urandom(64 * 1024))
+
+        source_tarball = tar_source_in_memory(self.source_dir, [], max_size=1024)
+
+        self.assertTrue(source_tarball._rolled)
+        with tarfile.open(fileobj=source_tarball) as tar:
+            self.assertIn("data.bin", tar.getnames())
+
+
+class SourceDigestTest(unittest.TestCase):
+    def setUp(self):
+        self.build_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.build_dir)
+        self.state_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.state_dir)
+        for module, name in [
+            (source_index, "build_source_index_dir"),
+            (runtime_manifest, "build_runtime_manifest_staging_dir"),
+        ]:
+            patcher = mock.patch.object(module, name, return_value=self.state_dir)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        with open(os.path.join(self.build_dir, "main.py"), "w") as f:
+            f.write("print('hello')")
+        self.outputs = {"project:dev:gcp_storage_bucket:bucket": {"bucket_name": "b"}}
+
+    def _deploy_digest(self, deployment_id: str, outputs) -> str:
+        runtime_manifest.stage_runtime_manifest(self.build_dir, deployment_id, outputs)
+        try:
+            relative_paths = list_source_files(self.build_dir, [])
+            manifest_files = runtime_manifest.runtime_manifest_files(
+                self.build_dir, deployment_id
+            )
+            self.assertEqual(
+                list(manifest_files), [runtime_manifest.RUNTIME_MANIFEST_PATH]
+            )
+            return source_digest(self.build_dir, relative_paths, manifest_files)
+        finally:
+            runtime_manifest.remove_staged_runtime_manifest(
+                self.build_dir, deployment_id
+            )
+
+    def test_digest_is_stable_across_deployments(self):
+        # Leftover LaunchFlow state in the build directory isn't part of the digest
+        os.makedirs(os.path.join(self.build_dir, ".launchflow", "manifests"))
+        with open(
+            os.path.join(self.build_dir, ".launchflow", "manifests", "dep-1.json"), "w"
+        ) as f:
+            f.write("dep-1")
+        first = self._deploy_digest("dep-1", self.outputs)
+
+        with open(
+            os.path.join(self.build_dir, ".launchflow", "manifests", "dep-2.json"), "w"
+        ) as f:
+            f.write("dep-2")
+        second = self._deploy_digest("dep-2", self.outputs)
+
+        self.assertEqual(first, second)
+
+    def test_digest_changes_with_manifest_outputs(self):
+        first = self._deploy_digest("dep-1", self.outputs)
+        second = self._deploy_digest(
+            "dep-2", {"project:dev:gcp_storage_bucket:bucket": {"bucket_name": "c"}}
+        )
+
+        self.assertNotEqual(first, second)
+        self.assertNotEqual(
+            first, source_digest(self.build_dir, list_source_files(self.build_dir, []))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()